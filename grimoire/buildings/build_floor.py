@@ -3,8 +3,10 @@ from gdpc.vector_tools import ivec3
 
 from ..buildings.building_plan import BuildingPlan
 from ..core.structures.grid import Grid
+from ..core.generator.profiler import profiled
 
 
+@profiled
 def build_floor(plan: BuildingPlan, editor: Editor, build_ceiling=True):
     grid: Grid = plan.grid
 
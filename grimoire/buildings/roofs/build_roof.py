@@ -8,8 +8,10 @@ from ...core.utils.vectors import y_ivec3
 from ...core.structures.nbt.build_nbt import build_nbt
 from ...core.structures.transformation import Transformation
 from ...core.noise.rng import RNG
+from ...core.generator.profiler import profiled
 
 
+@profiled
 def build_roof(
     plan: BuildingPlan, editor: Editor, roofComponents: list[RoofComponent], seed: int
 ):
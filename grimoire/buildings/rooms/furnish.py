@@ -8,6 +8,7 @@ from ...core.noise.rng import RNG
 from ...palette import Palette
 from .room import Room
 from ...core.structures.grid import Grid
+from ...core.generator.profiler import profiled
 from ...core.structures.legacy_directions import (
     cardinal,
     vector as get_ivec3,
@@ -342,6 +343,7 @@ def build_one_by_one(
         grid.build(editor, upper_room, palette, cell + get_ivec3(up))
 
 
+@profiled
 def furnish(
     cells_to_fill: list[ivec3],
     rng: RNG,
@@ -5,11 +5,13 @@ from gdpc.editor import Editor
 from .wall import Wall, LOWER, UPPER
 from ...core.noise.rng import RNG
 from ...core.structures.grid import Grid
+from ...core.generator.profiler import profiled
 
 NOT_ROOF = "not_roof"
 ONLY_ROOF = "only_roof"
 
 
+@profiled
 def build_walls(plan: BuildingPlan, editor: Editor, walls: list[Wall], rng: RNG):
     for cell in plan.cells:
         for direction in cardinal:
@@ -1,38 +1,140 @@
-from time import time
-from typing import TypeVar
+import sys
+from dataclasses import asdict, dataclass
+from functools import wraps
+from time import perf_counter, process_time
+from typing import Callable, TypeVar
 
 from colored import Fore, Style
 
 from ..logger import Logger
+from ..utils.instrumented import EditorStats, stats_between
+from .profiler import Profiler, profiled
 
 T = TypeVar("T")
 
+REGRESSION_TOLERANCE = 0.2  # a stage this much slower than its baseline is flagged
+REGRESSION_MINIMUM = 0.05  # seconds, stages quicker than this in both runs are noise
+
+
+# peak resident set size of the process in MB, None where the platform can't tell us
+def peak_rss_mb() -> float | None:
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # bytes on macOS, kilobytes elsewhere
+    return max_rss / 2**20 if sys.platform == "darwin" else max_rss / 1024
+
+
+@dataclass
+class StageResult:
+    name: str
+    wall_time: float  # seconds
+    cpu_time: float  # seconds of this process
+    peak_rss_mb: float | None  # of the process by the end of the stage
+    blocks_placed: int | None  # None without counters, see Benchmark.count_with
+    http_requests: int | None
+    # EditorStats over the stage, None without an InstrumentedEditor
+    editor: dict | None
+
 
 class Benchmark:
-    __time_by_name: dict[str, list[float]] = {}
+    # calls and total seconds of every timed class, see Benchmark.timed
+    __totals: dict[str, tuple[int, float]] = {}
+    __running: set[str] = set()  # timed classes with a call under way
+    __stages: list[StageResult] = []
+    __stage: tuple[str, float, float, tuple[int, int] | None, dict | None] | None = None
+    __stage_profiled: bool = False  # whether the stage opened a profiler span
+    # blocks placed and HTTP requests made so far, for the stages to count
+    __counters: Callable[[], tuple[int, int]] | None = None
+
+    """
+    Stages split a script into named parts, each measured from its start_stage
+    until the next one (or end_stage). Each is also a profiler span, so the spans
+    opened during it nest under its name.
+    """
+
+    @staticmethod
+    def start_stage(name: str) -> None:
+        Benchmark.end_stage()
+        counters = Benchmark.__counters() if Benchmark.__counters else None
+        editor = EditorStats.totals() if EditorStats.instrumented() else None
+        Benchmark.__stage = (name, perf_counter(), process_time(), counters, editor)
+        Benchmark.__stage_profiled = Profiler.enabled
+        if Profiler.enabled:
+            Profiler.enter(name)
+
+    @staticmethod
+    def end_stage() -> None:
+        if Benchmark.__stage is None:
+            return
+
+        name, wall_start, cpu_start, counters_start, editor_start = Benchmark.__stage
+        if Benchmark.__stage_profiled:
+            Profiler.exit_span(name)
+        wall_time = perf_counter() - wall_start
+        cpu_time = process_time() - cpu_start
+
+        blocks_placed = http_requests = None
+        if counters_start is not None:
+            blocks, requests = Benchmark.__counters()
+            blocks_placed = blocks - counters_start[0]
+            http_requests = requests - counters_start[1]
+
+        editor = None
+        if editor_start is not None:
+            editor = stats_between(editor_start, EditorStats.totals())
+
+        Benchmark.__stages.append(
+            StageResult(
+                name,
+                wall_time,
+                cpu_time,
+                peak_rss_mb(),
+                blocks_placed,
+                http_requests,
+                editor,
+            )
+        )
+        Benchmark.__stage = None
 
-    # NOTE: Used only by commented-out code below
     @staticmethod
-    def add_time(name: str, amount: float) -> None:
-        if name not in Benchmark.__time_by_name:
-            Benchmark.__time_by_name[name] = []
+    def count_with(counters: Callable[[], tuple[int, int]] | None) -> None:
+        Benchmark.__counters = counters
 
-        Benchmark.__time_by_name[name].append(amount)
+    # the finished stages, forgotten so the next run starts afresh
+    @staticmethod
+    def take_stages() -> list[dict]:
+        Benchmark.end_stage()
+        stages = [asdict(stage) for stage in Benchmark.__stages]
+        Benchmark.__stages = []
+        return stages
+
+    # calls and total seconds of every timed class, counting a class called within
+    # itself once
+    @staticmethod
+    def results() -> dict[str, tuple[int, float]]:
+        return dict(Benchmark.__totals)
 
     @staticmethod
     def log_results(log: Logger) -> None:
         log.display(f"{Fore.dark_gray}----------{Style.reset}")
         log.info("BENCHMARK BY CLASS")
 
-        longest_name = max(len(name) for name in Benchmark.__time_by_name)
+        results = Benchmark.results()
+        if not results:
+            return
+
+        longest_name = max(len(name) for name in results)
 
         log.info(
             f"{{:{longest_name}}} {{:>7}} {{:>7}}".format("Name", "Average", "Total")
         )
 
-        for name, times in Benchmark.__time_by_name.items():
-            total = sum(times)
-            average = total / len(times)
+        for name, (calls, total) in results.items():
+            average = total / calls
 
             log.info(
                 f"{{:{longest_name}}} {{:>7}} {{:>7}}".format(
@@ -45,27 +147,58 @@ class Benchmark:
         Benchmark.log_results(Logger())
 
     """
-    Adds a timer to method, logs time elapsed
+    Times every call of method towards the totals by class, see Benchmark.log_results,
+    and while the profiler is enabled as a span named after the class too
     """
 
     @staticmethod
-    def timed(func: T, log: Logger, class_name: str) -> T:
-        name = f"{Fore.green}{class_name}{Style.reset}"
+    def timed(func: T, class_name: str) -> T:
+        spanned = profiled(class_name)(func)
 
+        @wraps(func)
         def inner(*args, **kwargs):
-            start_time = time()
-
-            log.display(f"{Fore.dark_gray}----------{Style.reset}")
-            log.info(f"{name} started")
-
-            retval = func(*args, **kwargs)
-
-            end_time = time()
-            time_elapsed = end_time - start_time
+            if class_name in Benchmark.__running:
+                return spanned(*args, **kwargs)  # counted by the outer call
+
+            Benchmark.__running.add(class_name)
+            start_time = perf_counter()
+            try:
+                return spanned(*args, **kwargs)
+            finally:
+                Benchmark.__running.discard(class_name)
+                calls, total = Benchmark.__totals.get(class_name, (0, 0.0))
+                Benchmark.__totals[class_name] = (
+                    calls + 1,
+                    total + perf_counter() - start_time,
+                )
 
-            log.info(f'{name} finished after {"%.2f" % time_elapsed} seconds')
-            Benchmark.add_time(class_name, time_elapsed)
+        return inner
 
-            return retval
 
-        return inner
+# "<run> <stage>" for every stage at least tolerance slower than in the baseline,
+# runs being {name: [stage, ...]} as Benchmark.take_stages gives them
+def find_regressions(
+    baseline: dict[str, list[dict]],
+    results: dict[str, list[dict]],
+    tolerance: float = REGRESSION_TOLERANCE,
+) -> list[str]:
+    regressions = []
+
+    for run, stages in results.items():
+        baseline_stages = {stage["name"]: stage for stage in baseline.get(run, [])}
+
+        for stage in stages:
+            before = baseline_stages.get(stage["name"])
+            if before is None:
+                continue
+
+            for measure in ("wall_time", "cpu_time"):
+                if max(before[measure], stage[measure]) < REGRESSION_MINIMUM:
+                    continue
+                if stage[measure] > before[measure] * (1 + tolerance):
+                    regressions.append(
+                        f"{run} {stage['name']}: {measure} "
+                        f"{before[measure]:.2f}s -> {stage[measure]:.2f}s"
+                    )
+
+    return regressions
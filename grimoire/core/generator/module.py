@@ -63,14 +63,7 @@ class Module:
         # When main is bound to the owner, this allows for us to find the owners class
         def __set_name__(self, owner: "Module", name):
             # Owner is actually a type which inherits from Module, but this type annotation will do
-            func = self.func
-
-            def my_func(self, *args, **kwargs):
-                return Benchmark.timed(
-                    func=func, log=self.log, class_name=owner.get_name()
-                )(self, *args, **kwargs)
-
-            setattr(owner, name, my_func)
+            setattr(owner, name, Benchmark.timed(self.func, owner.get_name()))
 
     @staticmethod
     def main(func: T) -> T:
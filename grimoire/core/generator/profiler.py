@@ -0,0 +1,244 @@
+import json
+from functools import wraps
+from pathlib import Path
+from time import perf_counter_ns
+from typing import Callable, TypeVar
+
+from colored import Fore, Style
+
+from ..logger import Logger
+
+T = TypeVar("T")
+
+SPEEDSCOPE_SCHEMA = "https://www.speedscope.app/file-format-schema.json"
+
+
+class _SpanNode:
+    """One path of nested span names, with every call made along it."""
+
+    __slots__ = ("name", "parent", "children", "calls", "total_ns", "child_ns")
+
+    def __init__(self, name: str, parent: "_SpanNode | None") -> None:
+        self.name = name
+        self.parent = parent
+        self.children: dict[str, _SpanNode] = {}
+        self.calls = 0
+        self.total_ns = 0
+        self.child_ns = 0  # time spent in child spans
+
+    def child(self, name: str) -> "_SpanNode":
+        node = self.children.get(name)
+        if node is None:
+            node = self.children[name] = _SpanNode(name, self)
+        return node
+
+
+class Profiler:
+    """
+    Nested spans timed with perf_counter_ns, kept as a call tree of names with their
+    call counts and total and self times. While record_events is set every span is
+    also kept, to be exported as a Chrome trace or speedscope profile.
+    Spans are expected to open and close on one thread.
+    """
+
+    enabled: bool = False  # spans cost time, benchmarks turn them on
+    DISABLED = "Profiling is disabled, set Profiler.enabled to time spans"
+    record_events: bool = False  # every span is kept until reset, only set it to export
+    __root: _SpanNode = _SpanNode("", None)
+    __current: _SpanNode = __root
+    __starts: list[int] = []
+    __events: list[tuple[str, int, int, int]] = []  # name, start, end, depth
+
+    @staticmethod
+    def enter(name: str) -> None:
+        Profiler.__current = Profiler.__current.child(name)
+        Profiler.__starts.append(perf_counter_ns())
+
+    @staticmethod
+    def exit() -> int:
+        end = perf_counter_ns()
+        start = Profiler.__starts.pop()
+        elapsed = end - start
+
+        node = Profiler.__current
+        node.calls += 1
+        node.total_ns += elapsed
+        node.parent.child_ns += elapsed
+        Profiler.__current = node.parent
+
+        if Profiler.record_events:
+            Profiler.__events.append((node.name, start, end, len(Profiler.__starts)))
+
+        return elapsed
+
+    # closes the innermost open span named name and any still open inside it,
+    # returning how long it was open, or None when no such span is open
+    @staticmethod
+    def exit_span(name: str) -> int | None:
+        node = Profiler.__current
+        while node is not Profiler.__root and node.name != name:
+            node = node.parent
+        if node is Profiler.__root:
+            return None
+
+        while Profiler.__current is not node:
+            Profiler.exit()
+        return Profiler.exit()
+
+    @staticmethod
+    def reset() -> None:
+        Profiler.__root = Profiler.__current = _SpanNode("", None)
+        Profiler.__starts = []
+        Profiler.__events = []
+
+    # every path of spans as {path, calls, total, self}, times in seconds
+    @staticmethod
+    def results() -> list[dict]:
+        results = []
+
+        def visit(node: _SpanNode, path: list[str]) -> None:
+            for child in node.children.values():
+                child_path = path + [child.name]
+                results.append(
+                    {
+                        "path": child_path,
+                        "calls": child.calls,
+                        "total": child.total_ns / 1e9,
+                        "self": (child.total_ns - child.child_ns) / 1e9,
+                    }
+                )
+                visit(child, child_path)
+
+        visit(Profiler.__root, [])
+        return results
+
+    @staticmethod
+    def log_results(log: Logger) -> None:
+        log.display(f"{Fore.dark_gray}----------{Style.reset}")
+        log.info("PROFILE BY SPAN")
+
+        results = Profiler.results()
+        if not results:
+            if not Profiler.enabled:
+                log.warning(Profiler.DISABLED)
+            return
+
+        width = max(
+            2 * (len(result["path"]) - 1) + len(result["path"][-1])
+            for result in results
+        )
+        log.info(
+            f"{{:{width}}} {{:>7}} {{:>8}} {{:>8}}".format(
+                "Name", "Calls", "Total", "Self"
+            )
+        )
+        for result in results:
+            name = "  " * (len(result["path"]) - 1) + result["path"][-1]
+            log.info(
+                f"{{:{width}}} {{:>7}} {{:>8}} {{:>8}}".format(
+                    name,
+                    result["calls"],
+                    "%.3f" % result["total"],
+                    "%.3f" % result["self"],
+                )
+            )
+
+    @staticmethod
+    def print_results() -> None:
+        Profiler.log_results(Logger())
+
+    # the recorded spans in Chrome's trace event format, for chrome://tracing or Perfetto
+    @staticmethod
+    def export_chrome_trace(path: Path | str) -> None:
+        events = [
+            {
+                "name": name,
+                "ph": "X",
+                "ts": start / 1000,
+                "dur": (end - start) / 1000,
+                "pid": 1,
+                "tid": 1,
+            }
+            for name, start, end, _ in Profiler.__events
+        ]
+        Path(path).write_text(
+            json.dumps({"traceEvents": events, "displayTimeUnit": "ms"})
+        )
+
+    # the recorded spans as an evented speedscope profile
+    @staticmethod
+    def export_speedscope(path: Path | str) -> None:
+        frames: dict[str, int] = {}
+        # opening and closing events, parents open before and close after their children
+        moments: list[tuple[int, int, int, str, int]] = []
+        for name, start, end, depth in Profiler.__events:
+            frame = frames.setdefault(name, len(frames))
+            moments.append((start, 1, depth, "O", frame))
+            moments.append((end, 0, -depth, "C", frame))
+        moments.sort()
+
+        profile = {
+            "type": "evented",
+            "name": "grimoire",
+            "unit": "nanoseconds",
+            "startValue": moments[0][0] if moments else 0,
+            "endValue": moments[-1][0] if moments else 0,
+            "events": [
+                {"type": kind, "frame": frame, "at": at}
+                for at, _, _, kind, frame in moments
+            ],
+        }
+        Path(path).write_text(
+            json.dumps(
+                {
+                    "$schema": SPEEDSCOPE_SCHEMA,
+                    "shared": {"frames": [{"name": name} for name in frames]},
+                    "profiles": [profile],
+                    "exporter": "grimoire",
+                }
+            )
+        )
+
+
+class span:
+    """Times the block it opens as a span, nested under any span already open."""
+
+    __slots__ = ("name", "entered")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        # whether the span was opened, as enabled may change while it is
+        self.entered = False
+
+    def __enter__(self) -> None:
+        self.entered = Profiler.enabled
+        if self.entered:
+            Profiler.enter(self.name)
+
+    def __exit__(self, *exception) -> None:
+        if self.entered:
+            Profiler.exit()
+            self.entered = False
+
+
+# decorator timing every call of a function as a span, named after the function
+# unless given a name: @profiled or @profiled("name")
+def profiled(function: T | str | None = None) -> T:
+    def decorate(function: Callable, name: str) -> Callable:
+        @wraps(function)
+        def inner(*args, **kwargs):
+            if not Profiler.enabled:
+                return function(*args, **kwargs)
+
+            Profiler.enter(name)
+            try:
+                return function(*args, **kwargs)
+            finally:
+                Profiler.exit()
+
+        return inner
+
+    if callable(function):
+        return decorate(function, function.__qualname__)
+
+    return lambda inner: decorate(inner, function or inner.__qualname__)
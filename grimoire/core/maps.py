@@ -1,5 +1,4 @@
-import itertools
-
+import numpy as np
 from gdpc import WorldSlice
 from gdpc.block import Block
 from gdpc.lookup import ICE_BLOCKS, WATER_PLANTS, WATERS
@@ -8,6 +7,7 @@ from gdpc.vector_tools import ivec2, ivec3
 from ..districts.district import District
 from ..terrain.tree_cutter import TREE_BLOCKS
 from .utils.bounds import is_in_bounds, is_in_bounds2d
+from .utils.sections import WorldSections, get_world_sections
 from .utils.sets.set_operations import find_outline
 
 HIGHWAY = "highway"  # FIXME: Unused variable
@@ -17,42 +17,51 @@ WALL = "Wall"  # FIXME: Unused variable
 CITY_WALL = "city_wall"
 GATE = "gate"
 
+HEIGHT_DTYPE = np.int16  # dtype of height layers computed by the Map
 
-def get_biome_map(world_slice: WorldSlice) -> list[list[str]]:
-    size: ivec2 = world_slice.rect.size
 
-    biome_map: list[list[str]] = [["" for _ in range(size.y)] for _ in range(size.x)]
+def get_biome_map(world_slice: WorldSlice) -> np.ndarray:
+    # biome ids at the surface, see get_world_sections(world_slice).biomes for their names
+    heightmap: np.ndarray = world_slice.heightmaps["MOTION_BLOCKING_NO_LEAVES"]
+    return get_world_sections(world_slice).column_biomes(heightmap)
 
-    for x, z in itertools.product(range(size.x), range(size.y)):
-        y: int = world_slice.heightmaps["MOTION_BLOCKING_NO_LEAVES"][x][z]
-        biome: str = world_slice.getBiome((x, y, z))
 
-        biome_map[x][z] = biome
+def get_block_and_water_map(
+    world_slice: WorldSlice,
+) -> tuple[np.ndarray, np.ndarray]:
+    # block ids of the surface, see get_world_sections(world_slice).blocks for their states
+    sections: WorldSections = get_world_sections(world_slice)
+    heightmap: np.ndarray = world_slice.heightmaps["MOTION_BLOCKING_NO_LEAVES"]
+
+    block_map: np.ndarray = sections.column_blocks(heightmap - 1)
+    water_map: np.ndarray = sections.block_lookup(WATERS | WATER_PLANTS | ICE_BLOCKS)[
+        block_map
+    ]
 
-    return biome_map
+    return block_map, water_map
 
 
-def get_block_and_water_map(
-    world_slice: WorldSlice,
-) -> tuple[list[list[Block]], list[list[bool]]]:
-    size: ivec2 = world_slice.rect.size
+# MOTION_BLOCKING_NO_LEAVES with the logs, stems etc. of trees stripped away
+def get_height_no_tree_map(world_slice: WorldSlice) -> np.ndarray:
+    sections: WorldSections = get_world_sections(world_slice)
+    heightmap: np.ndarray = world_slice.heightmaps["MOTION_BLOCKING_NO_LEAVES"]
+    is_tree: np.ndarray = sections.block_lookup(TREE_BLOCKS)
 
-    block_map: list[list[Block]] = [
-        [None for _ in range(size.y)] for _ in range(size.x)
-    ]
-    water_map: list[list[bool]] = [
-        [False for _ in range(size.y)] for _ in range(size.x)
-    ]
+    height_no_tree = np.zeros(heightmap.shape, dtype=HEIGHT_DTYPE)
 
-    for x, z in itertools.product(range(size.x), range(size.y)):
-        y: int = world_slice.heightmaps["MOTION_BLOCKING_NO_LEAVES"][x][z]
-        block: Block = world_slice.getBlock((x, y - 1, z))
+    for chunk_x, chunk_z, xs, zs, local_xs, local_zs in sections.chunks():
+        heights: np.ndarray = heightmap[xs, zs]
 
-        if block.id in (WATERS | WATER_PLANTS | ICE_BLOCKS):
-            water_map[x][z] = True
-        block_map[x][z] = block
+        if heights.size == 0:
+            continue
 
-    return block_map, water_map
+        # ground is any non-tree block below the surface, we want the highest one
+        _, _, ground = sections.ground_band(
+            chunk_x, chunk_z, local_xs, local_zs, heights, ~is_tree
+        )
+        height_no_tree[xs, zs] = ground
+
+    return height_no_tree
 
 
 def get_build_map(world_slice: WorldSlice, buffer: int = 0) -> list[list[bool]]:
@@ -77,7 +86,7 @@ def get_building_map(world_slice: WorldSlice) -> list[list[str | None]]:
     return [[None for _ in range(size.y)] for _ in range(size.x)]
 
 
-def get_water_map(world_slice: WorldSlice) -> list[list[bool]]:
+def get_water_map(world_slice: WorldSlice) -> np.ndarray:
     # NOTE: It would be more efficient to compare the OCEAN_FLOOR and MOTION_BLOCKING heightmaps
     _, water_map = get_block_and_water_map(world_slice)
     return water_map
@@ -85,55 +94,71 @@ def get_water_map(world_slice: WorldSlice) -> list[list[bool]]:
 
 # class that carries all the different maps required
 class Map:
-    water: list[list[bool]]
+    water: np.ndarray  # bool
     districts: list[list[District | None]]
     buildings: list[list[str | None]]
-    height: list[list[int]]  # height map based on MOTION_BLOCKING_NO_LEAVES
-    height_no_tree: list[
-        list[int]
-    ]  # custom height map based on MOTION_BLOCKING_NO_LEAVES and ignoring wood blocks
-    leaf_height: list[list[int]]  # height map based on MOTION_BLOCKING
+    # height layers as they were when the map was made or last refreshed, see
+    # refresh_heights, height_at and height_at_include_leaf read the current world instead
+    height: np.ndarray  # MOTION_BLOCKING_NO_LEAVES
+    leaf_height: np.ndarray  # MOTION_BLOCKING
+    # custom height map based on MOTION_BLOCKING_NO_LEAVES and ignoring wood blocks
+    height_no_tree: np.ndarray
     world: WorldSlice
-    near_wall: list[list[bool]]  # specifically used for routing roads
-    biome: list[list[str]]
-    block: list[list[Block]]
+    near_wall: np.ndarray  # bool, specifically used for routing roads
+    biome: np.ndarray  # uint16 ids into biome_names
+    biome_names: list[str]
+    block: np.ndarray  # uint16 ids into block_palette
+    block_palette: list[Block]
 
     def __init__(self, world_slice: WorldSlice) -> None:
         size = world_slice.rect.size
         self.world = world_slice
         self.districts = self.empty_map()
         self.buildings = get_building_map(world_slice)
+
+        sections: WorldSections = get_world_sections(world_slice)
         self.biome = get_biome_map(world_slice)
+        self.biome_names = sections.biomes
         self.block, self.water = get_block_and_water_map(world_slice)
-        self._copy_heightmaps(world_slice)
-        self.near_wall = [[False for _ in range(size.y)] for _ in range(size.x)]
+        self.block_palette = sections.blocks
+
+        self.refresh_heights()
 
+        self.near_wall = np.zeros((size.x, size.y), dtype=bool)
+
+    # takes the height layers from the world again, once it was edited or replaced
+    def refresh_heights(self) -> None:
+        heightmaps = self.world.heightmaps
+        self.height = heightmaps["MOTION_BLOCKING_NO_LEAVES"].astype(HEIGHT_DTYPE)
+        self.leaf_height = heightmaps["MOTION_BLOCKING"].astype(HEIGHT_DTYPE)
+        self.height_no_tree = get_height_no_tree_map(self.world)
+
+    # brings the height layers and the districts' points up to date with the world,
+    # so the districts are analyzed against the heights they now stand on
     def correct_district_heights(self, districts: list[District]):
-        # FIXME: Doesn't do anything!
+        self.refresh_heights()
         for district in districts:
-            for point in district.points:
-                point.y = self.world.heightmaps["MOTION_BLOCKING_NO_LEAVES"][point.x][
-                    point.z
-                ]
+            district.set_heights(self.height)
 
     def empty_map(self) -> list[list[None]]:
         size: ivec2 = self.world.rect.size
         return [[None for _ in range(size.y)] for _ in range(size.x)]
 
     def block_at(self, point: ivec2) -> Block:
-        return self.block[point.x][point.y]
+        return self.block_palette[self.block[point.x, point.y]]
 
     def biome_at(self, point: ivec2) -> str:
-        return self.biome[point.x][point.y]
+        return self.biome_names[self.biome[point.x, point.y]]
 
     def water_at(self, point: ivec2) -> bool:
-        return self.water[point.x][point.y]
+        return bool(self.water[point.x, point.y])
 
+    # these read the world as it is now, unlike the height layers copied above
     def height_at(self, point: ivec2) -> int:
-        return self.world.heightmaps["MOTION_BLOCKING_NO_LEAVES"][point.x][point.y]
+        return int(self.world.heightmaps["MOTION_BLOCKING_NO_LEAVES"][point.x, point.y])
 
     def height_at_include_leaf(self, point: ivec2) -> int:
-        return self.world.heightmaps["MOTION_BLOCKING"][point.x][point.y]
+        return int(self.world.heightmaps["MOTION_BLOCKING"][point.x, point.y])
 
     def height_at_not_tree(self, point: ivec2, world_slice: WorldSlice) -> int:
         height: int = self.world.heightmaps["MOTION_BLOCKING_NO_LEAVES"][point.x][
@@ -146,20 +171,6 @@ class Map:
 
         return height
 
-    def _copy_heightmaps(self, world_slice: WorldSlice) -> None:
-        size: ivec2 = self.world.rect.size
-
-        self.height, self.leaf_height, self.height_no_tree = [
-            [[0 for _ in range(size.y)] for _ in range(size.x)] for _ in range(3)
-        ]
-
-        for x, y in itertools.product(range(size.x), range(size.y)):
-            self.height[x][y] = self.height_at(ivec2(x, y))
-            self.leaf_height[x][y] = self.height_at_include_leaf(ivec2(x, y))
-            self.height_no_tree[x][y] = self.height_at_not_tree(
-                ivec2(x, y), world_slice
-            )
-
     def make_3d(self, point: ivec2) -> ivec3:
         return ivec3(point.x, self.height_at(point), point.y)
 
@@ -178,6 +189,7 @@ class Map:
         near_wall_set: set[ivec2] = find_outline(urban_area, 4) | urban_area
 
         size: ivec2 = self.world.rect.size
-        self.near_wall = [
-            [ivec2(x, y) in near_wall_set for y in range(size.y)] for x in range(size.x)
-        ]
+        self.near_wall = np.zeros((size.x, size.y), dtype=bool)
+        for point in near_wall_set:
+            if self.is_in_bounds2d(point):
+                self.near_wall[point.x, point.y] = True
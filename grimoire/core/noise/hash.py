@@ -1,6 +1,9 @@
+import numpy as np
+
 BITNOISE1 = 0x85297A4D
 BITNOISE2 = 0x68E31DA4
 BITNOISE3 = 0x1859C4E9
+UINT64_MASK = 0xFFFFFFFFFFFFFFFF
 
 
 # hashes together a seed and a position
@@ -19,6 +22,29 @@ def hash(seed: int, pos: int) -> int:
     return noise & 0xFFFFFFFF
 
 
+# hash over arrays of seeds and positions, the same values hash gives for each pair
+# arithmetic wraps at 64 bits, which leaves the low 32 bits hash keeps unchanged
+def hash_array(seed: int | np.ndarray, pos: int | np.ndarray) -> np.ndarray:
+    noise = np.asarray(pos, dtype=np.int64).view(np.uint64)
+    seed = (
+        np.uint64(seed & UINT64_MASK)
+        if isinstance(seed, int)
+        else np.asarray(seed, dtype=np.int64).view(np.uint64)
+    )
+    eight = np.uint64(8)
+
+    with np.errstate(over="ignore"):
+        noise = noise * np.uint64(BITNOISE1)
+        noise = noise + seed
+        noise = noise ^ (noise >> eight)
+        noise = noise + np.uint64(BITNOISE2)
+        noise = noise ^ (noise << eight)
+        noise = noise * np.uint64(BITNOISE3)
+        noise = noise ^ (noise >> eight)
+
+    return noise & np.uint64(0xFFFFFFFF)
+
+
 # hashes together a seed with any amount of arguments
 def recursive_hash(seed: int, *args: int):
     for arg in args:
@@ -5,9 +5,11 @@ from ....palette import Palette, palette_swap
 from .convert_nbt import convert_nbt
 from .nbt_asset import NBTAsset
 from ..transformation import Transformation
+from ...generator.profiler import profiled
 
 
 # Constructs an NBTAsset given an editor and transformation
+@profiled
 def build_nbt(
     editor: Editor,
     asset: NBTAsset,
@@ -0,0 +1,156 @@
+from concurrent import futures
+from time import perf_counter, sleep
+from typing import Callable, TypeVar
+
+from gdpc import Block
+from gdpc.vector_tools import Vec3iLike, ivec3
+
+from .gdpc_compat import (
+    PlacementHookEditor,
+    buffered_blocks,
+    buffered_commands,
+    flush_futures,
+    in_world_slice,
+    is_buffered,
+    is_cached,
+)
+
+T = TypeVar("T")
+
+# Throttling for the requests an editor makes, slowing them down only while the
+# server answers slower than it usually does, and back to full speed once it
+# catches up. GDMC-HTTP doesn't tell us how much work it has queued, so how long
+# it takes to answer stands in for it.
+
+SMOOTHING = 0.2  # weight of the newest latency in the moving average
+RECOVERY = 0.01  # weight of the moving average when the usual latency drifts up to it
+SLOWDOWN = 3  # a request this many times slower than usual means the server is behind
+MINIMUM_LATENCY = 0.05  # seconds, requests answered quicker are never behind
+MINIMUM_DELAY = 0.05  # seconds, the first delay and the smallest one kept
+MAXIMUM_DELAY = 5  # seconds
+MAX_PENDING_FLUSHES = 2  # buffer flushes running at once before we wait on them
+
+
+class Backpressure:
+    """
+    Waits before every request while the server is behind, doubling the wait for every
+    slow answer and halving it for every answer at the usual speed.
+    Requests are told apart by name ("GET /blocks"), as each has its own usual latency,
+    and their latency is taken per block they carry, so a big flush isn't mistaken for lag.
+    """
+
+    delay: float  # seconds waited before every request
+    waited: float  # seconds waited so far
+
+    def __init__(self) -> None:
+        self.delay = 0
+        self.waited = 0
+        self.__latency: dict[str, float] = {}  # moving average by request
+        self.__usual: dict[str, float] = {}  # lowest moving average, rising slowly
+
+    def wait(self) -> None:
+        if self.delay:
+            sleep(self.delay)
+            self.waited += self.delay
+
+    # waits until one of pending is done, once too many are, see MAX_PENDING_FLUSHES
+    def wait_for(self, pending: list[futures.Future]) -> None:
+        if len(pending) < MAX_PENDING_FLUSHES:
+            return
+
+        start_time = perf_counter()
+        futures.wait(pending, return_when=futures.FIRST_COMPLETED)
+        self.waited += perf_counter() - start_time
+
+    # blocks is how many blocks the request carried, latency is compared per block
+    def record(self, request: str, seconds: float, blocks: int = 1) -> None:
+        per_block = seconds / max(blocks, 1)
+        latency = self.__latency.get(request, per_block)
+        latency += SMOOTHING * (per_block - latency)
+        self.__latency[request] = latency
+
+        # the usual latency follows drops at once and rises back slowly, so one
+        # unusually quick request doesn't make every later one look slow
+        usual = self.__usual.get(request, latency)
+        usual = latency if latency < usual else usual + RECOVERY * (latency - usual)
+        self.__usual[request] = usual
+
+        if seconds > MINIMUM_LATENCY and latency > usual * SLOWDOWN:
+            self.delay = min(max(self.delay * 2, MINIMUM_DELAY), MAXIMUM_DELAY)
+        elif self.delay:
+            self.delay = self.delay / 2 if self.delay / 2 >= MINIMUM_DELAY else 0
+
+    def behind(self) -> bool:
+        return self.delay > 0
+
+    # makes a request once the server has had its wait, timing how long it took
+    def request(
+        self, request: str, function: Callable[..., T], *args, blocks: int = 1
+    ) -> T:
+        self.wait()
+
+        start_time = perf_counter()
+        result = function(*args)
+        self.record(request, perf_counter() - start_time, blocks)
+
+        return result
+
+
+class ThrottledEditor(PlacementHookEditor):
+    """
+    An Editor whose requests go through its backpressure, reads that have to ask the
+    server and buffer flushes alike. Setting backpressure to None sends them unthrottled.
+    """
+
+    backpressure: Backpressure | None
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.backpressure = Backpressure()
+
+    def getBlockGlobal(self, position: Vec3iLike) -> Block:
+        _position = ivec3(*position)
+        if (
+            is_cached(self, _position)
+            or is_buffered(self, _position)
+            or in_world_slice(self, _position)
+        ):
+            return super().getBlockGlobal(_position)
+        return self._request("GET /blocks", super().getBlockGlobal, _position)
+
+    def getBiomeGlobal(self, position: Vec3iLike) -> str:
+        if in_world_slice(self, ivec3(*position)):
+            return super().getBiomeGlobal(position)
+        return self._request("GET /biomes", super().getBiomeGlobal, position)
+
+    def flushBuffer(self) -> None:
+        blocks = len(buffered_blocks(self)) + len(buffered_commands(self))
+        if not blocks:
+            return
+
+        if self.backpressure is None:
+            super().flushBuffer()
+        elif not self.multithreading:
+            self.backpressure.request("PUT /blocks", super().flushBuffer, blocks=blocks)
+        else:
+            # the flushes still running are as much of the server's queue as we can see
+            self.backpressure.wait_for(
+                [future for future in flush_futures(self) if not future.done()]
+            )
+            self.backpressure.wait()
+
+            # each flush is timed from when it's handed to a worker until it's
+            # answered, recorded from that worker once done
+            backpressure = self.backpressure
+            start_time = perf_counter()
+            super().flushBuffer()
+            flush_futures(self)[-1].add_done_callback(
+                lambda _: backpressure.record(
+                    "PUT /blocks", perf_counter() - start_time, blocks
+                )
+            )
+
+    def _request(self, request: str, function: Callable[..., T], *args) -> T:
+        if self.backpressure is None:
+            return function(*args)
+        return self.backpressure.request(request, function, *args)
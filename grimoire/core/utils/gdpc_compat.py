@@ -0,0 +1,114 @@
+from concurrent import futures
+from typing import Iterable, Sequence
+
+import gdpc
+import numpy as np
+from gdpc import Block, Editor, WorldSlice
+from gdpc.vector_tools import Rect, ivec3
+from nbt import nbt
+
+# gdpc's Editor has no public way to tell where a read will be answered from, to see
+# or drop what it has cached and buffered, or to hook every block it places, nor can
+# a WorldSlice be made from anything but the server's chunks. What we need of their
+# private state is reached into here and nowhere else, and was read off GDPC_VERSION,
+# which the Pipfile pins. Other versions may lay it out differently.
+
+GDPC_VERSION = "7.1.0"
+
+if gdpc.__version__ != GDPC_VERSION:
+    raise ImportError(
+        f"grimoire reads gdpc {GDPC_VERSION}'s private Editor and WorldSlice state, "
+        f"but gdpc {gdpc.__version__} is installed"
+    )
+
+
+# whether the editor would read the position from its block cache
+def is_cached(editor: Editor, position: ivec3) -> bool:
+    return editor.caching and position in editor._cache
+
+
+# drops positions from the editor's block cache, for blocks changed behind its back
+def forget_cached(editor: Editor, positions: Iterable[ivec3]) -> None:
+    if not editor.caching:
+        return
+    for position in positions:
+        editor._cache.pop(position, None)
+
+
+# whether the editor would read the position from its buffer of unsent blocks
+def is_buffered(editor: Editor, position: ivec3) -> bool:
+    return editor.buffering and position in editor._buffer
+
+
+# the blocks and commands the next flush will send, do not change them
+def buffered_blocks(editor: Editor) -> dict[ivec3, Block]:
+    return editor._buffer
+
+
+def buffered_commands(editor: Editor) -> list[str]:
+    return editor._commandBuffer
+
+
+# the flushes handed to worker threads, the last one made last
+def flush_futures(editor: Editor) -> list[futures.Future]:
+    return editor._bufferFlushFutures
+
+
+# whether the editor would read the position from its loaded world slice, that is
+# the slice covers it and nothing was placed there since it was loaded
+def in_world_slice(editor: Editor, position: ivec3) -> bool:
+    world_slice = editor._worldSlice
+    return (
+        world_slice is not None
+        and world_slice.box.contains(position)
+        and not editor._worldSliceDecay[tuple(position - world_slice.box.offset)]
+    )
+
+
+# the block entities of a world slice loaded from the server, by global position
+def block_entity_tags(world_slice: WorldSlice) -> dict[ivec3, nbt.TAG_Compound]:
+    return world_slice._blockEntities
+
+
+# sets up what WorldSlice's own methods read, for a subclass that doesn't load chunks,
+# as WorldSlice.__init__ would from the server's. There is no NBT behind it
+def init_world_slice(
+    world_slice: WorldSlice,
+    rect: Rect,
+    y_begin: int,
+    y_size: int,
+    heightmaps: dict[str, np.ndarray],
+) -> None:
+    world_slice._rect = rect
+    world_slice._chunkRect = Rect(
+        rect.offset >> 4, ((rect.last) >> 4) - (rect.offset >> 4) + 1
+    )
+    world_slice._nbt = None
+    world_slice._heightmaps = heightmaps
+    world_slice._sections = {}
+    world_slice._blockEntities = {}
+    world_slice._yBegin = y_begin
+    world_slice._ySize = y_size
+
+
+class PlacementHookEditor(Editor):
+    """
+    An Editor calling place_single_block for every single block it places, whether
+    through placeBlock or anything else, for subclasses to override.
+    """
+
+    def place_single_block(
+        self,
+        position: ivec3,
+        block: Block | Sequence[Block],
+        replace: str | Iterable[str] | None = None,
+    ) -> bool:
+        return super()._placeSingleBlockGlobal(position, block, replace)
+
+    def _placeSingleBlockGlobal(
+        self,
+        position: ivec3,
+        block: Block | Sequence[Block],
+        replace: str | Iterable[str] | None = None,
+    ) -> bool:
+        return self.place_single_block(position, block, replace)
@@ -0,0 +1,369 @@
+import json
+import sys
+from bisect import bisect_left
+from collections import Counter
+from threading import Lock
+from time import perf_counter
+from typing import Callable, Iterable, Sequence, TypeVar
+
+from colored import Fore, Style
+from gdpc import Block, Box, WorldSlice
+from gdpc.vector_tools import Rect, Vec3iLike, ivec3
+
+from ..generator.profiler import Profiler
+from ..logger import Logger
+from .gdpc_compat import (
+    buffered_blocks,
+    buffered_commands,
+    flush_futures,
+    in_world_slice,
+    is_buffered,
+    is_cached,
+)
+from .overlay import OverlayEditor
+
+T = TypeVar("T")
+
+# Counts what the generator asks of its Editor and what that costs in HTTP traffic,
+# to tell which stages and modules are behind the requests we wait on.
+
+LATENCY_BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+# frames of these modules are skipped when looking for who made a call
+PASSTHROUGH_MODULES = (
+    "gdpc.",
+    __name__,
+    "grimoire.core.utils.overlay",
+    "grimoire.core.utils.gdpc_compat",
+    "grimoire.core.generator.profiler",
+)
+
+READ_SOURCES = ("overlay", "cache", "buffer", "world slice", "http")
+UNATTRIBUTED = "?"  # the module of reads and writes made while the profiler is off
+
+
+# the module of the first frame up the stack that isn't the editor's own
+def calling_module() -> str:
+    frame = sys._getframe(2)
+    while frame is not None:
+        module = frame.f_globals.get("__name__", "?")
+        if not module.startswith(PASSTHROUGH_MODULES):
+            return module
+        frame = frame.f_back
+    return "?"
+
+
+# which bucket a latency falls in, the last one being anything slower
+def latency_bucket(milliseconds: float) -> str:
+    index = bisect_left(LATENCY_BUCKETS_MS, milliseconds)
+    if index == len(LATENCY_BUCKETS_MS):
+        return f">{LATENCY_BUCKETS_MS[-1]}ms"
+    return f"<={LATENCY_BUCKETS_MS[index]}ms"
+
+
+# bytes of the body placing blocks sends, encoded as gdpc 7.1.0's interface.placeBlocks does
+def placement_bytes(blocks: Iterable[tuple[ivec3, Block]]) -> int:
+    entries = (
+        "{"
+        + f'"x":{position[0]},"y":{position[1]},"z":{position[2]},"id":"{block.id}"'
+        + (
+            f',"state":{json.dumps(block.states, separators=(",", ":"))}'
+            if block.states
+            else ""
+        )
+        + (f',"data":{repr(block.data)}' if block.data is not None else "")
+        + "}"
+        for position, block in blocks
+    )
+    return len(("[" + ",".join(entries) + "]").encode())
+
+
+# bytes of the body running commands sends
+def command_bytes(commands: Iterable[str]) -> int:
+    return len("\n".join(commands).encode())
+
+
+# the fraction of reads answered without asking the server
+def hit_rate(read_sources: dict[str, int]) -> float | None:
+    total = sum(read_sources.values())
+    return 1 - read_sources.get("http", 0) / total if total else None
+
+
+# what happened between two EditorStats.totals()
+def stats_between(before: dict, after: dict) -> dict:
+    stats = {}
+    for key, value in after.items():
+        if isinstance(value, dict):
+            difference = {
+                name: count - before[key].get(name, 0) for name, count in value.items()
+            }
+            stats[key] = {name: count for name, count in difference.items() if count}
+        elif key != "cache_hit_rate":
+            stats[key] = value - before[key]
+
+    stats["read_sources"] = {
+        source: stats["read_sources"].get(source, 0) for source in READ_SOURCES
+    }
+    stats["cache_hit_rate"] = hit_rate(stats["read_sources"])
+    return stats
+
+
+class EditorStats:
+    """
+    What every InstrumentedEditor did since the last reset(), and the HTTP requests
+    it made for it. Reads are counted by where they were answered from, see
+    READ_SOURCES, and by the module calling only while the Profiler is enabled.
+    """
+
+    reads: Counter[str] = Counter()  # by calling module
+    writes: Counter[str] = Counter()  # by calling module
+    read_sources: Counter[str] = Counter()
+    flushes: int = 0
+    blocks_flushed: int = 0
+    requests: Counter[str] = Counter()  # by "METHOD /path"
+    request_time: float = 0  # seconds
+    bytes_sent: int = 0  # in the bodies of the requests
+    latencies: Counter[str] = Counter()  # by latency_bucket
+    # seconds editors held back their requests, see Backpressure
+    throttle_time: float = 0
+    __lock = Lock()  # flushes may run on the editor's worker threads
+    __instrumented = False
+
+    @staticmethod
+    def instrument() -> None:
+        EditorStats.__instrumented = True
+
+    @staticmethod
+    def add_request(request: str, seconds: float, sent: int = 0) -> None:
+        with EditorStats.__lock:
+            EditorStats.requests[request] += 1
+            EditorStats.request_time += seconds
+            EditorStats.bytes_sent += sent
+            EditorStats.latencies[latency_bucket(seconds * 1000)] += 1
+
+    @staticmethod
+    def add_flush(blocks: int) -> None:
+        with EditorStats.__lock:
+            EditorStats.flushes += 1
+            EditorStats.blocks_flushed += blocks
+
+    @staticmethod
+    def add_throttle(seconds: float) -> None:
+        with EditorStats.__lock:
+            EditorStats.throttle_time += seconds
+
+    @staticmethod
+    def instrumented() -> bool:
+        return EditorStats.__instrumented
+
+    # the counts so far as a json-able dict
+    @staticmethod
+    def totals() -> dict:
+        with EditorStats.__lock:
+            read_sources = {
+                source: EditorStats.read_sources[source] for source in READ_SOURCES
+            }
+            return {
+                "reads": EditorStats.reads.total(),
+                "writes": EditorStats.writes.total(),
+                "reads_by_module": dict(EditorStats.reads.most_common()),
+                "writes_by_module": dict(EditorStats.writes.most_common()),
+                "read_sources": read_sources,
+                "cache_hit_rate": hit_rate(read_sources),
+                "flushes": EditorStats.flushes,
+                "blocks_flushed": EditorStats.blocks_flushed,
+                "requests": dict(EditorStats.requests.most_common()),
+                "request_time": EditorStats.request_time,
+                "bytes_sent": EditorStats.bytes_sent,
+                "latencies": {
+                    bucket: EditorStats.latencies[bucket]
+                    for bucket in map(latency_bucket, LATENCY_BUCKETS_MS + (1e9,))
+                    if EditorStats.latencies[bucket]
+                },
+                "throttle_time": EditorStats.throttle_time,
+            }
+
+    @staticmethod
+    def reset() -> None:
+        with EditorStats.__lock:
+            EditorStats.reads = Counter()
+            EditorStats.writes = Counter()
+            EditorStats.read_sources = Counter()
+            EditorStats.flushes = EditorStats.blocks_flushed = 0
+            EditorStats.requests = Counter()
+            EditorStats.request_time = 0
+            EditorStats.bytes_sent = 0
+            EditorStats.latencies = Counter()
+            EditorStats.throttle_time = 0
+
+    @staticmethod
+    def log_results(log: Logger, stats: dict | None = None) -> None:
+        stats = stats or EditorStats.totals()
+
+        log.display(f"{Fore.dark_gray}----------{Style.reset}")
+        log.info("EDITOR STATS")
+
+        cache_hit_rate = stats["cache_hit_rate"]
+        log.info(
+            f"{stats['reads']} reads, {stats['writes']} writes, cache hit rate "
+            + ("-" if cache_hit_rate is None else "%.1f%%" % (cache_hit_rate * 100))
+        )
+        log.info(
+            "Reads from "
+            + ", ".join(f"{source} {n}" for source, n in stats["read_sources"].items())
+        )
+        log.info(
+            f"{stats['flushes']} flushes of {stats['blocks_flushed']} blocks, "
+            f"{sum(stats['requests'].values())} requests taking "
+            f"{'%.2f' % stats['request_time']}s and sending "
+            f"{'%.1f' % (stats['bytes_sent'] / 2**20)}MB, "
+            f"throttled for {'%.2f' % stats['throttle_time']}s"
+        )
+
+        for title, counts in (
+            ("Reads by module", stats["reads_by_module"]),
+            ("Writes by module", stats["writes_by_module"]),
+            ("Requests", stats["requests"]),
+            ("Latencies", stats["latencies"]),
+        ):
+            if not counts:
+                continue
+
+            log.info(title)
+            longest_name = max(len(name) for name in counts)
+            for name, count in counts.items():
+                log.info(f"  {{:{longest_name}}} {{:>9}}".format(name, count))
+
+    @staticmethod
+    def print_results() -> None:
+        EditorStats.log_results(Logger())
+
+
+class InstrumentedEditor(OverlayEditor):
+    """
+    An OverlayEditor counting its reads, writes, flushes and requests into EditorStats,
+    along with the time its backpressure held them back.
+    Requests are timed here as the editor makes them, not inside gdpc.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        EditorStats.instrument()
+        super().__init__(*args, **kwargs)
+
+    def getBuildArea(self) -> Box:
+        return self.__timed("GET /buildarea", super().getBuildArea)
+
+    def loadWorldSlice(self, rect: Rect | None = None, *args, **kwargs) -> WorldSlice:
+        if rect is None:
+            rect = self.getBuildArea().toRect()
+        return self.__timed(
+            "GET /chunks", super().loadWorldSlice, rect, *args, **kwargs
+        )
+
+    def getBlockGlobal(self, position: Vec3iLike) -> Block:
+        _position = ivec3(*position)
+
+        # where the editor will find it, in the order it looks
+        if self.overlay is not None and self.overlay.covers(_position):
+            source = "overlay"
+        elif is_cached(self, _position):
+            source = "cache"
+        elif is_buffered(self, _position):
+            source = "buffer"
+        elif in_world_slice(self, _position):
+            source = "world slice"
+        else:
+            source = "http"
+
+        EditorStats.reads[calling_module() if Profiler.enabled else UNATTRIBUTED] += 1
+        EditorStats.read_sources[source] += 1
+
+        if source == "http":
+            return self.__timed("GET /blocks", super().getBlockGlobal, _position)
+        return super().getBlockGlobal(_position)
+
+    def getBiomeGlobal(self, position: Vec3iLike) -> str:
+        _position = ivec3(*position)
+        if (
+            self.overlay is not None and self.overlay.covers(_position)
+        ) or in_world_slice(self, _position):
+            return super().getBiomeGlobal(position)
+        return self.__timed("GET /biomes", super().getBiomeGlobal, position)
+
+    def place_single_block(
+        self,
+        position: ivec3,
+        block: Block | Sequence[Block],
+        replace: str | Iterable[str] | None = None,
+    ) -> bool:
+        EditorStats.writes[calling_module() if Profiler.enabled else UNATTRIBUTED] += 1
+        return super().place_single_block(position, block, replace)
+
+    def runCommandGlobal(self, command: str, *args, syncWithBuffer=False, **kwargs):
+        if self.buffering and syncWithBuffer:
+            return super().runCommandGlobal(
+                command, *args, syncWithBuffer=syncWithBuffer, **kwargs
+            )
+        return self.__timed(
+            "POST /command",
+            super().runCommandGlobal,
+            command,
+            *args,
+            sent=command_bytes([command]),
+            **kwargs,
+        )
+
+    def flushBuffer(self) -> None:
+        blocks, commands = buffered_blocks(self), buffered_commands(self)
+        if not blocks and not commands:
+            return
+
+        # a flush sends the blocks and then the commands buffered with them
+        requests: list[tuple[str, int]] = []
+        if blocks:
+            EditorStats.add_flush(len(blocks))
+            requests.append(("PUT /blocks", placement_bytes(blocks.items())))
+        if commands:
+            requests.append(("POST /command", command_bytes(commands)))
+
+        waited = self.__waited()
+        start_time = perf_counter()
+        self.__throttled(super().flushBuffer)
+        # how long it was held back isn't part of the requests
+        start_time += self.__waited() - waited
+
+        # the requests share the flush's time, multithreaded ones once answered
+        def add_requests(*_) -> None:
+            elapsed = (perf_counter() - start_time) / len(requests)
+            for request, sent in requests:
+                EditorStats.add_request(request, elapsed, sent)
+
+        if not self.multithreading:
+            add_requests()
+        else:
+            flush_futures(self)[-1].add_done_callback(add_requests)
+
+    # calls function as a request sending sent bytes, timing it apart from how long
+    # it was held back
+    def __timed(
+        self, request: str, function: Callable[..., T], *args, sent: int = 0, **kwargs
+    ) -> T:
+        waited = self.__waited()
+        start_time = perf_counter()
+        result = self.__throttled(function, *args, **kwargs)
+        elapsed = perf_counter() - start_time - (self.__waited() - waited)
+
+        EditorStats.add_request(request, elapsed, sent)
+        return result
+
+    # calls function, counting how long the backpressure held it back
+    def __throttled(self, function: Callable[..., T], *args, **kwargs) -> T:
+        waited = self.__waited()
+        result = function(*args, **kwargs)
+        if self.__waited() > waited:
+            EditorStats.add_throttle(self.__waited() - waited)
+
+        return result
+
+    # seconds the backpressure has held requests back so far
+    def __waited(self) -> float:
+        return 0 if self.backpressure is None else self.backpressure.waited
@@ -0,0 +1,509 @@
+import ast
+import json
+import sys
+from collections import Counter
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from io import BytesIO
+from math import ceil, log2
+from threading import Thread
+from typing import Any, Iterator
+from urllib.parse import parse_qs, urlsplit
+
+import numpy as np
+from gdpc import Block, Box, WorldSlice
+from gdpc.vector_tools import Rect, ivec2, ivec3
+from nbt import nbt
+
+from .overlay import WorldOverlay, as_read
+from .sections import (
+    SECTION_SIZE,
+    VOID_AIR,
+    WorldSections,
+    get_world_sections,
+    pack_bit_array,
+)
+from .snapshots import load_snapshot
+from .synthetic import TERRAIN_STYLES, synthetic_world_slice
+
+# A stand-in for Minecraft with the GDMC-HTTP mod, serving a world slice from
+# memory so the generator can run (and be timed) without a server.
+# Point an Editor at it with Editor(host=server.host), or run this module to
+# serve a snapshot or a synthetic world on the default port:
+#   python -m grimoire.core.utils.offline snapshots/<area>/<tag>-<hash>
+#   python -m grimoire.core.utils.offline hilly 9000 512
+
+DEFAULT_PORT = 9000  # gdpc's default host
+MINECRAFT_VERSION = "1.20.2"
+EMPTY_BLOCK = "minecraft:air"  # fills the chunks around the world
+EMPTY_BIOME = "minecraft:plains"
+SYNTHETIC_SIZE = 256  # blocks across a synthetic world served from the command line
+FILL_MODES = {"replace", "destroy", "keep", "hollow", "outline"}  # all fill as replace
+
+
+class OfflineWorld:
+    """
+    The world an OfflineServer serves: a world slice that placed blocks are written into,
+    see WorldOverlay, and a record of every block placed and command run.
+    Blocks outside the slice are recorded but not kept. Block entities are only served
+    through GET /blocks, chunks are sent without them.
+    """
+
+    world_slice: WorldSlice
+    build_area: Box
+    placed: list[tuple[ivec3, Block]]  # every block placed, in order
+    commands: list[str]
+    requests: Counter[str]  # "METHOD /endpoint" -> requests made
+
+    def __init__(self, world_slice: WorldSlice, build_area: Box | None = None) -> None:
+        self.__overlay = WorldOverlay(world_slice)
+        self.world_slice = self.__overlay.world_slice
+        self.__sections: WorldSections = get_world_sections(self.world_slice)
+
+        if build_area is None:
+            rect = self.world_slice.rect
+            build_area = Box(
+                ivec3(rect.offset.x, self.world_slice.yBegin, rect.offset.y),
+                ivec3(rect.size.x, self.world_slice.ySize, rect.size.y),
+            )
+        self.build_area = build_area
+
+        self.placed = []
+        self.commands = []
+        self.requests = Counter()
+        self.__palette_tags: dict[int, nbt.TAG_Compound] = {}
+
+    def get_block(self, position: ivec3) -> Block:
+        if not self.__contains(position):
+            return Block(VOID_AIR)
+        return self.world_slice.getBlockGlobal(position)
+
+    def get_biome(self, position: ivec3) -> str:
+        if not self.__contains(position):
+            return ""
+        return self.world_slice.getBiomeGlobal(position)
+
+    # places a block, true if it changed what was there
+    def place(self, position: ivec3, block: Block) -> bool:
+        self.placed.append((position, block))
+
+        if not self.__contains(position):
+            return True
+
+        placed = as_read(block)
+        before = self.get_block(position)
+        self.__overlay.place(position, block)
+        return (before.id, before.states, before.data) != (
+            placed.id,
+            placed.states,
+            block.data or None,
+        )
+
+    def __contains(self, position: ivec3) -> bool:
+        return (
+            self.world_slice.rect.contains(ivec2(position.x, position.z))
+            and self.world_slice.yBegin <= position.y < self.world_slice.yEnd
+        )
+
+    # the chunks of chunk_rect as GET /chunks sends them, uncompressed NBT
+    def chunk_bytes(self, chunk_rect: Rect) -> bytes:
+        root = nbt.NBTFile()
+        root.name = ""
+        chunks = nbt.TAG_List(name="Chunks", type=nbt.TAG_Compound)
+        for chunk_z in range(chunk_rect.offset.y, chunk_rect.end.y):
+            for chunk_x in range(chunk_rect.offset.x, chunk_rect.end.x):
+                chunks.tags.append(self.__chunk_tag(chunk_x, chunk_z))
+        root.tags.append(chunks)
+
+        buffer = BytesIO()
+        root.write_file(buffer=buffer)
+        return buffer.getvalue()
+
+    def __chunk_tag(self, chunk_x: int, chunk_z: int) -> nbt.TAG_Compound:
+        world_slice = self.world_slice
+        # sections are keyed by chunk within the slice
+        local_x = chunk_x - world_slice.chunkRect.offset.x
+        local_z = chunk_z - world_slice.chunkRect.offset.y
+
+        chunk = nbt.TAG_Compound()
+        chunk.tags.append(nbt.TAG_Int(name="xPos", value=chunk_x))
+        chunk.tags.append(nbt.TAG_Int(name="zPos", value=chunk_z))
+        chunk.tags.append(
+            nbt.TAG_Int(name="yPos", value=world_slice.yBegin // SECTION_SIZE)
+        )
+        chunk.tags.append(nbt.TAG_String(name="Status", value="minecraft:full"))
+        chunk.tags.append(self.__heightmaps_tag(chunk_x, chunk_z, local_x, local_z))
+
+        sections = nbt.TAG_List(name="sections", type=nbt.TAG_Compound)
+        for section_y in range(
+            world_slice.yBegin // SECTION_SIZE, world_slice.yEnd // SECTION_SIZE
+        ):
+            sections.tags.append(self.__section_tag(local_x, section_y, local_z))
+        chunk.tags.append(sections)
+
+        return chunk
+
+    def __section_tag(
+        self, chunk_x: int, section_y: int, chunk_z: int
+    ) -> nbt.TAG_Compound:
+        section = self.__sections.section(chunk_x, section_y, chunk_z)
+
+        block_states = nbt.TAG_Compound(name="block_states")
+        block_palette = nbt.TAG_List(name="palette", type=nbt.TAG_Compound)
+        biomes = nbt.TAG_Compound(name="biomes")
+        biome_palette = nbt.TAG_List(name="palette", type=nbt.TAG_String)
+
+        if section is None:
+            block_palette.tags.append(_block_tag(Block(EMPTY_BLOCK)))
+            biome_palette.tags.append(nbt.TAG_String(value=EMPTY_BIOME))
+            block_states.tags.append(block_palette)
+            biomes.tags.append(biome_palette)
+        else:
+            block_ids, block_data, biome_ids, biome_data = section
+            block_palette.tags.extend(
+                self.__palette_tag(block_id) for block_id in block_ids.tolist()
+            )
+            biome_palette.tags.extend(
+                nbt.TAG_String(value=self.__sections.biomes[biome_id])
+                for biome_id in biome_ids.tolist()
+            )
+            block_states.tags.append(block_palette)
+            biomes.tags.append(biome_palette)
+            if len(block_data) > 0:
+                block_states.tags.append(_long_array_tag("data", block_data))
+            if len(biome_data) > 0:
+                biomes.tags.append(_long_array_tag("data", biome_data))
+
+        tag = nbt.TAG_Compound()
+        tag.tags.append(nbt.TAG_Byte(name="Y", value=section_y))
+        tag.tags.append(block_states)
+        tag.tags.append(biomes)
+        return tag
+
+    def __palette_tag(self, block_id: int) -> nbt.TAG_Compound:
+        if block_id not in self.__palette_tags:
+            self.__palette_tags[block_id] = _block_tag(self.__sections.blocks[block_id])
+        return self.__palette_tags[block_id]
+
+    # heightmaps are found from the chunk's blocks, and taken from the world
+    # slice where it has them
+    def __heightmaps_tag(
+        self, chunk_x: int, chunk_z: int, local_x: int, local_z: int
+    ) -> nbt.TAG_Compound:
+        world_slice = self.world_slice
+        rect = world_slice.rect
+        blocks = self.__sections.chunk_blocks(
+            local_x, local_z, world_slice.yBegin, world_slice.yEnd
+        )
+
+        # columns of the chunk inside the slice, in the chunk and in the slice
+        begin = ivec2(chunk_x, chunk_z) * SECTION_SIZE
+        first = ivec2(max(begin.x, rect.offset.x), max(begin.y, rect.offset.y))
+        last = ivec2(
+            min(begin.x + SECTION_SIZE, rect.end.x),
+            min(begin.y + SECTION_SIZE, rect.end.y),
+        )
+
+        tag = nbt.TAG_Compound(name="Heightmaps")
+        bits = max(1, ceil(log2(world_slice.ySize)))
+        for name, heightmap in world_slice.heightmaps.items():
+            counts = self.__overlay.counts(name)[blocks]
+            heights = np.where(
+                counts.any(axis=1),
+                world_slice.ySize - np.argmax(counts[:, ::-1, :], axis=1),
+                0,
+            )
+
+            if first.x < last.x and first.y < last.y:
+                heights[
+                    first.x - begin.x : last.x - begin.x,
+                    first.y - begin.y : last.y - begin.y,
+                ] = (
+                    heightmap[
+                        first.x - rect.offset.x : last.x - rect.offset.x,
+                        first.y - rect.offset.y : last.y - rect.offset.y,
+                    ]
+                    - world_slice.yBegin
+                )
+
+            # stored z-major
+            tag.tags.append(
+                _long_array_tag(name, pack_bit_array(heights.T.reshape(-1), bits))
+            )
+
+        return tag
+
+
+def _block_tag(block: Block) -> nbt.TAG_Compound:
+    tag = nbt.TAG_Compound()
+    tag.tags.append(nbt.TAG_String(name="Name", value=block.id))
+
+    if block.states:
+        properties = nbt.TAG_Compound(name="Properties")
+        for key, value in block.states.items():
+            properties.tags.append(nbt.TAG_String(name=key, value=value))
+        tag.tags.append(properties)
+
+    return tag
+
+
+def _long_array_tag(name: str, longs) -> nbt.TAG_Long_Array:
+    tag = nbt.TAG_Long_Array(name=name)
+    tag.value = np.asarray(longs, dtype=np.int64).tolist()
+    return tag
+
+
+class OfflineServer(HTTPServer):
+    """
+    Serves an OfflineWorld over the GDMC-HTTP endpoints gdpc uses. Requests are
+    handled one at a time, in the order they arrive.
+    """
+
+    world: OfflineWorld
+
+    def __init__(self, world: OfflineWorld, port: int = 0) -> None:
+        super().__init__(("localhost", port), _OfflineRequestHandler)
+        self.world = world
+
+    @property
+    def host(self) -> str:
+        return f"http://localhost:{self.server_address[1]}"
+
+
+class _OfflineRequestHandler(BaseHTTPRequestHandler):
+    server: OfflineServer
+
+    def do_GET(self) -> None:
+        self.__handle("GET")
+
+    def do_PUT(self) -> None:
+        self.__handle("PUT")
+
+    def do_POST(self) -> None:
+        self.__handle("POST")
+
+    def __handle(self, method: str) -> None:
+        url = urlsplit(self.path)
+        self.parameters = {
+            key: values[0] for key, values in parse_qs(url.query).items()
+        }
+        world = self.server.world
+        world.requests[f"{method} {url.path}"] += 1
+
+        handler = getattr(
+            self, f"_{method.lower()}_{url.path.strip('/')}".replace("/", "_"), None
+        )
+        if handler is None:
+            self.__send(404, f"No endpoint {method} {url.path}".encode(), "text/plain")
+            return
+
+        handler(world)
+
+    def _get_version(self, world: OfflineWorld) -> None:
+        self.__send(200, MINECRAFT_VERSION.encode(), "text/plain")
+
+    def _get_buildarea(self, world: OfflineWorld) -> None:
+        first, last = world.build_area.offset, world.build_area.last
+        self.__send_json(
+            {
+                "xFrom": first.x,
+                "yFrom": first.y,
+                "zFrom": first.z,
+                "xTo": last.x,
+                "yTo": last.y,
+                "zTo": last.z,
+            }
+        )
+
+    def _get_chunks(self, world: OfflineWorld) -> None:
+        chunk_rect = Rect(
+            (self.__int("x"), self.__int("z")),
+            (self.__int("dx", 1), self.__int("dz", 1)),
+        )
+        self.__send(200, world.chunk_bytes(chunk_rect), "application/octet-stream")
+
+    # [x][z] heights over the build area, as GDMC-HTTP's heightmap endpoint
+    def _get_heightmap(self, world: OfflineWorld) -> None:
+        heightmap = world.world_slice.heightmaps[
+            self.parameters.get("type", "WORLD_SURFACE")
+        ]
+        area = world.build_area.toRect()
+        rect = world.world_slice.rect
+        begin = area.offset - rect.offset
+        self.__send_json(
+            heightmap[
+                begin.x : begin.x + area.size.x, begin.y : begin.y + area.size.y
+            ].tolist()
+        )
+
+    def _get_blocks(self, world: OfflineWorld) -> None:
+        include_state = "includeState" in self.parameters
+        include_data = "includeData" in self.parameters
+
+        blocks = []
+        for position in self.__positions():
+            block = world.get_block(position)
+            entry: dict[str, Any] = {
+                "x": position.x,
+                "y": position.y,
+                "z": position.z,
+                "id": block.id,
+            }
+            if include_state:
+                entry["state"] = block.states
+            if include_data:
+                entry["data"] = block.data or "{}"
+            blocks.append(entry)
+
+        self.__send_json(blocks)
+
+    def _get_biomes(self, world: OfflineWorld) -> None:
+        self.__send_json(
+            [
+                {
+                    "x": position.x,
+                    "y": position.y,
+                    "z": position.z,
+                    "id": world.get_biome(position),
+                }
+                for position in self.__positions()
+            ]
+        )
+
+    def _put_blocks(self, world: OfflineWorld) -> None:
+        body = self.__body()
+        try:
+            entries = json.loads(body)
+        except json.JSONDecodeError:
+            # gdpc writes block data with repr, in single quotes
+            entries = ast.literal_eval(body)
+
+        self.__send_json(
+            [
+                {
+                    "status": int(
+                        world.place(
+                            ivec3(entry["x"], entry["y"], entry["z"]),
+                            Block(
+                                entry["id"],
+                                entry.get("state", {}),
+                                entry.get("data"),
+                            ),
+                        )
+                    )
+                }
+                for entry in entries
+            ]
+        )
+
+    def _post_command(self, world: OfflineWorld) -> None:
+        commands = [line for line in self.__body().splitlines() if line.strip()]
+        world.commands.extend(commands)
+
+        # the only commands with an effect here, with absolute coordinates,
+        # corners are inclusive as in GDMC-HTTP and Minecraft
+        for command in commands:
+            name, *arguments = command.split(maxsplit=7)
+            if len(arguments) < 6 or not all(
+                argument.lstrip("-").isdigit() for argument in arguments[:6]
+            ):
+                continue
+
+            x1, y1, z1, x2, y2, z2 = map(int, arguments[:6])
+            box = Box.between(ivec3(x1, y1, z1), ivec3(x2, y2, z2))
+            if name == "setbuildarea" and len(arguments) == 6:
+                world.build_area = box
+            elif name == "fill" and len(arguments) == 7:
+                block, _, mode = arguments[6].rpartition(" ")
+                if mode not in FILL_MODES:
+                    block = arguments[6]
+                block = _parse_block(block)
+                # through begin and end, Box's iterators differ between gdpc versions
+                for x in range(box.begin.x, box.end.x):
+                    for y in range(box.begin.y, box.end.y):
+                        for z in range(box.begin.z, box.end.z):
+                            world.place(ivec3(x, y, z), block)
+
+        self.__send_json([{"status": 1} for _ in commands])
+
+    # every position of the box asked for, sizes can be negative
+    def __positions(self) -> Iterator[ivec3]:
+        x, y, z = self.__int("x"), self.__int("y"), self.__int("z")
+        xs = _span(x, self.__int("dx", 1))
+        ys = _span(y, self.__int("dy", 1))
+        zs = _span(z, self.__int("dz", 1))
+        for position_x in xs:
+            for position_y in ys:
+                for position_z in zs:
+                    yield ivec3(position_x, position_y, position_z)
+
+    def __int(self, name: str, default: int = 0) -> int:
+        return int(self.parameters.get(name, default))
+
+    def __body(self) -> str:
+        length = int(self.headers.get("Content-Length", 0))
+        return self.rfile.read(length).decode("utf-8")
+
+    def __send_json(self, value: Any) -> None:
+        self.__send(200, json.dumps(value).encode(), "application/json")
+
+    def __send(self, status: int, content: bytes, content_type: str) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, format: str, *args) -> None:
+        pass  # one line per request drowns out the generator's own output
+
+
+# a block as commands write it: id[states]{data}
+def _parse_block(text: str) -> Block:
+    block, brace, data = text.partition("{")
+    return Block(block, data=brace + data if brace else None)
+
+
+def _span(begin: int, size: int) -> range:
+    if size < 0:
+        return range(begin + size + 1, begin + 1)
+    return range(begin, begin + size)
+
+
+# an OfflineServer over world, running on a background thread until the block exits
+@contextmanager
+def serve_world(world: OfflineWorld, port: int = 0) -> Iterator[OfflineServer]:
+    server = OfflineServer(world, port)
+    thread = Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join()
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print(
+            "usage: python -m grimoire.core.utils.offline "
+            f"<snapshot | {' | '.join(TERRAIN_STYLES)}> [port] [size]"
+        )
+        sys.exit(1)
+
+    port = int(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_PORT
+    if sys.argv[1] in TERRAIN_STYLES:
+        size = int(sys.argv[3]) if len(sys.argv) > 3 else SYNTHETIC_SIZE
+        world = OfflineWorld(
+            synthetic_world_slice(Rect((0, 0), (size, size)), sys.argv[1])
+        )
+    else:
+        world = OfflineWorld(load_snapshot(sys.argv[1]))
+
+    server = OfflineServer(world, port)
+    print(f"Serving {sys.argv[1]} at {server.host}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print(f"{len(world.placed)} blocks placed")
@@ -0,0 +1,249 @@
+import random
+from typing import Iterable, Sequence
+
+import numpy as np
+from gdpc import Block, Editor, WorldSlice
+from gdpc.lookup import (
+    AIRS,
+    BUTTONS,
+    FLOWERS,
+    LAVAS,
+    LEAVES,
+    PRESSURE_PLATES,
+    RAILS,
+    SAPLINGS,
+    SHORT_GRASSES,
+    SIGNS,
+    SMALL_MUSHROOMS,
+    TALL_GRASSES,
+    TORCHES,
+    VINES,
+    WATERS,
+)
+from gdpc.vector_tools import Rect, Vec3iLike, ivec3
+
+from .backpressure import ThrottledEditor
+from .sections import WorldSections, get_world_sections
+from .snapshots import SnapshotWorldSlice, detach_world_slice
+
+# A write-through overlay over a WorldSlice: every block the generator places
+# is also written into the slice's sections and heightmaps, so later stages
+# see the edited world without flushing and downloading the chunks again.
+
+# blocks that don't block motion, roughly as Minecraft's heightmaps see them
+NOT_MOTION_BLOCKING = (
+    AIRS
+    | SHORT_GRASSES
+    | TALL_GRASSES
+    | FLOWERS
+    | SAPLINGS
+    | SMALL_MUSHROOMS
+    | TORCHES
+    | SIGNS
+    | RAILS
+    | BUTTONS
+    | PRESSURE_PLATES
+    | VINES
+    | {"minecraft:short_grass"}
+)
+FLUIDS = WATERS | LAVAS
+
+
+# whether a block of each name counts towards a heightmap
+def counts_towards(heightmap: str, name: str) -> bool:
+    if heightmap == "WORLD_SURFACE":
+        return name not in AIRS
+
+    blocks_motion = name not in NOT_MOTION_BLOCKING
+    if heightmap == "MOTION_BLOCKING":
+        return blocks_motion
+    if heightmap == "MOTION_BLOCKING_NO_LEAVES":
+        return blocks_motion and name not in LEAVES
+    if heightmap == "OCEAN_FLOOR":
+        return blocks_motion and name not in FLUIDS
+
+    raise ValueError(f"Unknown heightmap {heightmap}")
+
+
+# a placed block as a world slice reads it back: namespaced, with states
+# written into its id ("oak_slab[type=top]") moved into its states
+def as_read(block: Block) -> Block:
+    name, _, state_string = block.id.partition("[")
+    if ":" not in name:
+        name = f"minecraft:{name}"
+
+    states: dict[str, str] = {}
+    for state in state_string.rstrip("]").split(","):
+        if "=" in state:
+            key, value = state.split("=", 1)
+            states[key.strip()] = value.strip()
+    states.update(block.states)
+
+    return Block(name, states)
+
+
+class WorldOverlay:
+    """
+    Keeps a world slice up to date with the blocks placed through an OverlayEditor.
+    The slice is read from its sections, see SnapshotWorldSlice, and only the
+    touched sections and heightmap columns are changed.
+    """
+
+    world_slice: SnapshotWorldSlice
+    placed: int  # blocks written into the slice so far
+
+    def __init__(self, world_slice: WorldSlice) -> None:
+        self.world_slice = detach_world_slice(world_slice)
+        self.placed = 0
+        self.__sections: WorldSections = get_world_sections(self.world_slice)
+        # heightmap -> whether each block id counts towards it, grown as blocks are interned
+        self.__counts: dict[str, np.ndarray] = {
+            name: np.zeros(0, dtype=bool) for name in self.world_slice.heightmaps
+        }
+
+    # whether the global position is within the slice
+    def covers(self, position: Vec3iLike) -> bool:
+        rect: Rect = self.world_slice.rect
+        x, y, z = position
+        return (
+            rect.offset.x <= x < rect.offset.x + rect.size.x
+            and rect.offset.y <= z < rect.offset.y + rect.size.y
+            and self.world_slice.yBegin <= y < self.world_slice.yEnd
+        )
+
+    def place(self, position: ivec3, block: Block) -> None:
+        if not self.covers(position):
+            return
+
+        rect: Rect = self.world_slice.rect
+        x, y, z = position.x - rect.offset.x, position.y, position.z - rect.offset.y
+
+        block_id = self.__sections.intern_block(as_read(block))
+        self.__sections.set_block_id(x, y, z, block_id)
+        if block.data:
+            self.world_slice.block_entities[ivec3(position)] = block.data
+        else:
+            self.world_slice.block_entities.pop(ivec3(position), None)
+
+        for name, heightmap in self.world_slice.heightmaps.items():
+            counts = self.counts(name)
+            if counts[block_id]:
+                heightmap[x, z] = max(heightmap[x, z], y + 1)
+            elif heightmap[x, z] == y + 1:
+                heightmap[x, z] = self.__surface(x, y, z, counts)
+
+        self.placed += 1
+
+    # places block from y_begin up to y_end in the column at global x and z, the
+    # same as placing it block by block but with each heightmap updated once
+    def fill_column(
+        self, x: int, z: int, y_begin: int, y_end: int, block: Block
+    ) -> None:
+        y_begin = max(y_begin, self.world_slice.yBegin)
+        y_end = min(y_end, self.world_slice.yEnd)
+        if y_begin >= y_end or not self.covers((x, y_begin, z)):
+            return
+
+        rect: Rect = self.world_slice.rect
+        x, z = x - rect.offset.x, z - rect.offset.y
+
+        block_id = self.__sections.intern_block(as_read(block))
+        for y in range(y_begin, y_end):
+            self.__sections.set_block_id(x, y, z, block_id)
+            position = ivec3(x + rect.offset.x, y, z + rect.offset.y)
+            if block.data:
+                self.world_slice.block_entities[position] = block.data
+            else:
+                self.world_slice.block_entities.pop(position, None)
+
+        for name, heightmap in self.world_slice.heightmaps.items():
+            counts = self.counts(name)
+            if counts[block_id]:
+                heightmap[x, z] = max(heightmap[x, z], y_end)
+            elif y_begin < heightmap[x, z] <= y_end:
+                heightmap[x, z] = self.__surface(x, y_begin, z, counts)
+
+        self.placed += y_end - y_begin
+
+    # one above the highest block below y that counts
+    def __surface(self, x: int, y: int, z: int, counts: np.ndarray) -> int:
+        for below in range(y - 1, self.world_slice.yBegin - 1, -1):
+            if counts[self.__sections.block_id_at(x, below, z)]:
+                return below + 1
+
+        return self.world_slice.yBegin
+
+    # whether each block id counts towards heightmap
+    def counts(self, heightmap: str) -> np.ndarray:
+        counts = self.__counts[heightmap]
+        names = self.__sections.block_names
+
+        if len(counts) < len(names):
+            counts = np.append(
+                counts,
+                [counts_towards(heightmap, name) for name in names[len(counts) :]],
+            )
+            self.__counts[heightmap] = counts
+
+        return counts
+
+
+class OverlayEditor(ThrottledEditor):
+    """
+    An Editor that also writes what it places into its overlay, when it has one.
+    Blocks and biomes within the overlay are read from it rather than the server,
+    as it already holds every block placed since it was made.
+    The rest of its requests are throttled, see ThrottledEditor.
+    """
+
+    overlay: WorldOverlay | None
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.overlay = None
+
+    def getBlockGlobal(self, position: Vec3iLike) -> Block:
+        if self.overlay is not None and self.overlay.covers(position):
+            return self.overlay.world_slice.getBlockGlobal(position)
+        return super().getBlockGlobal(position)
+
+    def getBiomeGlobal(self, position: Vec3iLike) -> str:
+        if self.overlay is not None and self.overlay.covers(position):
+            return self.overlay.world_slice.getBiomeGlobal(position)
+        return super().getBiomeGlobal(position)
+
+    def place_single_block(
+        self,
+        position: ivec3,
+        block: Block | Sequence[Block],
+        replace: str | Iterable[str] | None = None,
+    ) -> bool:
+        # the replace check and palette choice are made here, as Editor would, so the
+        # overlay knows whether and what was placed
+        if replace is not None:
+            if isinstance(replace, str):
+                replace = [replace]
+            if self.getBlockGlobal(position).id not in replace:
+                return True
+
+        if not isinstance(block, Block):
+            block = random.choice(block)
+
+        success = super().place_single_block(position, block)
+
+        if success and block.id and self.overlay is not None:
+            self.overlay.place(ivec3(*position), block)
+
+        return success
+
+
+# the world slice as the editor's edits left it: read from its overlay when it has
+# one, otherwise flushed and loaded from the server again
+def refresh_world_slice(editor: Editor, build_rect: Rect) -> WorldSlice:
+    overlay: WorldOverlay | None = getattr(editor, "overlay", None)
+    if overlay is not None and overlay.world_slice.rect == build_rect:
+        return overlay.world_slice
+
+    editor.flushBuffer()  # this is needed to reload the world slice properly
+    print("Reloading worldSlice")
+    return editor.loadWorldSlice(build_rect)
@@ -0,0 +1,515 @@
+from math import ceil, log2
+from typing import Iterable, Iterator, Sequence
+from weakref import WeakKeyDictionary
+
+import numpy as np
+from gdpc import Block, WorldSlice
+
+# Vectorized access to the chunk sections of a WorldSlice.
+# Palettes are interned into slice-wide uint16 ids so that whole columns or
+# bands of blocks can be read with array operations instead of getBlock calls.
+
+SECTION_SIZE = 16
+BIOME_CELL_SIZE = 4  # biomes are stored in 4x4x4 cells
+BIOME_CELLS = SECTION_SIZE // BIOME_CELL_SIZE
+
+VOID_AIR = "minecraft:void_air"  # what getBlock returns outside of the slice
+NO_BIOME = ""  # what getBiome returns outside of the slice
+GROUND_SCAN_DEPTH = 32  # how far below the surface ground is looked for at first
+
+
+# unpacks a Minecraft long array where entries never span two longs
+def unpack_bit_array(
+    longs: Iterable[int], bits_per_entry: int, count: int
+) -> np.ndarray:
+    data = np.asarray(longs, dtype=np.int64)
+
+    if data.size == 0:  # a single-entry palette stores no data
+        return np.zeros(count, dtype=np.uint16)
+
+    entries_per_long = 64 // bits_per_entry
+    shifts = np.arange(entries_per_long, dtype=np.uint64) * np.uint64(bits_per_entry)
+    mask = np.uint64((1 << bits_per_entry) - 1)
+
+    values = (data.view(np.uint64)[:, None] >> shifts) & mask
+    return values.reshape(-1)[:count].astype(np.uint16)
+
+
+# packs entries into a Minecraft long array, the inverse of unpack_bit_array
+def pack_bit_array(values: np.ndarray, bits_per_entry: int) -> np.ndarray:
+    if bits_per_entry == 0:
+        return np.zeros(0, dtype=np.int64)
+
+    entries_per_long = 64 // bits_per_entry
+    padded = np.zeros(-(-len(values) // entries_per_long) * entries_per_long, np.uint64)
+    padded[: len(values)] = values
+    shifts = np.arange(entries_per_long, dtype=np.uint64) * np.uint64(bits_per_entry)
+
+    longs = np.bitwise_or.reduce(padded.reshape(-1, entries_per_long) << shifts, axis=1)
+    return longs.view(np.int64)
+
+
+# one entry of a Minecraft long array, see unpack_bit_array
+def read_bit_array(longs: Sequence[int], bits_per_entry: int, index: int) -> int:
+    if bits_per_entry == 0:
+        return 0
+
+    entries_per_long = 64 // bits_per_entry
+    long = int(longs[index // entries_per_long]) & 0xFFFFFFFFFFFFFFFF
+    shift = (index % entries_per_long) * bits_per_entry
+    return (long >> shift) & ((1 << bits_per_entry) - 1)
+
+
+def block_bits_per_entry(palette_size: int) -> int:
+    return max(4, ceil(log2(palette_size))) if palette_size > 1 else 0
+
+
+def biome_bits_per_entry(palette_size: int) -> int:
+    return max(1, ceil(log2(palette_size))) if palette_size > 1 else 0
+
+
+class _Section:
+    block_palette: np.ndarray  # local palette index -> slice-wide block id
+    block_data: list[int]
+    block_bits: int
+    biome_palette: np.ndarray  # local palette index -> slice-wide biome id
+    biome_data: list[int]
+    biome_bits: int
+    edited: np.ndarray | None  # block ids indexed [y][z][x] once a block has been set
+
+    def __init__(
+        self,
+        block_palette: np.ndarray,
+        block_data: list[int],
+        biome_palette: np.ndarray,
+        biome_data: list[int],
+    ) -> None:
+        self.block_palette = block_palette
+        self.block_data = block_data
+        self.block_bits = block_bits_per_entry(len(block_palette))
+        self.biome_palette = biome_palette
+        self.biome_data = biome_data
+        self.biome_bits = biome_bits_per_entry(len(biome_palette))
+        self.edited = None
+
+    # block ids indexed [y][z][x], as stored by Minecraft
+    def blocks(self) -> np.ndarray:
+        if self.edited is not None:
+            return self.edited
+
+        if self.block_bits == 0:
+            return np.full(
+                (SECTION_SIZE, SECTION_SIZE, SECTION_SIZE),
+                self.block_palette[0],
+                dtype=np.uint16,
+            )
+
+        indices = unpack_bit_array(self.block_data, self.block_bits, SECTION_SIZE**3)
+        return self.block_palette[indices].reshape(
+            SECTION_SIZE, SECTION_SIZE, SECTION_SIZE
+        )
+
+    # biome ids indexed [y][z][x] in 4x4x4 cells
+    def biomes(self) -> np.ndarray:
+        if self.biome_bits == 0:
+            return np.full(
+                (BIOME_CELLS, BIOME_CELLS, BIOME_CELLS),
+                self.biome_palette[0],
+                dtype=np.uint16,
+            )
+
+        indices = unpack_bit_array(self.biome_data, self.biome_bits, BIOME_CELLS**3)
+        return self.biome_palette[indices].reshape(
+            BIOME_CELLS, BIOME_CELLS, BIOME_CELLS
+        )
+
+    # block id at an index into blocks(), without unpacking the rest
+    def block_at(self, index: int) -> int:
+        if self.edited is not None:
+            return int(self.edited.reshape(-1)[index])
+
+        return int(
+            self.block_palette[read_bit_array(self.block_data, self.block_bits, index)]
+        )
+
+    # the section is unpacked the first time, and kept unpacked
+    def set_block(self, index: int, block_id: int) -> None:
+        if self.edited is None:
+            self.edited = self.blocks().copy()
+
+        self.edited.reshape(-1)[index] = block_id
+
+    # block palette and long array of the blocks, packed again if they were set
+    def packed_blocks(self) -> tuple[np.ndarray, Sequence[int]]:
+        if self.edited is None:
+            return self.block_palette, self.block_data
+
+        palette, indices = np.unique(self.edited, return_inverse=True)
+        bits = block_bits_per_entry(len(palette))
+        return palette.astype(np.uint16), pack_bit_array(indices.reshape(-1), bits)
+
+    # biome id at an index into biomes(), without unpacking the rest
+    def biome_at(self, index: int) -> int:
+        return int(
+            self.biome_palette[read_bit_array(self.biome_data, self.biome_bits, index)]
+        )
+
+
+class WorldSections:
+    """
+    Interned block and biome data of a WorldSlice, readable as numpy arrays.
+
+    Block ids index into `blocks` (full block states) and `block_names`, biome ids into `biomes`.
+    Id 0 is always void air / no biome, which is what the slice reports for missing sections.
+    """
+
+    world_slice: WorldSlice
+    blocks: list[Block]
+    block_names: list[str]
+    biomes: list[str]
+
+    # sections can be left unread, to be added with add_section instead
+    def __init__(self, world_slice: WorldSlice, read_sections: bool = True) -> None:
+        self.world_slice = world_slice
+        self.blocks = []
+        self.block_names = []
+        self.biomes = []
+        self.__block_ids: dict[str, int] = {}
+        self.__biome_ids: dict[str, int] = {}
+        self.__sections: dict[tuple[int, int, int], _Section] = {}
+
+        self.intern_block(Block(VOID_AIR))
+        self.intern_biome(NO_BIOME)
+
+        if read_sections:
+            self._read_sections()
+
+    @property
+    def offset(self) -> tuple[int, int]:
+        # position of the rect's corner within the first chunk
+        offset = self.world_slice.rect.offset
+        return offset.x % SECTION_SIZE, offset.y % SECTION_SIZE
+
+    def intern_block(self, block: Block) -> int:
+        key = str(block)
+
+        if key not in self.__block_ids:
+            self.__block_ids[key] = len(self.blocks)
+            self.blocks.append(block)
+            self.block_names.append(block.id)
+
+        return self.__block_ids[key]
+
+    def intern_biome(self, biome: str) -> int:
+        if biome not in self.__biome_ids:
+            self.__biome_ids[biome] = len(self.biomes)
+            self.biomes.append(biome)
+
+        return self.__biome_ids[biome]
+
+    # boolean table over block ids, true where the block's id is one of names
+    def block_lookup(self, names: Iterable[str]) -> np.ndarray:
+        names = set(names)
+        return np.fromiter(
+            (name in names for name in self.block_names),
+            dtype=bool,
+            count=len(self.block_names),
+        )
+
+    # palettes are slice-wide ids, data the section's long arrays
+    def add_section(
+        self,
+        chunk_x: int,
+        section_y: int,
+        chunk_z: int,
+        block_palette: np.ndarray,
+        block_data: Sequence[int],
+        biome_palette: np.ndarray,
+        biome_data: Sequence[int],
+    ) -> None:
+        self.__sections[(chunk_x, section_y, chunk_z)] = _Section(
+            block_palette, block_data, biome_palette, biome_data
+        )
+
+    # every section as (chunk_x, section_y, chunk_z), block palette, block data, biome palette, biome data
+    def sections(
+        self,
+    ) -> Iterator[
+        tuple[
+            tuple[int, int, int], np.ndarray, Sequence[int], np.ndarray, Sequence[int]
+        ]
+    ]:
+        for key, section in self.__sections.items():
+            yield (
+                key,
+                *section.packed_blocks(),
+                section.biome_palette,
+                section.biome_data,
+            )
+
+    # block palette, block data, biome palette and biome data of one section, None if it isn't loaded
+    def section(
+        self, chunk_x: int, section_y: int, chunk_z: int
+    ) -> tuple[np.ndarray, Sequence[int], np.ndarray, Sequence[int]] | None:
+        section = self.__sections.get((chunk_x, section_y, chunk_z))
+        if section is None:
+            return None
+
+        return *section.packed_blocks(), section.biome_palette, section.biome_data
+
+    # block id at a rect-local position, void air outside the loaded sections
+    def block_id_at(self, x: int, y: int, z: int) -> int:
+        section, local_x, local_y, local_z = self.__section_at(x, y, z)
+        if section is None:
+            return 0
+
+        return section.block_at(
+            (local_y * SECTION_SIZE + local_z) * SECTION_SIZE + local_x
+        )
+
+    # sets the block id at a rect-local position, missing sections are added as void air
+    def set_block_id(self, x: int, y: int, z: int, block_id: int) -> None:
+        section, local_x, local_y, local_z = self.__section_at(x, y, z)
+        if section is None:
+            offset_x, offset_z = self.offset
+            section = _Section(
+                np.zeros(1, dtype=np.uint16), [], np.zeros(1, dtype=np.uint16), []
+            )
+            self.__sections[
+                (
+                    (x + offset_x) // SECTION_SIZE,
+                    y // SECTION_SIZE,
+                    (z + offset_z) // SECTION_SIZE,
+                )
+            ] = section
+
+        section.set_block(
+            (local_y * SECTION_SIZE + local_z) * SECTION_SIZE + local_x, block_id
+        )
+
+    # biome id at a rect-local position, no biome outside the loaded sections
+    def biome_id_at(self, x: int, y: int, z: int) -> int:
+        section, local_x, local_y, local_z = self.__section_at(x, y, z)
+        if section is None:
+            return 0
+
+        return section.biome_at(
+            ((local_y // BIOME_CELL_SIZE) * BIOME_CELLS + local_z // BIOME_CELL_SIZE)
+            * BIOME_CELLS
+            + local_x // BIOME_CELL_SIZE
+        )
+
+    def __section_at(
+        self, x: int, y: int, z: int
+    ) -> tuple[_Section | None, int, int, int]:
+        offset_x, offset_z = self.offset
+        chunk_x, local_x = divmod(x + offset_x, SECTION_SIZE)
+        section_y, local_y = divmod(y, SECTION_SIZE)
+        chunk_z, local_z = divmod(z + offset_z, SECTION_SIZE)
+
+        section = self.__sections.get((chunk_x, section_y, chunk_z))
+        return section, local_x, local_y, local_z
+
+    def _read_sections(self) -> None:
+        chunk_size = self.world_slice.chunkRect.size
+
+        for chunk_id, chunk_tag in enumerate(self.world_slice.nbt["Chunks"]):
+            chunk_x, chunk_z = chunk_id % chunk_size.x, chunk_id // chunk_size.x
+
+            for section_tag in chunk_tag["sections"]:
+                if (
+                    "block_states" not in section_tag
+                    or len(section_tag["block_states"]) == 0
+                ):
+                    continue
+
+                block_states = section_tag["block_states"]
+                block_palette = np.array(
+                    [
+                        self.intern_block(Block.fromBlockStateTag(tag))
+                        for tag in block_states["palette"]
+                    ],
+                    dtype=np.uint16,
+                )
+                biomes = section_tag["biomes"]
+                biome_palette = np.array(
+                    [self.intern_biome(str(tag.value)) for tag in biomes["palette"]],
+                    dtype=np.uint16,
+                )
+
+                self.__sections[(chunk_x, int(section_tag["Y"].value), chunk_z)] = (
+                    _Section(
+                        block_palette,
+                        block_states["data"] if "data" in block_states else [],
+                        biome_palette,
+                        biomes["data"] if "data" in biomes else [],
+                    )
+                )
+
+    # yields each chunk of the slice with the rect-local columns it covers and
+    # where those columns sit inside the chunk
+    def chunks(self) -> Iterator[tuple[int, int, slice, slice, slice, slice]]:
+        size = self.world_slice.rect.size
+        offset_x, offset_z = self.offset
+
+        for chunk_x in range(self.world_slice.chunkRect.size.x):
+            x_begin = max(0, chunk_x * SECTION_SIZE - offset_x)
+            x_end = min(size.x, (chunk_x + 1) * SECTION_SIZE - offset_x)
+
+            for chunk_z in range(self.world_slice.chunkRect.size.y):
+                z_begin = max(0, chunk_z * SECTION_SIZE - offset_z)
+                z_end = min(size.y, (chunk_z + 1) * SECTION_SIZE - offset_z)
+
+                chunk_begin_x = chunk_x * SECTION_SIZE - offset_x
+                chunk_begin_z = chunk_z * SECTION_SIZE - offset_z
+
+                yield (
+                    chunk_x,
+                    chunk_z,
+                    slice(x_begin, x_end),
+                    slice(z_begin, z_end),
+                    slice(x_begin - chunk_begin_x, x_end - chunk_begin_x),
+                    slice(z_begin - chunk_begin_z, z_end - chunk_begin_z),
+                )
+
+    # block ids of a chunk between y_begin and y_end (exclusive), indexed [x][y][z]
+    def chunk_blocks(
+        self, chunk_x: int, chunk_z: int, y_begin: int, y_end: int
+    ) -> np.ndarray:
+        section_begin = y_begin // SECTION_SIZE
+        section_end = -(-y_end // SECTION_SIZE)
+
+        band = np.zeros(
+            (SECTION_SIZE, (section_end - section_begin) * SECTION_SIZE, SECTION_SIZE),
+            dtype=np.uint16,
+        )
+
+        for section_y in range(section_begin, section_end):
+            section = self.__sections.get((chunk_x, section_y, chunk_z))
+
+            if section is None:
+                continue
+
+            begin = (section_y - section_begin) * SECTION_SIZE
+            band[:, begin : begin + SECTION_SIZE, :] = section.blocks().transpose(
+                2, 0, 1
+            )
+
+        start = y_begin - section_begin * SECTION_SIZE
+        return band[:, start : start + y_end - y_begin, :]
+
+    # the highest ground below heights in the columns of a chunk, ground being whatever
+    # is_ground says it is. Returns the block ids the ground was found in, indexed
+    # [x][y][z], the y they begin at and one above the ground of every column, the
+    # beginning for columns without any
+    def ground_band(
+        self,
+        chunk_x: int,
+        chunk_z: int,
+        local_xs: slice,
+        local_zs: slice,
+        heights: np.ndarray,
+        is_ground: np.ndarray,
+    ) -> tuple[np.ndarray, int, np.ndarray]:
+        y_bottom = self.world_slice.yBegin
+        y_begin = max(y_bottom, int(heights.min()) - GROUND_SCAN_DEPTH)
+
+        while True:
+            y_end = max(int(heights.max()), y_begin + 1)
+            band: np.ndarray = self.chunk_blocks(chunk_x, chunk_z, y_begin, y_end)[
+                local_xs, :, local_zs
+            ]
+
+            y_index = np.arange(y_end - y_begin)
+            below_surface = y_index[None, :, None] < (heights - y_begin)[:, None, :]
+            ground = is_ground[band] & below_surface
+            found_ground = ground.any(axis=1)
+
+            # tall trunks reach below the band, rescan down to the bottom of the world
+            if found_ground.all() or y_begin == y_bottom:
+                break
+            y_begin = y_bottom
+
+        highest_ground = len(y_index) - 1 - np.argmax(ground[:, ::-1, :], axis=1)
+        return (
+            band,
+            y_begin,
+            np.where(found_ground, y_begin + highest_ground + 1, y_begin),
+        )
+
+    # biome ids of a chunk between y_begin and y_end (exclusive), per block, indexed [x][y][z]
+    def chunk_biomes(
+        self, chunk_x: int, chunk_z: int, y_begin: int, y_end: int
+    ) -> np.ndarray:
+        section_begin = y_begin // SECTION_SIZE
+        section_end = -(-y_end // SECTION_SIZE)
+
+        band = np.zeros(
+            (BIOME_CELLS, (section_end - section_begin) * BIOME_CELLS, BIOME_CELLS),
+            dtype=np.uint16,
+        )
+
+        for section_y in range(section_begin, section_end):
+            section = self.__sections.get((chunk_x, section_y, chunk_z))
+
+            if section is None:
+                continue
+
+            begin = (section_y - section_begin) * BIOME_CELLS
+            band[:, begin : begin + BIOME_CELLS, :] = section.biomes().transpose(
+                2, 0, 1
+            )
+
+        band = (
+            band.repeat(BIOME_CELL_SIZE, 0)
+            .repeat(BIOME_CELL_SIZE, 1)
+            .repeat(BIOME_CELL_SIZE, 2)
+        )
+
+        start = y_begin - section_begin * SECTION_SIZE
+        return band[:, start : start + y_end - y_begin, :]
+
+    # block id at height y[x][z] of every column of the slice
+    def column_blocks(self, y: np.ndarray) -> np.ndarray:
+        return self.__gather_columns(y, self.chunk_blocks)
+
+    # biome id at height y[x][z] of every column of the slice
+    def column_biomes(self, y: np.ndarray) -> np.ndarray:
+        return self.__gather_columns(y, self.chunk_biomes)
+
+    def __gather_columns(self, y: np.ndarray, read_chunk) -> np.ndarray:
+        ids = np.zeros(y.shape, dtype=np.uint16)
+
+        for chunk_x, chunk_z, xs, zs, local_xs, local_zs in self.chunks():
+            heights = y[xs, zs]
+
+            if heights.size == 0:
+                continue
+
+            y_begin = int(heights.min())
+            band = read_chunk(chunk_x, chunk_z, y_begin, int(heights.max()) + 1)
+
+            local_x, local_z = np.meshgrid(
+                np.arange(local_xs.start, local_xs.stop),
+                np.arange(local_zs.start, local_zs.stop),
+                indexing="ij",
+            )
+            ids[xs, zs] = band[local_x, heights - y_begin, local_z]
+
+        return ids
+
+
+_sections_by_slice: WeakKeyDictionary[WorldSlice, WorldSections] = WeakKeyDictionary()
+
+
+# interned sections of a world slice, parsed once per slice
+def get_world_sections(world_slice: WorldSlice) -> WorldSections:
+    if world_slice not in _sections_by_slice:
+        _sections_by_slice[world_slice] = WorldSections(world_slice)
+
+    return _sections_by_slice[world_slice]
+
+
+# for slices whose sections are read some other way, such as from a snapshot
+def set_world_sections(world_slice: WorldSlice, sections: WorldSections) -> None:
+    _sections_by_slice[world_slice] = sections
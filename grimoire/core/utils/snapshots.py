@@ -0,0 +1,271 @@
+import json
+from hashlib import sha1
+from pathlib import Path
+
+import numpy as np
+from gdpc import Block, Editor, WorldSlice
+from gdpc.nbt_tools import nbtToSnbt
+from gdpc.vector_tools import Rect, Vec3iLike, ivec3
+from nbt import nbt
+
+from .gdpc_compat import block_entity_tags, init_world_slice
+from .sections import WorldSections, get_world_sections, set_world_sections
+
+# On-disk snapshots of loaded WorldSlices, so a run can start again without a
+# server or re-downloading its chunks.
+# A snapshot is a directory of .npy arrays and a JSON header. Sections are
+# kept in Minecraft's packed long arrays with slice-wide palettes, which is
+# about as small as the chunk data and can be memory mapped as it is.
+
+SNAPSHOT_DIRECTORY = Path("snapshots")
+HEADER = "header.json"
+HASH_LENGTH = 12  # hex digits of the content hash kept in the snapshot's name
+BLOCK_ENTITY_SKIPPED_TAGS = {"x", "y", "z", "id", "keepPacked"}  # as Block does
+
+
+class SnapshotWorldSlice(WorldSlice):
+    """
+    A WorldSlice read from a snapshot instead of the server.
+    Blocks and biomes come from its WorldSections, there are no NBT tags behind it,
+    so `nbt` is None and getBlockStateTag returns None.
+    """
+
+    block_entities: dict[ivec3, str]  # global position -> the block's data
+    content_hash: str
+
+    def __init__(
+        self,
+        rect: Rect,
+        y_begin: int,
+        y_size: int,
+        heightmaps: dict[str, np.ndarray],
+        block_entities: dict[ivec3, str],
+        content_hash: str,
+    ) -> None:
+        init_world_slice(self, rect, y_begin, y_size, heightmaps)
+        self.block_entities = block_entities
+        self.content_hash = content_hash
+
+    def getBlockGlobal(self, position: Vec3iLike) -> Block:
+        x, y, z = position
+        sections: WorldSections = get_world_sections(self)
+        block: Block = sections.blocks[
+            sections.block_id_at(x - self._rect.offset.x, y, z - self._rect.offset.y)
+        ]
+        return Block(
+            block.id, dict(block.states), self.block_entities.get(ivec3(x, y, z))
+        )
+
+    def getBiomeGlobal(self, position: Vec3iLike) -> str:
+        x, y, z = position
+        sections: WorldSections = get_world_sections(self)
+        return sections.biomes[
+            sections.biome_id_at(x - self._rect.offset.x, y, z - self._rect.offset.y)
+        ]
+
+
+# directory snapshots of rect are kept in
+def snapshot_directory(rect: Rect, directory: Path = SNAPSHOT_DIRECTORY) -> Path:
+    offset, size = rect.offset, rect.size
+    return Path(directory) / f"{offset.x}_{offset.y}_{size.x}x{size.y}"
+
+
+# writes a snapshot of world_slice under tag, returns where it is
+# the same content under the same tag is only written once, saving it again
+# makes it the latest
+def save_snapshot(
+    world_slice: WorldSlice, tag: str, directory: Path = SNAPSHOT_DIRECTORY
+) -> Path:
+    sections: WorldSections = get_world_sections(world_slice)
+    heightmap_names = list(world_slice.heightmaps.keys())
+
+    keys: list[tuple[int, int, int]] = []
+    block_palettes: list[np.ndarray] = []
+    block_data: list[np.ndarray] = []
+    biome_palettes: list[np.ndarray] = []
+    biome_data: list[np.ndarray] = []
+    for key, block_palette, blocks, biome_palette, biomes in sections.sections():
+        keys.append(key)
+        block_palettes.append(np.asarray(block_palette, dtype=np.uint16))
+        block_data.append(np.asarray(blocks, dtype=np.int64))
+        biome_palettes.append(np.asarray(biome_palette, dtype=np.uint16))
+        biome_data.append(np.asarray(biomes, dtype=np.int64))
+
+    arrays: dict[str, np.ndarray] = {
+        "heightmaps": np.stack(
+            [world_slice.heightmaps[name] for name in heightmap_names]
+        ).astype(np.int16),
+        "section_keys": np.array(keys, dtype=np.int32).reshape(-1, 3),
+        **_flatten("block_palette", block_palettes, np.uint16),
+        **_flatten("block_data", block_data, np.int64),
+        **_flatten("biome_palette", biome_palettes, np.uint16),
+        **_flatten("biome_data", biome_data, np.int64),
+    }
+
+    header = {
+        "rect": [*world_slice.rect.offset, *world_slice.rect.size],
+        "y_begin": world_slice.yBegin,
+        "y_size": world_slice.ySize,
+        "heightmaps": heightmap_names,
+        "blocks": [[block.id, block.states] for block in sections.blocks],
+        "biomes": sections.biomes,
+        "block_entities": _block_entities(world_slice),
+    }
+
+    content = sha1(json.dumps(header, sort_keys=True).encode())
+    for name in sorted(arrays):
+        content.update(name.encode())
+        content.update(np.ascontiguousarray(arrays[name]).tobytes())
+    content_hash = content.hexdigest()[:HASH_LENGTH]
+
+    path = snapshot_directory(world_slice.rect, directory) / f"{tag}-{content_hash}"
+    if (path / HEADER).exists():
+        (path / HEADER).touch()  # it's the latest again, see find_snapshot
+        return path
+
+    path.mkdir(parents=True, exist_ok=True)
+    for name, array in arrays.items():
+        np.save(path / f"{name}.npy", array)
+    # the header goes last, a snapshot without one was never finished
+    (path / HEADER).write_text(json.dumps(header))
+
+    print(f"Saved world slice snapshot {path}")
+    return path
+
+
+# the latest finished snapshot of rect under tag, None if there isn't one
+def find_snapshot(
+    rect: Rect, tag: str, directory: Path = SNAPSHOT_DIRECTORY
+) -> Path | None:
+    area_directory = snapshot_directory(rect, directory)
+    if not area_directory.is_dir():
+        return None
+
+    snapshots = [
+        path
+        for path in area_directory.glob(f"{tag}-*")
+        if (path / HEADER).exists() and len(path.name) == len(tag) + 1 + HASH_LENGTH
+    ]
+    return max(
+        snapshots, key=lambda path: (path / HEADER).stat().st_mtime, default=None
+    )
+
+
+def load_snapshot(path: Path) -> SnapshotWorldSlice:
+    path = Path(path)
+    header = json.loads((path / HEADER).read_text())
+
+    def load(name: str) -> np.ndarray:
+        return np.load(path / f"{name}.npy", mmap_mode="r")
+
+    offset_x, offset_z, size_x, size_z = header["rect"]
+    heightmaps = load("heightmaps")
+    world_slice = SnapshotWorldSlice(
+        Rect((offset_x, offset_z), (size_x, size_z)),
+        header["y_begin"],
+        header["y_size"],
+        {
+            name: np.array(heightmaps[index], dtype=int)  # writable, like gdpc's
+            for index, name in enumerate(header["heightmaps"])
+        },
+        {ivec3(x, y, z): data for x, y, z, data in header["block_entities"]},
+        path.name.rsplit("-", 1)[-1],
+    )
+
+    # interned in the same order, so the saved ids stay valid
+    sections = WorldSections(world_slice, read_sections=False)
+    for block_id, states in header["blocks"]:
+        sections.intern_block(Block(block_id, states))
+    for biome in header["biomes"]:
+        sections.intern_biome(biome)
+
+    block_palettes = _unflatten("block_palette", load)
+    block_data = _unflatten("block_data", load)
+    biome_palettes = _unflatten("biome_palette", load)
+    biome_data = _unflatten("biome_data", load)
+    for index, (chunk_x, section_y, chunk_z) in enumerate(
+        load("section_keys").tolist()
+    ):
+        sections.add_section(
+            chunk_x,
+            section_y,
+            chunk_z,
+            block_palettes[index],
+            block_data[index],
+            biome_palettes[index],
+            biome_data[index],
+        )
+    set_world_sections(world_slice, sections)
+
+    return world_slice
+
+
+# a SnapshotWorldSlice over the same sections as world_slice, with its own heightmaps,
+# without writing anything to disk
+def detach_world_slice(world_slice: WorldSlice) -> SnapshotWorldSlice:
+    if isinstance(world_slice, SnapshotWorldSlice):
+        return world_slice
+
+    snapshot = SnapshotWorldSlice(
+        world_slice.rect,
+        world_slice.yBegin,
+        world_slice.ySize,
+        {name: heightmap.copy() for name, heightmap in world_slice.heightmaps.items()},
+        {ivec3(x, y, z): data for x, y, z, data in _block_entities(world_slice)},
+        "",
+    )
+    set_world_sections(snapshot, get_world_sections(world_slice))
+    return snapshot
+
+
+# the world slice of rect from its latest snapshot under tag, loading it from the
+# server and saving a snapshot when there is none (or refresh is set)
+def load_world_slice(
+    editor: Editor,
+    rect: Rect,
+    tag: str = "initial",
+    refresh: bool = False,
+    directory: Path = SNAPSHOT_DIRECTORY,
+) -> WorldSlice:
+    path = None if refresh else find_snapshot(rect, tag, directory)
+
+    if path is not None:
+        print(f"Loading world slice snapshot {path}")
+        return load_snapshot(path)
+
+    world_slice = editor.loadWorldSlice(rect)
+    save_snapshot(world_slice, tag, directory)
+    return world_slice
+
+
+# arrays joined into one, with the offsets to split them again
+def _flatten(name: str, arrays: list[np.ndarray], dtype) -> dict[str, np.ndarray]:
+    offsets = np.zeros(len(arrays) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum([len(array) for array in arrays])
+    values = np.concatenate(arrays) if arrays else np.zeros(0, dtype=dtype)
+    return {name: values.astype(dtype), f"{name}_offsets": offsets}
+
+
+def _unflatten(name: str, load) -> list[np.ndarray]:
+    values = load(name)
+    offsets = load(f"{name}_offsets").tolist()
+    return [values[begin:end] for begin, end in zip(offsets[:-1], offsets[1:])]
+
+
+# [x, y, z, snbt] of every block entity, their data as Block.fromBlockStateTag gives it
+def _block_entities(world_slice: WorldSlice) -> list[list]:
+    if isinstance(world_slice, SnapshotWorldSlice):
+        return [
+            [*position, data] for position, data in world_slice.block_entities.items()
+        ]
+
+    entities = []
+    for position, tag in block_entity_tags(world_slice).items():
+        data = nbt.TAG_Compound()
+        data.tags = [
+            entity_tag
+            for entity_tag in tag.tags
+            if entity_tag.name not in BLOCK_ENTITY_SKIPPED_TAGS
+        ]
+        entities.append([*position, nbtToSnbt(data)])
+    return entities
@@ -0,0 +1,387 @@
+from dataclasses import dataclass
+
+import numpy as np
+from gdpc import Block
+from gdpc.vector_tools import Rect, ivec2
+
+from ..noise.hash import hash_array, hash_string
+from .sections import (
+    BIOME_CELL_SIZE,
+    SECTION_SIZE,
+    WorldSections,
+    biome_bits_per_entry,
+    block_bits_per_entry,
+    pack_bit_array,
+    set_world_sections,
+)
+from .snapshots import SnapshotWorldSlice
+
+# Synthetic worlds of any size and character, for benchmarks that shouldn't
+# depend on whatever world the server has loaded.
+# Terrain is built column by column from value noise over the project's hash,
+# so the same seed and style always give the same world, and a larger area
+# contains a smaller one at the same offset.
+
+Y_BEGIN = -64
+Y_SIZE = 384
+SOIL_DEPTH = 3  # blocks of soil between the stone and the top block
+TREE_CHANCE_TOTAL = 1000  # tree_chance is out of this many columns
+TRUNK_HEIGHT = 4  # shortest trunk, up to two blocks taller
+LEAF_RADIUS = 2
+SNOW_LINE = 150
+STEEP_SLOPE = 4  # columns rising more than this next to a neighbour are bare stone
+NOISE_RANGE = 2**32  # hash values are below this
+
+AIR = 0  # indices into BLOCKS
+STONE = 1
+DIRT = 2
+GRASS = 3
+SAND = 4
+SNOW = 5
+WATER = 6
+LOG = 7
+LEAVES = 8
+BLOCKS = (
+    Block("minecraft:air"),
+    Block("minecraft:stone"),
+    Block("minecraft:dirt"),
+    Block("minecraft:grass_block", {"snowy": "false"}),
+    Block("minecraft:sand"),
+    Block("minecraft:snow_block"),
+    Block("minecraft:water", {"level": "0"}),
+    Block("minecraft:oak_log", {"axis": "y"}),
+    Block("minecraft:oak_leaves", {"distance": "1", "persistent": "false"}),
+)
+
+RIVER_BIOME = "minecraft:river"
+BEACH_BIOME = "minecraft:beach"
+PEAK_BIOME = "minecraft:snowy_slopes"
+
+
+@dataclass
+class TerrainStyle:
+    base_height: int  # y the terrain rolls around
+    amplitude: int  # furthest the terrain strays from base_height
+    scale: int  # blocks across the largest hills
+    octaves: int  # each one half the size and height of the one before
+    sea_level: int  # water fills everything below this
+    river_width: float  # 0 for no river, otherwise roughly the width in blocks / 100
+    tree_chance: int  # columns out of TREE_CHANCE_TOTAL a tree grows from
+    biome: str
+
+
+TERRAIN_STYLES: dict[str, TerrainStyle] = {
+    "flat": TerrainStyle(64, 2, 64, 1, Y_BEGIN, 0, 0, "minecraft:plains"),
+    "hilly": TerrainStyle(66, 24, 96, 3, 62, 0, 4, "minecraft:plains"),
+    "river": TerrainStyle(68, 12, 128, 3, 62, 0.08, 6, "minecraft:plains"),
+    "forested": TerrainStyle(68, 10, 96, 3, 62, 0, 60, "minecraft:forest"),
+    "mountainous": TerrainStyle(90, 90, 192, 4, 62, 0, 8, "minecraft:windswept_hills"),
+}
+
+
+@dataclass
+class SyntheticTerrain:
+    """
+    The columns of a synthetic world, [x][z] over chunk_rect's blocks.
+    Block ranges are absolute y, begin inclusive and end exclusive, and empty where begin == end.
+    """
+
+    chunk_rect: Rect
+    ground: np.ndarray  # y of the top block of the ground
+    top_block: np.ndarray  # index into BLOCKS of that top block
+    soil_block: np.ndarray  # index into BLOCKS of the blocks just below it
+    water_end: np.ndarray  # water fills from ground + 1 up to this
+    trunk_end: np.ndarray  # trunks fill from ground + 1 up to this
+    leaves_begin: np.ndarray
+    leaves_end: np.ndarray
+    biome: np.ndarray  # index into biomes
+    biomes: list[str]
+
+    @property
+    def trees(self) -> np.ndarray:
+        return self.trunk_end > self.ground + 1
+
+    @property
+    def water(self) -> np.ndarray:
+        return self.water_end > self.ground + 1
+
+
+# smoothly interpolated noise between hashed lattice points scale blocks apart, in [0, 1)
+def value_noise(seed: int, xs: np.ndarray, zs: np.ndarray, scale: int) -> np.ndarray:
+    cell_x, offset_x = np.divmod(xs, scale)
+    cell_z, offset_z = np.divmod(zs, scale)
+    tx = _smoothstep(offset_x / scale)
+    tz = _smoothstep(offset_z / scale)
+
+    # lattice values are hashed once, then looked up for every block
+    first_x, first_z = int(cell_x.min()), int(cell_z.min())
+    lattice = (
+        hash_array(
+            hash_array(seed, np.arange(first_x, int(cell_x.max()) + 2))[:, None],
+            np.arange(first_z, int(cell_z.max()) + 2)[None, :],
+        )
+        / NOISE_RANGE
+    )
+    cell_x, cell_z = cell_x - first_x, cell_z - first_z
+
+    north = lattice[cell_x, cell_z] * (1 - tx) + lattice[cell_x + 1, cell_z] * tx
+    south = (
+        lattice[cell_x, cell_z + 1] * (1 - tx) + lattice[cell_x + 1, cell_z + 1] * tx
+    )
+    return north * (1 - tz) + south * tz
+
+
+# octaves of value noise, each half the size and weight of the last, in [0, 1)
+def fractal_noise(
+    seed: int, xs: np.ndarray, zs: np.ndarray, scale: int, octaves: int
+) -> np.ndarray:
+    total = np.zeros(np.broadcast(xs, zs).shape)
+    weight, weights = 1.0, 0.0
+    for octave in range(octaves):
+        total += weight * value_noise(
+            hash_array(seed, octave).item(), xs, zs, max(1, scale >> octave)
+        )
+        weights += weight
+        weight /= 2
+    return total / weights
+
+
+def _smoothstep(t: np.ndarray) -> np.ndarray:
+    return t * t * (3 - 2 * t)
+
+
+# the columns of every chunk rect touches
+def synthetic_terrain(
+    rect: Rect, style: str | TerrainStyle = "hilly", seed: int = 0
+) -> SyntheticTerrain:
+    if isinstance(style, str):
+        style = TERRAIN_STYLES[style]
+
+    chunk_rect = Rect(rect.offset >> 4, ((rect.last) >> 4) - (rect.offset >> 4) + 1)
+    begin = chunk_rect.offset * SECTION_SIZE
+    size = chunk_rect.size * SECTION_SIZE
+    xs, zs = np.meshgrid(
+        np.arange(begin.x, begin.x + size.x),
+        np.arange(begin.y, begin.y + size.y),
+        indexing="ij",
+    )
+
+    height = fractal_noise(
+        hash_string(seed, "heights"), xs, zs, style.scale, style.octaves
+    )
+    ground = style.base_height + (height - 0.5) * 2 * style.amplitude
+
+    # rivers run where a second noise crosses its middle, cut down below the sea
+    river = np.zeros(ground.shape)
+    if style.river_width > 0:
+        course = fractal_noise(hash_string(seed, "rivers"), xs, zs, style.scale * 2, 2)
+        river = np.clip(1 - np.abs(course - 0.5) / style.river_width, 0, 1)
+        ground = ground * (1 - river) + (style.sea_level - 3) * river
+
+    ground = np.clip(np.rint(ground), Y_BEGIN + 1, Y_BEGIN + Y_SIZE - 32).astype(int)
+    water_end = np.maximum(ground + 1, style.sea_level)
+    underwater = water_end > ground + 1
+
+    # bare stone on steep slopes, snow on the peaks, sand along the water
+    padded = np.pad(ground, 1, mode="edge")
+    slope = np.max(
+        [
+            np.abs(ground - padded[:-2, 1:-1]),
+            np.abs(ground - padded[2:, 1:-1]),
+            np.abs(ground - padded[1:-1, :-2]),
+            np.abs(ground - padded[1:-1, 2:]),
+        ],
+        axis=0,
+    )
+    shore = ground < style.sea_level + 2
+    top_block = np.select(
+        [shore, ground >= SNOW_LINE, slope > STEEP_SLOPE],
+        [SAND, SNOW, STONE],
+        GRASS,
+    )
+    soil_block = np.select(
+        [shore, (top_block == STONE) | (top_block == SNOW)], [SAND, STONE], DIRT
+    )
+
+    # trees grow from dry grass, their leaves spread over the columns around them
+    tree_hash = hash_array(hash_array(hash_string(seed, "trees"), xs), zs).astype(int)
+    trees = (
+        (tree_hash % TREE_CHANCE_TOTAL < style.tree_chance)
+        & (top_block == GRASS)
+        & ~underwater
+    )
+    trunk_end = np.where(
+        trees, ground + 1 + TRUNK_HEIGHT + (tree_hash >> 16) % 3, ground + 1
+    )
+
+    crown_top = np.where(trees, trunk_end + 1, Y_BEGIN)
+    crown_bottom = np.where(trees, trunk_end - 2, Y_BEGIN + Y_SIZE)
+    leaves_end = np.full(ground.shape, Y_BEGIN)
+    leaves_begin = np.full(ground.shape, Y_BEGIN + Y_SIZE)
+    for dx in range(-LEAF_RADIUS, LEAF_RADIUS + 1):
+        for dz in range(-LEAF_RADIUS, LEAF_RADIUS + 1):
+            if abs(dx) == abs(dz) == LEAF_RADIUS:
+                continue  # rounded corners
+            leaves_end = np.maximum(leaves_end, _shift(crown_top, dx, dz, Y_BEGIN))
+            leaves_begin = np.minimum(
+                leaves_begin, _shift(crown_bottom, dx, dz, Y_BEGIN + Y_SIZE)
+            )
+    # leaves sit on top of the ground, water and trunk
+    leaves_begin = np.maximum(leaves_begin, np.maximum(water_end, trunk_end))
+    bare = leaves_end <= leaves_begin
+    leaves_begin[bare] = leaves_end[bare] = ground[bare] + 1
+
+    biomes = [style.biome, RIVER_BIOME, BEACH_BIOME, PEAK_BIOME]
+    biome = np.select(
+        [river > 0.5, shore & ~underwater, ground >= SNOW_LINE], [1, 2, 3], 0
+    )
+
+    return SyntheticTerrain(
+        chunk_rect,
+        ground,
+        top_block,
+        soil_block,
+        water_end,
+        trunk_end,
+        leaves_begin,
+        leaves_end,
+        biome,
+        biomes,
+    )
+
+
+# array moved dx, dz along its axes, filled where nothing moved in
+def _shift(array: np.ndarray, dx: int, dz: int, fill: int) -> np.ndarray:
+    shifted = np.full(array.shape, fill, dtype=array.dtype)
+    size_x, size_z = array.shape
+    shifted[max(dx, 0) : size_x + min(dx, 0), max(dz, 0) : size_z + min(dz, 0)] = array[
+        max(-dx, 0) : size_x + min(-dx, 0), max(-dz, 0) : size_z + min(-dz, 0)
+    ]
+    return shifted
+
+
+# a world slice of rect built from synthetic terrain, see SnapshotWorldSlice
+def synthetic_world_slice(
+    rect: Rect, style: str | TerrainStyle = "hilly", seed: int = 0
+) -> SnapshotWorldSlice:
+    return terrain_world_slice(synthetic_terrain(rect, style, seed), rect)
+
+
+def terrain_world_slice(terrain: SyntheticTerrain, rect: Rect) -> SnapshotWorldSlice:
+    offset = rect.offset - terrain.chunk_rect.offset * SECTION_SIZE
+    columns = (
+        slice(offset.x, offset.x + rect.size.x),
+        slice(offset.y, offset.y + rect.size.y),
+    )
+
+    ground_end = terrain.ground + 1
+    no_leaves = np.maximum(np.maximum(ground_end, terrain.water_end), terrain.trunk_end)
+    leaves = np.maximum(no_leaves, terrain.leaves_end)
+    heightmaps = {
+        "MOTION_BLOCKING": leaves[columns].copy(),
+        "MOTION_BLOCKING_NO_LEAVES": no_leaves[columns].copy(),
+        "OCEAN_FLOOR": np.maximum(
+            np.maximum(ground_end, terrain.trunk_end), terrain.leaves_end
+        )[columns].copy(),
+        "WORLD_SURFACE": leaves[columns].copy(),
+    }
+
+    world_slice = SnapshotWorldSlice(rect, Y_BEGIN, Y_SIZE, heightmaps, {}, "")
+
+    sections = WorldSections(world_slice, read_sections=False)
+    block_ids = np.array(
+        [sections.intern_block(block) for block in BLOCKS], dtype=np.uint16
+    )
+    biome_ids = np.array(
+        [sections.intern_biome(biome) for biome in terrain.biomes], dtype=np.uint16
+    )
+
+    for chunk_x in range(terrain.chunk_rect.size.x):
+        for chunk_z in range(terrain.chunk_rect.size.y):
+            _add_chunk(terrain, sections, chunk_x, chunk_z, block_ids, biome_ids)
+
+    set_world_sections(world_slice, sections)
+    return world_slice
+
+
+# sections fully below the ground or above everything are stored without data,
+# the ones in between are filled in from the column ranges
+def _add_chunk(
+    terrain: SyntheticTerrain,
+    sections: WorldSections,
+    chunk_x: int,
+    chunk_z: int,
+    block_ids: np.ndarray,
+    biome_ids: np.ndarray,
+) -> None:
+    # [z][x] as Minecraft stores sections
+    columns = (
+        slice(chunk_x * SECTION_SIZE, (chunk_x + 1) * SECTION_SIZE),
+        slice(chunk_z * SECTION_SIZE, (chunk_z + 1) * SECTION_SIZE),
+    )
+    ground = terrain.ground[columns].T
+    top_block = terrain.top_block[columns].T
+    soil_block = terrain.soil_block[columns].T
+    water_end = terrain.water_end[columns].T
+    trunk_end = terrain.trunk_end[columns].T
+    leaves_begin = terrain.leaves_begin[columns].T
+    leaves_end = terrain.leaves_end[columns].T
+
+    cells = terrain.biome[columns][::BIOME_CELL_SIZE, ::BIOME_CELL_SIZE].T
+    biome_palette, biome_indices = np.unique(biome_ids[cells], return_inverse=True)
+    biome_data = pack_bit_array(
+        np.tile(biome_indices.reshape(-1), SECTION_SIZE // BIOME_CELL_SIZE),
+        biome_bits_per_entry(len(biome_palette)),
+    )
+
+    solid_end = int(ground.min()) - SOIL_DEPTH  # stone all the way across below this
+    content_end = int(np.max([water_end, trunk_end, leaves_end, ground + 1]))
+    band_begin = max(Y_BEGIN, solid_end // SECTION_SIZE * SECTION_SIZE)
+    band_end = -(-content_end // SECTION_SIZE) * SECTION_SIZE
+
+    # every block between them, indexed [y][z][x]
+    y = np.arange(band_begin, band_end)[:, None, None]
+    band = np.select(
+        [
+            y < ground - SOIL_DEPTH,
+            y < ground,
+            y == ground,
+            y < water_end,
+            y < trunk_end,
+            (leaves_begin <= y) & (y < leaves_end),
+        ],
+        [STONE, soil_block, top_block, WATER, LOG, LEAVES],
+        AIR,
+    )
+
+    for section_y in range(Y_BEGIN // SECTION_SIZE, (Y_BEGIN + Y_SIZE) // SECTION_SIZE):
+        y_begin = section_y * SECTION_SIZE
+
+        if y_begin < band_begin or y_begin >= band_end:
+            fill = STONE if y_begin < band_begin else AIR
+            sections.add_section(
+                chunk_x,
+                section_y,
+                chunk_z,
+                block_ids[[fill]],
+                [],
+                biome_palette,
+                biome_data,
+            )
+            continue
+
+        blocks = band[y_begin - band_begin : y_begin - band_begin + SECTION_SIZE]
+        # the palette in BLOCKS order, and each block's index into it
+        present = np.bincount(blocks.reshape(-1), minlength=len(BLOCKS)) > 0
+        indices = (np.cumsum(present) - 1)[blocks]
+        sections.add_section(
+            chunk_x,
+            section_y,
+            chunk_z,
+            block_ids[present],
+            pack_bit_array(
+                indices.reshape(-1), block_bits_per_entry(int(present.sum()))
+            ),
+            biome_palette,
+            biome_data,
+        )
@@ -1,84 +1,167 @@
-import itertools
+from dataclasses import dataclass
 
+import numpy as np
 from gdpc import WorldSlice
-from gdpc.vector_tools import Box, Rect, ivec2, ivec3
+from gdpc.vector_tools import ivec3
 
 from ..core.maps import Map
-from ..core.structures.legacy_directions import cardinal, vector
-from ..districts.district import District
+from ..districts.district import UNCLAIMED, District
+
+MAX_STEP = 1  # columns further apart in height than this are impassable, not neighbours
+OFF_MAP = -2  # label given to the columns around the map
+
+
+@dataclass
+class Adjacency:
+    """
+    Sparse adjacency between labelled districts, found with shifted array comparisons.
+    Only the column pairs stepping east (+x) or south (+z) are counted, so each pair is counted once.
+    """
+
+    # label pairs with first < second, and how many passable column pairs join them
+    first: np.ndarray
+    second: np.ndarray
+    count: np.ndarray
+    # per label, passable steps from the district onto unclaimed columns
+    empty: np.ndarray
+    # labels with a column on the edge of the map
+    on_map_edge: np.ndarray
+    # [x][z] columns bordering another district or the edge of the map
+    edge: np.ndarray
+
+
+def find_adjacency(labels: np.ndarray, height: np.ndarray) -> Adjacency:
+    label_count = int(labels.max()) + 1
+    height = np.asarray(height, dtype=np.int32)
+
+    pair_keys: list[np.ndarray] = []
+    empty = np.zeros(label_count, dtype=np.int64)
+
+    for here, there, height_here, height_there in (
+        (labels[:-1, :], labels[1:, :], height[:-1, :], height[1:, :]),
+        (labels[:, :-1], labels[:, 1:], height[:, :-1], height[:, 1:]),
+    ):
+        crossing = (
+            (here != UNCLAIMED)
+            & (here != there)
+            & (np.abs(height_here - height_there) <= MAX_STEP)
+        )
+
+        into_empty = crossing & (there == UNCLAIMED)
+        empty += np.bincount(here[into_empty], minlength=label_count)
+
+        into_other = crossing & (there != UNCLAIMED)
+        low = np.minimum(here[into_other], there[into_other]).astype(np.int64)
+        high = np.maximum(here[into_other], there[into_other]).astype(np.int64)
+        pair_keys.append(low * label_count + high)
+
+    keys, count = np.unique(np.concatenate(pair_keys), return_counts=True)
+
+    border = np.concatenate((labels[0], labels[-1], labels[:, 0], labels[:, -1]))
+
+    return Adjacency(
+        first=keys // label_count,
+        second=keys % label_count,
+        count=count,
+        empty=empty,
+        on_map_edge=np.unique(border[border != UNCLAIMED]),
+        edge=find_edge_mask(labels),
+    )
+
+
+# [x][z] labelled columns with a differently labelled neighbour, or on the edge of the map
+def find_edge_mask(labels: np.ndarray) -> np.ndarray:
+    padded = np.pad(labels, 1, constant_values=OFF_MAP)
+    return (labels != UNCLAIMED) & (
+        (padded[:-2, 1:-1] != labels)
+        | (padded[2:, 1:-1] != labels)
+        | (padded[1:-1, :-2] != labels)
+        | (padded[1:-1, 2:] != labels)
+    )
 
 
 # Tells the districts what neighbours they have and why
 def establish_adjacency(
     world_slice: WorldSlice, district_map: list[list[District]], main_map: Map
-) -> None:
-    build_box: Box = world_slice.box
-    rect = Rect(
-        (0, 0), (build_box.size.x, build_box.size.z)
-    )  # rect of build area, with (0, 0) as corner
-
-    for x, z in itertools.product(range(rect.size.x), range(rect.size.y)):
-        # Don't consider unclaimed territory
-        if district_map[x][z] is None:
-            continue
-
-        district: District = district_map[x][z]
-        y: int = main_map.height_no_tree[x][z]
-
-        if x == 0 or z == 0:  # label edge districts as non-urban
-            district.is_urban = False
-
-        for point in (ivec2(x + 1, z), ivec2(x, z + 1)):
-            if not rect.contains(point):  # out of bounds
-                district.is_urban = False
-                continue
+) -> Adjacency:
+    districts, labels = label_district_map(district_map)
+    adjacency = find_adjacency(labels, main_map.height_no_tree)
 
-            point_height: int = main_map.height_no_tree[x][z]
+    # label edge districts as non-urban
+    for label in adjacency.on_map_edge.tolist():
+        districts[label].is_urban = False
 
-            if abs(y - point_height) > 1:  # impassable, not neighbours
-                continue
+    for first, second, count in zip(
+        adjacency.first.tolist(), adjacency.second.tolist(), adjacency.count.tolist()
+    ):
+        district, other = districts[first], districts[second]
+        district.adjacency[other] = district.adjacency.get(other, 0) + count
+        district.adjacencies_total += count
+        other.adjacency[district] = other.adjacency.get(district, 0) + count
+        other.adjacencies_total += count
 
-            point_district: District = district_map[point.x][point.y]
+    # log the empty adjacencies
+    for label in np.flatnonzero(adjacency.empty).tolist():
+        districts[label].adjacencies_total += int(adjacency.empty[label])
 
-            # they are neighbours
-            if point_district == district:  # same districts, uninteresting
-                continue
+    add_edges(districts, labels, adjacency.edge, main_map)
 
-            if point_district is None:
-                district.adjacencies_total += 1  # log an empty adjacency
-                continue
-
-            district._add_adjacency(point_district)
-            point_district._add_adjacency(district)
-
-    find_edges(world_slice, district_map, main_map)
+    return adjacency
 
 
 def find_edges(
     world_slice: WorldSlice, district_map: list[list[District]], main_map: Map
 ) -> None:
-    build_box: Box = world_slice.box
-    rect = Rect(
-        (0, 0), (build_box.size.x, build_box.size.z)
-    )  # rect of build area, with (0, 0) as corner
-
-    for x, z in itertools.product(range(rect.size.x), range(rect.size.y)):
-        y: int = main_map.height_no_tree[x][z]
-        point = ivec3(x, y, z)
-        district: District = district_map[x][z]
-
-        if district is None:
-            continue
-
-        for direction in cardinal:
-            neighbour: ivec3 = point + vector(direction)
-
-            if (
-                neighbour.x < 0
-                or neighbour.z < 0
-                or neighbour.x >= rect.size.x
-                or neighbour.z >= rect.size.y
-            ):
-                district.edges.add(point)
-            elif district_map[neighbour.x][neighbour.z] != district:
-                district.edges.add(point)
+    districts, labels = label_district_map(district_map)
+    add_edges(districts, labels, find_edge_mask(labels), main_map)
+
+
+def add_edges(
+    districts: list[District], labels: np.ndarray, edge: np.ndarray, main_map: Map
+) -> None:
+    xs, zs = np.nonzero(edge)
+    owners = labels[xs, zs]
+    ys = np.asarray(main_map.height_no_tree)[xs, zs]
+
+    for x, y, z, owner in zip(xs.tolist(), ys.tolist(), zs.tolist(), owners.tolist()):
+        districts[owner].edges.add(ivec3(x, y, z))
+
+
+# the districts of a district map and an int32 raster of indices into them
+def label_district_map(
+    district_map: list[list[District]],
+) -> tuple[list[District], np.ndarray]:
+    first = next(
+        (district for row in district_map for district in row if district is not None),
+        None,
+    )
+
+    if first is not None and first.raster is not None:
+        raster = first.raster
+        owners = np.append(raster.owners, UNCLAIMED)[raster.labels]
+
+        # the districts are read back from the map, one column per label
+        present, index = np.unique(owners, return_index=True)
+        xs, zs = np.unravel_index(index, owners.shape)
+
+        districts: list[District] = []
+        remap = np.full(len(raster.owners) + 1, UNCLAIMED, dtype=np.int32)
+        for label, x, z in zip(present.tolist(), xs.tolist(), zs.tolist()):
+            district = district_map[x][z]
+            if label == UNCLAIMED or district is None:
+                continue  # unclaimed, or a district that was thrown away
+
+            remap[label] = len(districts)
+            districts.append(district)
+
+        return districts, remap[owners]
+
+    # hand built districts, label them one column at a time
+    ids: dict[District, int] = {}
+    labels = np.full((len(district_map), len(district_map[0])), UNCLAIMED, np.int32)
+    for x, row in enumerate(district_map):
+        for z, district in enumerate(row):
+            if district is not None:
+                labels[x, z] = ids.setdefault(district, len(ids))
+
+    return list(ids), labels
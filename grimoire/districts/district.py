@@ -1,9 +1,168 @@
+from dataclasses import dataclass, field
 from enum import Enum, auto
 
-from gdpc.vector_tools import ivec2, ivec3
+import numpy as np
+from gdpc.vector_tools import Rect, ivec2, ivec3
 
 from ..palette import Palette
 
+UNCLAIMED = -1  # label of columns no district owns
+
+
+class DistrictRaster:
+    """
+    Which district owns each column of the map, as one int32 label per column.
+
+    Labels are handed out once, when districts are grown. Merging districts doesn't touch the
+    labels, it remaps the merged label to its new owner in `owners`, so several rasters over the
+    same labels (districts and super districts) can share one array.
+    """
+
+    labels: np.ndarray  # [x][z] label of each column, UNCLAIMED where nothing grew
+    heights: np.ndarray  # [x][z] y given to each column's point
+    owners: np.ndarray  # label -> label of the district that owns it now
+    # counts the edits to any raster, points built before one are out of date
+    revision: int = 0
+
+    def __init__(self, labels: np.ndarray, heights: np.ndarray, count: int) -> None:
+        self.labels = labels
+        self.heights = heights
+        self.owners = np.arange(count, dtype=np.int32)
+
+    # another raster over the same labels, with its own owners
+    def copy(self) -> "DistrictRaster":
+        raster = DistrictRaster(self.labels, self.heights, 0)
+        raster.owners = self.owners.copy()
+        return raster
+
+    # gives every labelled district its raster, label and summary statistics
+    def attach(self, districts: list["District"]) -> None:
+        claimed = self.labels != UNCLAIMED
+        xs, zs = np.nonzero(claimed)
+        labels = self.labels[xs, zs]
+        count = len(self.owners)
+
+        area = np.bincount(labels, minlength=count)
+        sum_x = np.bincount(labels, weights=xs, minlength=count)
+        sum_y = np.bincount(labels, weights=self.heights[xs, zs], minlength=count)
+        sum_z = np.bincount(labels, weights=zs, minlength=count)
+
+        min_x = np.full(count, np.iinfo(np.int64).max)
+        min_z = np.full(count, np.iinfo(np.int64).max)
+        max_x = np.full(count, -1)
+        max_z = np.full(count, -1)
+        np.minimum.at(min_x, labels, xs)
+        np.minimum.at(min_z, labels, zs)
+        np.maximum.at(max_x, labels, xs)
+        np.maximum.at(max_z, labels, zs)
+
+        for label, district in enumerate(districts):
+            bounds = None
+            if area[label] > 0:
+                bounds = Rect(
+                    (int(min_x[label]), int(min_z[label])),
+                    (
+                        int(max_x[label] - min_x[label] + 1),
+                        int(max_z[label] - min_z[label] + 1),
+                    ),
+                )
+
+            district._attach(
+                self,
+                label,
+                int(area[label]),
+                ivec3(int(sum_x[label]), int(sum_y[label]), int(sum_z[label])),
+                bounds,
+            )
+
+    # hands everything owned by child over to parent
+    def merge(self, parent: int, child: int) -> None:
+        self.owners[self.owners == child] = parent
+        DistrictRaster.revision += 1
+
+    # gives the columns of the district with the given label the heights of heightmap
+    def set_heights(self, label: int, rect: Rect | None, heightmap: np.ndarray) -> None:
+        if rect is None:
+            return
+
+        begin, end = rect.offset, rect.end
+        mask = self.mask(label, rect)
+        self.heights[begin.x : end.x, begin.y : end.y][mask] = np.asarray(heightmap)[
+            begin.x : end.x, begin.y : end.y
+        ][mask]
+        DistrictRaster.revision += 1
+
+    # columns within rect owned by the district with the given label
+    def mask(self, label: int, rect: Rect | None) -> np.ndarray:
+        if rect is None:
+            return np.zeros((0, 0), dtype=bool)
+
+        begin, end = rect.offset, rect.end
+        labels = self.labels[begin.x : end.x, begin.y : end.y]
+        return (labels != UNCLAIMED) & (self.owners[labels] == label)
+
+    def points(self, label: int, rect: Rect | None) -> set[ivec3]:
+        if rect is None:
+            return set()
+
+        xs, zs = np.nonzero(self.mask(label, rect))
+        ys = self.heights[xs + rect.offset.x, zs + rect.offset.y]
+        return {
+            ivec3(x, y, z)
+            for x, y, z in zip(
+                (xs + rect.offset.x).tolist(),
+                ys.tolist(),
+                (zs + rect.offset.y).tolist(),
+            )
+        }
+
+    # district_map style [x][z] lists of the district owning each column
+    def to_map(self, districts: list["District"]) -> list[list["District | None"]]:
+        lookup = np.full(len(self.owners) + 1, None, dtype=object)
+        for district in districts:
+            lookup[district.label] = district
+        # UNCLAIMED reads the None at the end
+        owners = np.append(self.owners, UNCLAIMED)
+        return lookup[owners[self.labels]].tolist()
+
+
+@dataclass
+class DistrictStats:
+    """
+    Sums over a district's points, which district_analyze turns into its measures.
+    Merging two districts adds their sums, so nothing is measured again.
+    """
+
+    points: int = 0
+    sum_y: int = 0
+    sum_y_squared: int = 0
+    neighbour_height: float = 0
+    water_blocks: int = 0
+    leaf_blocks: int = 0
+    biomes: dict[str, int] = field(default_factory=dict)
+    surface_blocks: dict[str, int] = field(default_factory=dict)
+
+    # the sums over both districts' points, neither is changed
+    def combine(self, other: "DistrictStats") -> "DistrictStats":
+        biomes = self.biomes.copy()
+        for biome, count in other.biomes.items():
+            biomes[biome] = biomes.get(biome, 0) + count
+
+        surface_blocks = self.surface_blocks.copy()
+        for block, count in other.surface_blocks.items():
+            surface_blocks[block] = surface_blocks.get(block, 0) + count
+
+        return DistrictStats(
+            self.points + other.points,
+            self.sum_y + other.sum_y,
+            self.sum_y_squared + other.sum_y_squared,
+            self.neighbour_height + other.neighbour_height,
+            self.water_blocks + other.water_blocks,
+            self.leaf_blocks + other.leaf_blocks,
+            biomes,
+            surface_blocks,
+        )
+
 
 class DistrictType(Enum):
     URBAN = auto()
@@ -14,11 +173,13 @@ class DistrictType(Enum):
 class District:
     id_counter = 0
     id: int
-    points: set[ivec3]
-    points_2d: set[ivec2]
     origin: ivec3
     sum: ivec3
     area: int
+    bounds: Rect | None  # of every point, None while the district has no points
+    # where the points live, None for hand built districts
+    raster: DistrictRaster | None
+    label: int
     adjacency: dict["District", int]
     edges: set[ivec3]
     adjacencies_total: int
@@ -28,6 +189,7 @@ class District:
     parent_id: int
 
     palettes: list[Palette]
+    stats: DistrictStats | None  # None until the district is analysed
     roughness: float
     biome_dict: dict[str, int]
     water_percentage: float
@@ -42,14 +204,19 @@ class District:
         self.origin = origin
         self.sum = ivec3(0, 0, 0)
         self.area = 0
+        self.bounds = None
+        self.raster = None
+        self.label = UNCLAIMED
+        self.__points = set()
+        self.__points_2d = None
+        self.__revision = 0  # of the rasters when the points were built from one
         self.adjacency = {}
-        self.points = set()
-        self.points_2d = set()
         self.edges = set()
         self.adjacencies_total = 0
         self.is_urban = False
         self.is_border = False
         self.palettes = []
+        self.stats = None
         self.roughness = 0
         self.biome_dict = {}
         self.water_percentage = 0
@@ -66,20 +233,118 @@ class District:
         self.origin = origin
         self.sum = ivec3(0, 0, 0)
         self.area = 0
+        self.bounds = None
+        self.raster = None
+        self.label = UNCLAIMED
+        self.__points = set()
+        self.__points_2d = None
+        self.__revision = 0  # of the rasters when the points were built from one
         self.adjacency = {}
-        self.points = set()
-        self.points_2d = set()
         self.edges = set()
         self.adjacencies_total = 0
         self.palettes = []
 
         self._add_point(origin)
 
+    # Points of districts with a raster are built from it when asked for, and kept
+    # until a raster is next edited. They are frozen, as the raster is what to change
+    @property
+    def points(self) -> set[ivec3]:
+        if self.raster is not None and (
+            self.__points is None or self.__revision != DistrictRaster.revision
+        ):
+            self.__points = frozenset(self.raster.points(self.label, self.bounds))
+            self.__points_2d = None
+            self.__revision = DistrictRaster.revision
+        return self.__points
+
+    @property
+    def points_2d(self) -> set[ivec2]:
+        if self.__points_2d is None:
+            self.__points_2d = {ivec2(point.x, point.z) for point in self.points}
+        return self.__points_2d
+
+    # moves the district's points to the heights of heightmap, [x][z] over the map
+    def set_heights(self, heightmap: np.ndarray) -> None:
+        if self.raster is not None:
+            self.raster.set_heights(self.label, self.bounds, heightmap)
+            return
+
+        columns = self.points_2d  # read before the points are cleared
+        self.__points = {ivec3(x, int(heightmap[x][z]), z) for x, z in columns}
+
+    # [x][z] mask of the district's columns within its bounds
+    def mask(self) -> np.ndarray:
+        if self.raster is not None:
+            return self.raster.mask(self.label, self.bounds)
+
+        if self.bounds is None:
+            return np.zeros((0, 0), dtype=bool)
+
+        mask = np.zeros((self.bounds.size.x, self.bounds.size.y), dtype=bool)
+        for point in self.points:
+            mask[point.x - self.bounds.offset.x, point.z - self.bounds.offset.y] = True
+        return mask
+
     def _add_point(self, point: ivec3) -> None:
         self.points.add(point)
-        self.points_2d.add(ivec2(point.x, point.z))
+        if self.__points_2d is not None:
+            self.__points_2d.add(ivec2(point.x, point.z))
         self.sum += point
         self.area += 1
+        self.__include(ivec2(point.x, point.z), ivec2(point.x, point.z) + 1)
+
+    def _attach(
+        self,
+        raster: DistrictRaster,
+        label: int,
+        area: int,
+        sum: ivec3,
+        bounds: Rect | None,
+    ) -> None:
+        self.raster = raster
+        self.label = label
+        self.area = area
+        self.sum = sum
+        self.bounds = bounds
+        self.__points = None
+        self.__points_2d = None
+
+    # replaces the points with a copy of another hand built district's
+    def _copy_points(self, other: "District") -> None:
+        self.__points = set(other.points)
+        self.__points_2d = None
+        self.area = other.area
+        self.sum = other.sum
+        self.bounds = other.bounds
+
+    # takes over the points of another district
+    def _absorb(self, other: "District") -> None:
+        if self.raster is not None and other.raster is self.raster:
+            self.raster.merge(self.label, other.label)
+        else:
+            if self.raster is not None:
+                # other's columns aren't in the raster, so the points stand on their own
+                self.__points = set(self.points)
+                self.raster = None
+                self.label = UNCLAIMED
+
+            self.points.update(other.points)
+            if self.__points_2d is not None:
+                self.__points_2d.update(other.points_2d)
+
+        self.area += other.area
+        self.sum += other.sum
+        if other.bounds is not None:
+            self.__include(other.bounds.offset, other.bounds.end)
+
+    def __include(self, begin: ivec2, end: ivec2) -> None:
+        if self.bounds is not None:
+            begin = ivec2(
+                min(begin.x, self.bounds.offset.x), min(begin.y, self.bounds.offset.y)
+            )
+            end = ivec2(max(end.x, self.bounds.end.x), max(end.y, self.bounds.end.y))
+        self.bounds = Rect(begin, end - begin)
 
     def _add_adjacency(self, district: "District") -> None:
         if district not in self.adjacency:
@@ -101,25 +366,33 @@ class District:
         return f"district {self.id}"
 
     def average(self) -> ivec3:
-        return sum(self.points) / len(self.points)
+        return self.sum / self.area
 
 
 class SuperDistrict(District):
     districts: list[District]
 
-    def __init__(self, district: District) -> None:
+    # super districts sharing a raster must be given a copy of their districts' raster
+    def __init__(
+        self, district: District, raster: DistrictRaster | None = None
+    ) -> None:
         self.districts = [district]
         super().__init__(district.origin)
-        self.sum = district.sum
-        self.area = district.area
+
+        if raster is not None:
+            self._attach(
+                raster, district.label, district.area, district.sum, district.bounds
+            )
+        else:
+            self._copy_points(district)
+
         self.adjacency = {}
-        self.points = district.points.copy()
-        self.points_2d = district.points_2d.copy()
         self.edges = set()
         self.adjacencies_total = 0
         self.is_urban = district.is_urban
         self.is_border = district.is_border
         self.palettes = district.palettes
+        self.stats = district.stats
         self.roughness = district.roughness
         self.biome_dict = district.biome_dict
         self.water_percentage = district.water_percentage
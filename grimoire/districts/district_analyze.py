@@ -2,35 +2,37 @@ import contextlib
 import math
 from typing import Type
 
+import numpy as np
 from gdpc import Block
 from gdpc.vector_tools import ivec2, ivec3
 
 from ..core.maps import Map
-from ..districts.district import District, DistrictType, SuperDistrict
+from ..districts.district import (
+    UNCLAIMED,
+    District,
+    DistrictRaster,
+    DistrictStats,
+    DistrictType,
+    SuperDistrict,
+)
 
 URBAN_SIZE = 3  # max number of urban districts
 BEST_SCORE = 0.6  # score needed to become urban in relation to prime urban district
 
 
 def district_analyze(district: District, main_map: Map) -> None:
-    average: ivec3 = district.average()
-    average_height: int = average.y
-    water_blocks = 0
-    leaf_blocks = 0
-    neighbour_height = 0
-    number_of_points: int = len(district.points)
-    district.biome_dict = {}
-    district.surface_blocks = {}
-
-    root_mean_square_height = 0
+    stats = DistrictStats()
 
     for point in district.points:
         biome: str = main_map.biome_at(ivec2(point.x, point.z))
         block: str = main_map.block_at(ivec2(point.x, point.z)).id
         water: bool = main_map.water_at(ivec2(point.x, point.z))
-        leaf_height: int = main_map.height_at_include_leaf(ivec2(point.x, point.z))
+        # the map's layer, as analyze_districts reads it
+        leaf_height: int = main_map.leaf_height[point.x][point.z]
 
-        root_mean_square_height += pow(point.y - average_height, 2)
+        stats.points += 1
+        stats.sum_y += point.y
+        stats.sum_y_squared += point.y * point.y
         # ugly code to prevent from crashing on getting out of bounds error
 
         height: int = main_map.height_no_tree[point.x][point.z]
@@ -44,35 +46,152 @@ def district_analyze(district: District, main_map: Map) -> None:
         if main_map.is_in_bounds2d(ivec2(point.x, point.z - 1)):
             n2 = main_map.height_no_tree[point.x][point.z - 1]
 
-        neighbour_height += (
+        stats.neighbour_height += (
             abs(point.y - n1)
             + abs(point.y - n2)
             + abs(point.y - n3)
             + abs(point.y - n4)
         ) / 4
 
-        if biome not in district.biome_dict:
-            district.biome_dict[biome] = 1
+        if biome not in stats.biomes:
+            stats.biomes[biome] = 1
         else:
-            district.biome_dict[biome] += 1
+            stats.biomes[biome] += 1
 
-        if block not in district.surface_blocks:
-            district.surface_blocks[block] = 1
+        if block not in stats.surface_blocks:
+            stats.surface_blocks[block] = 1
         else:
-            district.surface_blocks[block] += 1
+            stats.surface_blocks[block] += 1
 
         if water:
-            water_blocks += 1
+            stats.water_blocks += 1
         elif point.y != leaf_height:
             # discrepancy between height map including leaves and normal height = leaves above block
-            leaf_blocks += 1
+            stats.leaf_blocks += 1
+
+    district.stats = stats
+    summarise_stats(district)
+
+
+# sets a district's measures from its stats, which merging districts keeps up to date
+def summarise_stats(district: District) -> None:
+    stats: DistrictStats = district.stats
+    number_of_points: int = stats.points
+    average_height: int = district.average().y
+
+    # sum of (y - average)^2, expanded so it can be taken from the sums
+    square_deviation: int = (
+        stats.sum_y_squared
+        - 2 * average_height * stats.sum_y
+        + number_of_points * average_height * average_height
+    )
 
+    district.biome_dict = stats.biomes
+    district.surface_blocks = stats.surface_blocks
     # root mean square
-    district.roughness = math.sqrt(root_mean_square_height / number_of_points)
+    district.roughness = math.sqrt(square_deviation / number_of_points)
     # average difference of neighbour block height
-    district.gradient = neighbour_height / number_of_points
-    district.water_percentage = water_blocks / number_of_points
-    district.forested_percentage = leaf_blocks / number_of_points
+    district.gradient = stats.neighbour_height / number_of_points
+    district.water_percentage = stats.water_blocks / number_of_points
+    district.forested_percentage = stats.leaf_blocks / number_of_points
+
+
+# district_analyze for many districts at once, as array passes over the map's layers
+def analyze_districts(districts: list[District], main_map: Map) -> None:
+    raster: DistrictRaster | None = districts[0].raster if districts else None
+
+    # hand built districts only have their points
+    if raster is None or any(district.raster is not raster for district in districts):
+        for district in districts:
+            district_analyze(district, main_map)
+        return
+
+    # column -> index into districts, through the raster's owners
+    lookup = np.full(len(raster.owners) + 1, -1, dtype=np.int64)
+    for index, district in enumerate(districts):
+        lookup[district.label] = index
+    owners = np.append(raster.owners, UNCLAIMED)[raster.labels]
+    indices = lookup[owners]
+
+    xs, zs = np.nonzero(indices >= 0)
+    indices = indices[xs, zs]
+    count = len(districts)
+
+    y = raster.heights[xs, zs].astype(np.int64)
+    water = np.asarray(main_map.water, dtype=bool)[xs, zs]
+    leaves = ~water & (y != np.asarray(main_map.leaf_height)[xs, zs])
+
+    points = np.bincount(indices, minlength=count)
+    sum_y = np.bincount(indices, weights=y, minlength=count)
+    sum_y_squared = np.bincount(indices, weights=y * y, minlength=count)
+    ground, east, other = _neighbour_heights(main_map.height_no_tree)
+    neighbour_height = np.bincount(
+        indices,
+        weights=(
+            np.abs(y - east[xs, zs])
+            + np.abs(y - other[xs, zs])
+            + 2 * np.abs(y - ground[xs, zs])
+        )
+        / 4,
+        minlength=count,
+    )
+    water_blocks = np.bincount(indices, weights=water, minlength=count)
+    leaf_blocks = np.bincount(indices, weights=leaves, minlength=count)
+
+    biomes = _histograms(indices, main_map.biome[xs, zs], main_map.biome_names, count)
+    block_names = [block.id for block in main_map.block_palette]
+    surface_blocks = _histograms(indices, main_map.block[xs, zs], block_names, count)
+
+    for index, district in enumerate(districts):
+        district.stats = DistrictStats(
+            int(points[index]),
+            int(sum_y[index]),
+            int(sum_y_squared[index]),
+            float(neighbour_height[index]),
+            int(water_blocks[index]),
+            int(leaf_blocks[index]),
+            biomes[index],
+            surface_blocks[index],
+        )
+        summarise_stats(district)
+
+
+# [x][z] the heights district_analyze compares each point with: the point's own twice,
+# east, and the last in bounds of west, south and north
+def _neighbour_heights(
+    height: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    height = np.asarray(height, dtype=np.int64)
+    padded = np.pad(height, 1, mode="edge")
+    size_x, size_z = height.shape
+    xs = np.arange(size_x)[:, None]
+    zs = np.arange(size_z)[None, :]
+
+    east = padded[2:, 1:-1]  # the edge padding is the point itself
+    other = np.where(xs > 0, padded[:-2, 1:-1], height)
+    other = np.where(zs + 1 < size_z, padded[1:-1, 2:], other)
+    other = np.where(zs > 0, padded[1:-1, :-2], other)
+
+    return height, east, other
+
+
+# per district, how many of its columns have each name, ids index into names
+def _histograms(
+    indices: np.ndarray, ids: np.ndarray, names: list[str], count: int
+) -> list[dict[str, int]]:
+    # ids of the same name are counted together
+    unique_names, name_ids = np.unique(
+        np.asarray(names, dtype=object), return_inverse=True
+    )
+    keys = indices * len(unique_names) + name_ids[ids]
+    counts = np.bincount(keys, minlength=count * len(unique_names)).reshape(
+        count, len(unique_names)
+    )
+
+    histograms: list[dict[str, int]] = [{} for _ in range(count)]
+    for index, name_id in zip(*np.nonzero(counts)):
+        histograms[index][unique_names[name_id]] = int(counts[index, name_id])
+    return histograms
 
 
 def _choose_more_urban_district(
@@ -3,13 +3,13 @@ from gdpc import Editor, Block, WorldSlice
 from gdpc.vector_tools import ivec2, ivec3
 from ..core.noise.rng import RNG
 from ..core.noise.random import choose_weighted, shuffle
-from ..terrain.tree import generate_tree
+from ..terrain.tree import place_tree_blocks, tree_blocks
 from ..core.structures.legacy_directions import cardinal, get_ivec2, to_text
 from ..terrain.forest import Forest
-import time
 
 
 # gives the ability to provide a list of blocks upon which not to place
+# nothing here waits on the server, give it a ThrottledEditor to slow down while it's behind
 def replace_ground(
     points: list[ivec2],
     block_dict: dict[any, int],
@@ -22,10 +22,7 @@ def replace_ground(
     ignore_blocks: list = [],
     ignore_water: bool = False,
 ):
-    for counter, point in enumerate(points, start=1):
-        if counter % 1000 == 0:
-            time.sleep(5)
-
+    for point in points:
         if (ignore_water or water_map[point.x][point.y] == False) and build_map[
             point.x
         ][point.y] == False:
@@ -38,6 +35,7 @@ def replace_ground(
 
 
 # requires the block dict to have 3 dicts inside, blocks, slabs, stairs
+# not throttled either, see replace_ground
 def replace_ground_smooth(
     points: list[ivec2],
     block_dict: dict[any, int],
@@ -50,10 +48,7 @@ def replace_ground_smooth(
     ignore_blocks: list = [],
     ignore_water: bool = False,
 ):
-    for counter, point in enumerate(points, start=1):
-        if counter % 1000 == 0:
-            time.sleep(5)
-
+    for point in points:
         if (ignore_water or water_map[point.x][point.y] == False) and build_map[
             point.x
         ][point.y] == False:
@@ -114,6 +109,8 @@ def plant_forest(
     ignore_water: bool = False,
 ):
     points = shuffle(rng.value(), points)
+    # the whole forest is placed at once, later trees overwriting earlier ones
+    blocks: dict[tuple[int, int, int], str] = {}
     for point in points:
         if (ignore_water or water_map[point.x][point.y] == False) and build_map[
             point.x
@@ -121,11 +118,13 @@ def plant_forest(
             y = world_slice.heightmaps["MOTION_BLOCKING_NO_LEAVES"][point.x][point.y]
             if editor.getBlock(ivec3(point.x, y - 1, point.y)).id not in ignore_blocks:
                 tree_type = choose_weighted(rng.value(), forest.tree_dict)
-                generate_tree(
-                    tree_type,
-                    ivec3(point.x, y, point.y),
-                    editor,
-                    forest.tree_palette[tree_type],
+                blocks.update(
+                    tree_blocks(
+                        tree_type,
+                        ivec3(point.x, y, point.y),
+                        forest.tree_palette[tree_type],
+                        rng,
+                    )
                 )
                 for a, b in itertools.product(
                     range(
@@ -136,3 +135,5 @@ def plant_forest(
                     ),
                 ):
                     build_map[a][b] = True
+
+    place_tree_blocks(blocks, editor)
@@ -0,0 +1,132 @@
+from heapq import heappop, heappush
+
+import numpy as np
+
+from .district import UNCLAIMED
+
+# Multi-source weighted flood fill over the map's height layer, used to grow
+# districts out from their origins.
+# A point is claimed by the first district to reach it, and grows on
+# 1 + max(0, drop) steps later, where drop is how far it lies below the point
+# that claimed it. Points are grown a whole step (bucket) at a time with array
+# operations. Water is claimed but doesn't grow until every land point has,
+# after which it spreads one point per step.
+
+# x and z offsets in the order of legacy_directions.cardinal (north, east, south, west)
+CARDINAL_OFFSETS = ((0, -1), (1, 0), (0, 1), (-1, 0))
+
+
+def weighted_flood_fill(
+    origins_x: np.ndarray,
+    origins_z: np.ndarray,
+    origins_y: np.ndarray,
+    height: np.ndarray,
+    water: np.ndarray,
+) -> np.ndarray:
+    """
+    Grows a label per origin over the map, returns the label of every point as int32, indexed [x][z].
+    Points nothing reaches are left UNCLAIMED.
+    """
+
+    size_x, size_z = height.shape
+    heights = np.asarray(height, dtype=np.int64).ravel()
+    is_water = np.asarray(water, dtype=bool).ravel()
+
+    labels = np.full(size_x * size_z, UNCLAIMED, dtype=np.int32)
+    # the y a point grows from, the origins' own y rather than the height below them
+    grow_y = heights.copy()
+
+    origins = np.asarray(origins_x, dtype=np.int64) * size_z + origins_z
+    labels[origins] = np.arange(len(origins), dtype=np.int32)
+    grow_y[origins] = origins_y
+
+    buckets: dict[int, list[np.ndarray]] = {0: [origins]}
+    times: list[int] = [0]
+    water_points: list[np.ndarray] = []
+
+    # land grows in step order
+    while times:
+        time = heappop(times)
+        claimed = _claim_neighbours(
+            np.concatenate(buckets.pop(time)), labels, size_x, size_z
+        )
+
+        if claimed is None:
+            continue
+
+        sources, points = claimed
+        on_water = is_water[points]
+        water_points.append(points[on_water])
+
+        points = points[~on_water]
+        sources = sources[~on_water]
+        grow_times = time + 1 + np.maximum(0, grow_y[sources] - heights[points])
+
+        order = np.argsort(grow_times, kind="stable")
+        points = points[order]
+        grow_times = grow_times[order]
+
+        boundaries = np.flatnonzero(np.diff(grow_times)) + 1
+        for group in np.split(np.arange(len(points)), boundaries):
+            if len(group) == 0:
+                continue
+
+            grow_time = int(grow_times[group[0]])
+            if grow_time not in buckets:
+                buckets[grow_time] = []
+                heappush(times, grow_time)
+            buckets[grow_time].append(points[group])
+
+    # then water, breadth first
+    frontier = np.concatenate(water_points) if water_points else origins[:0]
+    while len(frontier):
+        claimed = _claim_neighbours(frontier, labels, size_x, size_z)
+
+        if claimed is None:
+            break
+
+        frontier = claimed[1]
+
+    return labels.reshape(size_x, size_z)
+
+
+# labels the unclaimed neighbours of points after them, the first point to
+# reach a neighbour wins, returns which point claimed what in claim order
+def _claim_neighbours(
+    points: np.ndarray, labels: np.ndarray, size_x: int, size_z: int
+) -> tuple[np.ndarray, np.ndarray] | None:
+    x, z = np.divmod(points, size_z)
+
+    sources: list[np.ndarray] = []
+    neighbours: list[np.ndarray] = []
+
+    for dx, dz in CARDINAL_OFFSETS:
+        nx, nz = x + dx, z + dz
+        in_bounds = (0 <= nx) & (nx < size_x) & (0 <= nz) & (nz < size_z)
+
+        sources.append(np.where(in_bounds, points, -1))
+        neighbours.append(np.where(in_bounds, nx * size_z + nz, -1))
+
+    # point major, like visiting each point's neighbours in turn
+    sources_flat = np.stack(sources, axis=1).ravel()
+    neighbours_flat = np.stack(neighbours, axis=1).ravel()
+
+    valid = neighbours_flat >= 0
+    sources_flat = sources_flat[valid]
+    neighbours_flat = neighbours_flat[valid]
+
+    unclaimed = labels[neighbours_flat] == UNCLAIMED
+    sources_flat = sources_flat[unclaimed]
+    neighbours_flat = neighbours_flat[unclaimed]
+
+    if len(neighbours_flat) == 0:
+        return None
+
+    _, first = np.unique(neighbours_flat, return_index=True)
+    first.sort()
+
+    sources_flat = sources_flat[first]
+    neighbours_flat = neighbours_flat[first]
+    labels[neighbours_flat] = labels[sources_flat]
+
+    return sources_flat, neighbours_flat
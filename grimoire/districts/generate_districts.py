@@ -1,12 +1,13 @@
+import numpy as np
 from gdpc import WorldSlice
 from gdpc.vector_tools import Rect, distance, ivec2, ivec3
 
 from ..core.maps import Map
 from ..core.noise.rng import RNG
-from ..core.structures.legacy_directions import cardinal, vector
 from .adjacency import establish_adjacency
-from .district import District, SuperDistrict
-from .district_analyze import district_analyze
+from .district import UNCLAIMED, District, DistrictRaster, SuperDistrict
+from .district_analyze import analyze_districts
+from .flood_fill import weighted_flood_fill
 from .merging_districts import merge_down
 
 # from districts.adjacency import establish_adjacency, get_neighbours
@@ -45,17 +46,14 @@ def generate_districts(
 
     establish_adjacency(world_slice, district_map, main_map)
     super_districts: list[SuperDistrict] = []
-    super_district_map: list[list[District]] = [
-        [None for _ in range(build_rect.size.y)] for _ in range(build_rect.size.x)
-    ]
+    # super districts share the districts' labels, merging them only remaps labels
+    super_raster: DistrictRaster = districts[0].raster.copy()
+    analyze_districts(districts, main_map)
     for district in districts:
-        district_analyze(district, main_map)
         # create a super_district parent for it
-        super_district = SuperDistrict(district)
+        super_district = SuperDistrict(district, super_raster)
         super_districts.append(super_district)
-    for super_district in super_districts:
-        for point in super_district.points_2d:
-            super_district_map[point.x][point.y] = super_district
+    super_district_map: list[list[District]] = super_raster.to_map(super_districts)
     establish_adjacency(world_slice, super_district_map, main_map)
     merge_down(super_districts, super_district_map, TARGET_DISTRICT_AMT, main_map)
 
@@ -89,69 +87,24 @@ def recalculate_center_point(
 def bubble_out(
     districts: list[District], district_map: list[list[District]], main_map: Map
 ):
-    # additional value added which defines how many iterations needed to claim the block
-    queue = [[district.origin, 0] for district in districts]
-    water_queue = []
-    visited: set[ivec3] = {district.origin for district in districts}
-
-    def add_point_to_district(point: ivec3, district: District):
-        district_map[point.x][point.z] = district
-        district._add_point(point)
-
-    # first pass normal queue
-    while queue:
-        next_points: list[ivec3, int] = queue.pop(0)
-        point: ivec3 = next_points[0]
-        district: District = district_map[point.x][point.z]
-
-        if next_points[1] > 0:
-            queue.append([point, next_points[1] - 1])
-            continue
-
-        for neighbour in get_neighbours(point, main_map, district):
-            if neighbour[0] in visited:
-                continue
-
-            visited.add(neighbour[0])
-            add_point_to_district(neighbour[0], district)
-
-            if main_map.water[neighbour[0].x][neighbour[0].z]:
-                water_queue.append(neighbour[0])
-            else:
-                queue.append(neighbour)
-
-    # second pass water queue
-    while water_queue:
-        point = water_queue.pop(0)
-        district = district_map[point.x][point.z]
-
-        for neighbour in get_neighbours(point, main_map, district):
-            if neighbour[0] in visited:
-                continue
-
-            visited.add(neighbour[0])
-            water_queue.append(neighbour[0])
-            add_point_to_district(neighbour[0], district)
-
-
-# Returns the neighbours of a point on the surface based on walkability
-def get_neighbours(point: ivec3, main_map: Map, district: District) -> list[ivec3, int]:
-    neighbours: list[list[ivec3]] = []
-    height_map: list[list[int]] = main_map.height_no_tree
-
-    for direction in cardinal:
-        delta: ivec3 = vector(direction)
-        neighbour: ivec3 = point + delta
-
-        if not main_map.is_in_bounds2d(ivec2(neighbour.x, neighbour.z)):
-            # out of bounds
-            district.is_border = True  # set is_border to true
-            continue
-
-        neighbour.y = height_map[neighbour.x][neighbour.z]
-        neighbours.append([neighbour, point.y - neighbour.y])
-
-    return neighbours
+    height: np.ndarray = main_map.height_no_tree
+
+    labels = weighted_flood_fill(
+        np.array([district.origin.x for district in districts]),
+        np.array([district.origin.z for district in districts]),
+        np.array([district.origin.y for district in districts]),
+        height,
+        main_map.water,
+    )
+
+    # districts reaching the edge of the map
+    edges = np.concatenate((labels[0], labels[-1], labels[:, 0], labels[:, -1]))
+    for label in np.unique(edges[edges != UNCLAIMED]):
+        districts[label].is_border = True
+
+    raster = DistrictRaster(labels, height, len(districts))
+    raster.attach(districts)
+    district_map[:] = raster.to_map(districts)
 
 
 def spawn_districts(seed: int, build_rect: Rect, main_map: Map) -> list[District]:
@@ -1,6 +1,8 @@
+from heapq import heapify, heappop, heappush
+
 from ..core.maps import Map
 from ..districts.district import District, SuperDistrict
-from ..districts.district_analyze import district_analyze, get_candidate_score
+from ..districts.district_analyze import get_candidate_score, summarise_stats
 
 RURAL_SIZE_RATIO = 3  # NOTE: not currently used, we expect rural districts to be this times larger in area than urban ones
 
@@ -17,10 +19,20 @@ def merge_down(
     }  # tracks whether a districts is truly itself
     district_count: int = len(districts)
 
+    # smallest district first, ties go to the one earliest in the list
+    order: dict[District, int] = {
+        district: index for index, district in enumerate(districts)
+    }
+    queue: list[tuple[int, int, District]] = [
+        (district.area, order[district], district) for district in districts
+    ]
+    heapify(queue)
+
+    alive: set[District] = set(districts)
     ignore: set[District] = set()
 
     while district_count > target_number:
-        child: District = find_smallest_adjusted_district(districts, ignore)
+        child: District = pop_smallest_district(queue, alive, ignore)
 
         if child is None:
             break
@@ -34,35 +46,38 @@ def merge_down(
 
             if child.area < 10:  # remove garbage districts
                 districts.remove(child)
+                alive.discard(child)
                 district_count -= 1
                 identities[child] = None
 
             continue
 
         merge(parent, child, districts, identities)
-        district_analyze(
-            parent, main_map
-        )  # NOTE: could optimize by moving the calcucations in merge and using the district numbers instead of recalculating
+        alive.discard(child)
+        # the merged measures come from both districts' sums, rather than their points
+        parent.stats = parent.stats.combine(child.stats)
+        summarise_stats(parent)
         district_count -= 1
 
+        if parent in alive and parent not in ignore:
+            heappush(queue, (parent.area, order[parent], parent))
+
     fix_map_and_edges(district_map, districts, identities)
 
 
-def find_smallest_adjusted_district(
-    districts: list[District], ignore: set[District]
+# pops the smallest district still in the running, skipping entries left by merges
+def pop_smallest_district(
+    queue: list[tuple[int, int, District]],
+    alive: set[District],
+    ignore: set[District],
 ) -> District | None:
-    smallest: District | None = None
-    area: int | None = None
+    while queue:
+        area, _, district = heappop(queue)
 
-    for district in districts:
-        if district in ignore:
-            continue
-
-        if area is None or district.area < area:
-            smallest = district
-            area = district.area
+        if district in alive and district not in ignore and district.area == area:
+            return district
 
-    return smallest
+    return None
 
 
 def get_best_merge_candidate(
@@ -112,14 +127,11 @@ def merge(
         parent.districts.append(child)
 
     districts.remove(child)
-    identities[child] = parent
+    identities[child] = parent  # districts merged into child follow it to parent
 
-    parent.area += child.area
+    parent._absorb(child)  # a label remap when both share a raster
     parent.edges |= child.edges  # set addition
 
-    parent.points |= child.points
-    parent.points_2d |= child.points_2d
-
     # merge child's neighborus to parent
     for district, adjacency_count in child.adjacency.items():
         if district == parent:
@@ -133,30 +145,34 @@ def merge(
 
     parent.adjacency.pop(child)
 
-    # switch child for parent in other districts
-    for district in districts:
-        if district == parent:
+    # switch child for parent in its neighbours, only they know of it
+    for district in child.adjacency:
+        if district == parent or child not in district.adjacency:
             continue
 
-        if child in district.adjacency:
-            if parent not in district.adjacency:
-                district.adjacency[parent] = 0
-
-            district.adjacency[parent] += district.adjacency[child]
-            district.adjacency.pop(child)
+        if parent not in district.adjacency:
+            district.adjacency[parent] = 0
 
-    # add alias tracking for districts map
-    for alias in list(identities.keys()):
-        if identities[alias] == child:
-            identities[alias] = parent
+        district.adjacency[parent] += district.adjacency[child]
+        district.adjacency.pop(child)
 
 
 def fix_map_and_edges(
     district_map: list[list[District]],
-    districts: list[District],  # FIXME: Unused parameter
+    districts: list[District],
     identities: dict[District, District],
 ) -> None:
     # Fixes map
+    if districts and districts[0].raster is not None:
+        district_map[:] = districts[0].raster.to_map(districts)
+        return
+
+    # follow each merged district along the districts it was merged into
+    for district, target in identities.items():
+        while target is not None and identities[target] not in (target, None):
+            target = identities[target]
+        identities[district] = target
+
     for item in district_map:
         for z in range(len(district_map[0])):
             district: District = item[z]
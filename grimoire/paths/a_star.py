@@ -1,30 +1,176 @@
+from dataclasses import dataclass, field
 from heapq import heappop, heappush
-from typing import Callable
+from math import inf, sqrt
+from typing import Callable, Sequence
+
+import numpy as np
 from gdpc import Editor, Block
-from glm import ivec3
+from glm import ivec2, ivec3
 
 from grimoire.core.utils.vectors import y_ivec3
 
 # get_neighbours takes state
 # get_cost takes prev_cost and path
 
+# Nodes are columns of the map, identified by an integer id. Each node keeps
+# the y, cost and parent of the cheapest path found to it so far, so paths are
+# rebuilt from parent pointers instead of being copied onto the heap. Heap
+# entries are never updated in place (lazy decrease-key): stale entries are
+# skipped when popped, and a node is expanded at most once (closed set).
+
 COUNTER_LIMIT = 500000
 COUNTER_LIMIT_EXCEEDED = "counter limit exceeded"
 
+NO_PARENT = -1
+
+
+class _SearchState:
+    parent: list[int]
+    cost: list[float]  # best known heap key of each node
+    y: list[int]
+    depth: list[int]  # number of nodes on the path to the node
+    closed: bytearray
+
+    def __init__(self, node_count: int = 0) -> None:
+        self.parent = [NO_PARENT] * node_count
+        self.cost = [inf] * node_count
+        self.y = [0] * node_count
+        self.depth = [0] * node_count
+        self.closed = bytearray(node_count)
+
+    def grow(self) -> int:
+        self.parent.append(NO_PARENT)
+        self.cost.append(inf)
+        self.y.append(0)
+        self.depth.append(0)
+        self.closed.append(0)
+        return len(self.parent) - 1
+
+
+class _PathView(Sequence[ivec3]):
+    """Read-only path ending in tip, walked back through parent pointers on access."""
+
+    def __init__(self, tip: ivec3, parent: int, state: _SearchState, points) -> None:
+        self.tip = tip
+        self.parent = parent
+        self.state = state
+        self.points = points
+        self.length = state.depth[parent] + 1
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __getitem__(self, index: int) -> ivec3:
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError("path index out of range")
+
+        steps_back = self.length - 1 - index
+        if steps_back == 0:
+            return self.tip
+
+        node = self.parent
+        for _ in range(steps_back - 1):
+            node = self.state.parent[node]
+
+        return self.points(node)
+
+
+class _SparseSearchState:
+    """Search state of only the nodes a search reaches, so a search costs what it touches."""
+
+    parent: dict[int, int]
+    cost: dict[int, float]  # best known heap key of each node
+    path_cost: dict[int, float]  # cost of the path to each node, without the heuristic
+    y: dict[int, int]
+    closed: set[int]
+
+    def __init__(self) -> None:
+        self.parent = {}
+        self.cost = {}
+        self.path_cost = {}
+        self.y = {}
+        self.closed = set()
+
+
+def _rebuild_path(
+    node: int, state: _SearchState | _SparseSearchState, points
+) -> list[ivec3]:
+    path: list[ivec3] = []
+
+    while node != NO_PARENT:
+        path.append(points(node))
+        node = state.parent[node]
+
+    path.reverse()
+    return path
 
+
+# Callable-based search, nodes are told apart by their x and z.
+# If the size of the map is given, node ids are array indices into it and columns
+# off the map are never searched, otherwise ids are handed out as columns are discovered.
 def a_star(
     start: ivec3,
     end: ivec3,
     get_neighbours: Callable[[ivec3], list[ivec3]],
-    get_cost: Callable[[float, list[ivec3]], float],
+    get_cost: Callable[[float, Sequence[ivec3]], float],
     debug_editor: Editor | None = None,
+    size: ivec2 | None = None,
 ) -> list[ivec3] | None | str:
-    first_path: list[ivec3] = [start]
-    paths: list[tuple[float, list[ivec3]]] = [(get_cost(0, first_path), first_path)]
-    visited: set[ivec3] = set()
+    columns: list[tuple[int, int]] = []
+    ids: dict[tuple[int, int], int] = {}
+
+    if size is None:
+        state = _SearchState()
+
+        def in_range(point: ivec3) -> bool:
+            return True
+
+        def get_id(point: ivec3) -> int:
+            column = (point.x, point.z)
+            if column not in ids:
+                ids[column] = state.grow()
+                columns.append(column)
+            return ids[column]
+
+        def get_point(node: int) -> ivec3:
+            x, z = columns[node]
+            return ivec3(x, state.y[node], z)
+
+    else:
+        state = _SearchState(size.x * size.y)
+
+        # ids of columns off the map would alias columns on it, or run past the arrays
+        def in_range(point: ivec3) -> bool:
+            return 0 <= point.x < size.x and 0 <= point.z < size.y
+
+        def get_id(point: ivec3) -> int:
+            return point.x * size.y + point.z
+
+        def get_point(node: int) -> ivec3:
+            x, z = divmod(node, size.y)
+            return ivec3(x, state.y[node], z)
+
+    if not (in_range(start) and in_range(end)):
+        return None
+
+    start_id = get_id(start)
+    end_id = get_id(end)
+
+    state.y[start_id] = start.y
+    state.depth[start_id] = 1
+    state.cost[start_id] = get_cost(0, [start])
+
+    heap: list[tuple[float, int]] = [(state.cost[start_id], start_id)]
     counter = 0
 
-    while paths:
+    while heap:
+        curr_cost, node = heappop(heap)
+
+        if state.closed[node] or curr_cost > state.cost[node]:
+            continue  # stale entry
+
         counter += 1
         if counter % 10000 == 0:
             print(f"counter at {counter}")
@@ -32,25 +178,196 @@ def a_star(
         if counter > COUNTER_LIMIT:
             return COUNTER_LIMIT_EXCEEDED
 
-        curr_cost, curr_path = heappop(paths)
-
-        endpoint: ivec3 = curr_path[-1]
+        state.closed[node] = 1
+        endpoint: ivec3 = get_point(node)
 
-        visited.add(endpoint)
         if debug_editor:
             debug_editor.placeBlock(endpoint + y_ivec3(20), Block("blue_wool"))
 
         for neighbour in get_neighbours(endpoint):
-            if neighbour in visited:
+            if not in_range(neighbour):
+                continue
+
+            neighbour_id = get_id(neighbour)
+
+            if state.closed[neighbour_id]:
+                continue
+
+            if neighbour_id == end_id:
+                return _rebuild_path(node, state, get_point) + [neighbour]
+
+            cost: float = get_cost(
+                curr_cost, _PathView(neighbour, node, state, get_point)
+            )
+
+            if cost < state.cost[neighbour_id]:
+                state.cost[neighbour_id] = cost
+                state.parent[neighbour_id] = node
+                state.y[neighbour_id] = neighbour.y
+                state.depth[neighbour_id] = state.depth[node] + 1
+                heappush(heap, (cost, neighbour_id))
+
+    # no dice
+    return None
+
+
+@dataclass
+class GridCosts:
+    """
+    Precomputed cost terms for a_star_grid, layers indexed [x][z] like the Map's.
+    The layers are also flattened into lists once, for the searches to index by node id,
+    so they are not to be changed in place.
+    """
+
+    height: np.ndarray  # the height paths try to stay on
+    node_cost: np.ndarray  # flat cost of stepping onto each column
+    step_cost: float = 0.0  # added for every step
+    height_weight: float = 0.0  # per block between a node's y and the height below it
+    climb_weight: float = 0.0  # per block of y change between consecutive nodes
+    heuristic_weight: float = 1.0  # weight of the straight-line distance to the end
+    max_climb: int = 2  # steepest y change allowed between consecutive nodes
+    height_list: list[int] = field(init=False, repr=False, compare=False)
+    node_cost_list: list[float] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.height_list = np.asarray(self.height).ravel().tolist()
+        self.node_cost_list = np.asarray(self.node_cost).ravel().tolist()
+
+
+@dataclass
+class SearchStats:
+    # nodes expanded, summed over every search the stats were passed to
+    expanded: int = 0
+    # cost of the last path found, without the heuristic
+    cost: float = inf
+
+
+# Array-based search. steps holds, for every direction, the offsets to try in
+# order of preference; the first one that lands on the map is taken. A node's y
+# follows the height layer, clamped to max_climb from the previous node.
+def a_star_grid(
+    start: ivec3,
+    end: ivec3,
+    costs: GridCosts,
+    steps: Sequence[Sequence[ivec2]],
+    debug_editor: Editor | None = None,
+    stats: SearchStats | None = None,
+) -> list[ivec3] | None | str:
+    size_x, size_z = costs.height.shape
+    height = costs.height_list
+    node_cost = costs.node_cost_list
+
+    step_cost = costs.step_cost
+    height_weight = costs.height_weight
+    climb_weight = costs.climb_weight
+    heuristic_weight = costs.heuristic_weight
+    max_climb = costs.max_climb
+
+    options: list[list[tuple[int, int, float]]] = [
+        [(offset.x, offset.y, sqrt(offset.x**2 + offset.y**2)) for offset in offsets]
+        for offsets in steps
+    ]
+
+    state = _SparseSearchState()
+    parent = state.parent
+    best = state.cost
+    path_cost = state.path_cost
+    ys = state.y
+    closed = state.closed
+
+    def heuristic(x: int, y: int, z: int) -> float:
+        return heuristic_weight * sqrt(
+            (x - end.x) ** 2 + (y - end.y) ** 2 + (z - end.z) ** 2
+        )
+
+    def get_point(node: int) -> ivec3:
+        x, z = divmod(node, size_z)
+        return ivec3(x, ys[node], z)
+
+    # ids of columns off the map would alias columns on it, or run past the arrays
+    for point in (start, end):
+        if not (0 <= point.x < size_x and 0 <= point.z < size_z):
+            return None
+
+    start_id = start.x * size_z + start.z
+    end_id = end.x * size_z + end.z
+
+    parent[start_id] = NO_PARENT
+    ys[start_id] = start.y
+    path_cost[start_id] = 0.0
+    best[start_id] = heuristic(start.x, start.y, start.z)
+
+    heap: list[tuple[float, int]] = [(best[start_id], start_id)]
+    counter = 0
+
+    while heap:
+        curr_cost, node = heappop(heap)
+
+        if node in closed or curr_cost > best[node]:
+            continue  # stale entry
+
+        counter += 1
+        if counter > COUNTER_LIMIT:
+            if stats is not None:
+                stats.expanded += counter
+            return COUNTER_LIMIT_EXCEEDED
+
+        closed.add(node)
+        x, z = divmod(node, size_z)
+        y = ys[node]
+        cost_so_far = path_cost[node]
+
+        if debug_editor:
+            debug_editor.placeBlock(ivec3(x, y + 20, z), Block("blue_wool"))
+
+        for offsets in options:
+            for dx, dz, length in offsets:
+                nx, nz = x + dx, z + dz
+
+                if 0 <= nx < size_x and 0 <= nz < size_z:
+                    break
+            else:
+                continue  # every option is off the map
+
+            neighbour = nx * size_z + nz
+
+            if neighbour in closed:
                 continue
 
-            if neighbour == end:
-                return curr_path + [neighbour]
+            ground = height[neighbour]
+            ny = min(max(ground, y - max_climb), y + max_climb)
+
+            dy = ny - y
+            new_cost = (
+                cost_so_far
+                + node_cost[neighbour]
+                + step_cost
+                + height_weight * abs(ny - ground)
+                + climb_weight * abs(dy)
+                + sqrt(length * length + dy * dy)
+            )
+
+            if new_cost == inf:
+                continue  # walled off
+
+            if neighbour == end_id:
+                ys[neighbour] = ny
+                parent[neighbour] = node
+                if stats is not None:
+                    stats.expanded += counter
+                    stats.cost = new_cost
+                return _rebuild_path(neighbour, state, get_point)
 
-            new_path: list[ivec3] = curr_path + [neighbour]
-            cost: float = get_cost(curr_cost, new_path)
+            estimate = new_cost + heuristic(nx, ny, nz)
 
-            heappush(paths, (cost, new_path))
+            if estimate < best.get(neighbour, inf):
+                best[neighbour] = estimate
+                path_cost[neighbour] = new_cost
+                parent[neighbour] = node
+                ys[neighbour] = ny
+                heappush(heap, (estimate, neighbour))
 
     # no dice
+    if stats is not None:
+        stats.expanded += counter
     return None
@@ -0,0 +1,160 @@
+from heapq import heappop, heappush
+from math import inf, sqrt
+from typing import Iterable, Sequence
+
+from glm import ivec2, ivec3
+
+from .a_star import NO_PARENT, GridCosts
+
+# Multi-source Dijkstra over the same cost terms as a_star_grid, grown outwards
+# from one or more destinations. Every column it reaches keeps a pointer to the
+# next column on its cheapest way to the nearest destination, so any number of
+# paths into the same destinations can be read off the one search.
+# A node's y follows the height layer, clamped to max_climb from the node it
+# was reached from, so y is settled walking away from the destinations.
+
+
+class FlowField:
+    """
+    Cheapest paths from the columns of a GridCosts to the nearest of some destinations.
+    """
+
+    costs: GridCosts
+    destinations: list[ivec3]
+
+    def __init__(
+        self,
+        costs: GridCosts,
+        steps: Sequence[Sequence[ivec2]],
+        destinations: Iterable[ivec3],
+        origins: Iterable[ivec2 | ivec3] | None = None,
+    ) -> None:
+        self.costs = costs
+        self.destinations = list(destinations)
+
+        self.__size_z: int = costs.height.shape[1]
+        self.__closed = bytearray()
+        self.__next: list[int] = []
+        self.__y: list[int] = []
+        self.__cost: list[float] = []
+
+        self.__grow(steps, origins)
+
+    def __node(self, point: ivec2 | ivec3) -> int:
+        z = point.y if isinstance(point, ivec2) else point.z
+        return point.x * self.__size_z + z
+
+    # total cost of the cheapest path from a column, inf if it wasn't reached
+    def cost_at(self, point: ivec2 | ivec3) -> float:
+        node = self.__node(point)
+        return self.__cost[node] if self.__closed[node] else inf
+
+    # the path from an origin to its nearest destination, both included
+    def path_from(self, origin: ivec2 | ivec3) -> list[ivec3] | None:
+        node = self.__node(origin)
+
+        if not self.__closed[node]:
+            return None  # unreachable, or not settled before the search stopped
+
+        path: list[ivec3] = []
+        while node != NO_PARENT:
+            x, z = divmod(node, self.__size_z)
+            path.append(ivec3(x, self.__y[node], z))
+            node = self.__next[node]
+
+        return path
+
+    def __grow(
+        self,
+        steps: Sequence[Sequence[ivec2]],
+        origins: Iterable[ivec2 | ivec3] | None,
+    ) -> None:
+        size_x, size_z = self.costs.height.shape
+        height = self.costs.height_list
+        node_cost = self.costs.node_cost_list
+
+        step_cost = self.costs.step_cost
+        height_weight = self.costs.height_weight
+        climb_weight = self.costs.climb_weight
+        max_climb = self.costs.max_climb
+
+        options: list[list[tuple[int, int, float]]] = [
+            [
+                (offset.x, offset.y, sqrt(offset.x**2 + offset.y**2))
+                for offset in offsets
+            ]
+            for offsets in steps
+        ]
+
+        next_node = [NO_PARENT] * (size_x * size_z)
+        ys = [0] * (size_x * size_z)
+        cost = [inf] * (size_x * size_z)
+        closed = bytearray(size_x * size_z)
+
+        heap: list[tuple[float, int]] = []
+        for destination in self.destinations:
+            node = destination.x * size_z + destination.z
+            ys[node] = destination.y
+            cost[node] = 0.0
+            heappush(heap, (0.0, node))
+
+        # stop once every origin asked for is settled
+        remaining: set[int] | None = None
+        if origins is not None:
+            remaining = {self.__node(origin) for origin in origins}
+
+        while heap:
+            curr_cost, node = heappop(heap)
+
+            if closed[node] or curr_cost > cost[node]:
+                continue  # stale entry
+
+            closed[node] = 1
+
+            if remaining is not None:
+                remaining.discard(node)
+                if not remaining:
+                    break
+
+            x, z = divmod(node, size_z)
+            y = ys[node]
+
+            for offsets in options:
+                for dx, dz, length in offsets:
+                    nx, nz = x + dx, z + dz
+
+                    if 0 <= nx < size_x and 0 <= nz < size_z:
+                        break
+                else:
+                    continue  # every option is off the map
+
+                neighbour = nx * size_z + nz
+
+                if closed[neighbour]:
+                    continue
+
+                ground = height[neighbour]
+                ny = min(max(ground, y - max_climb), y + max_climb)
+
+                # paths run from neighbour into node, so the step is billed at
+                # node, the column it steps onto, as a_star_grid would bill it
+                dy = ny - y
+                new_cost = (
+                    curr_cost
+                    + node_cost[node]
+                    + step_cost
+                    + height_weight * abs(y - height[node])
+                    + climb_weight * abs(dy)
+                    + sqrt(length * length + dy * dy)
+                )
+
+                if new_cost < cost[neighbour]:
+                    cost[neighbour] = new_cost
+                    next_node[neighbour] = node
+                    ys[neighbour] = ny
+                    heappush(heap, (new_cost, neighbour))
+
+        self.__closed = closed
+        self.__next = next_node
+        self.__y = ys
+        self.__cost = cost
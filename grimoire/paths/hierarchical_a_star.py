@@ -0,0 +1,336 @@
+from dataclasses import replace
+from heapq import heappop, heappush
+from math import ceil, inf, sqrt
+from typing import Sequence
+
+import numpy as np
+from glm import ivec2, ivec3
+
+from .a_star import COUNTER_LIMIT, GridCosts, SearchStats, a_star_grid
+
+# Hierarchical pathfinding (HPA*) on top of a_star_grid.
+# The map is cut into square, chunk aligned clusters. Neighbouring clusters are
+# joined by entrances on their shared border, and the entrances of a cluster
+# are linked by the best path between them that stays inside it. A route is
+# found over that small abstract graph, then refined by stitching together the
+# paths stored on its links.
+
+# With highways on a 4 block lattice a single chunk only holds 4x4 nodes, which
+# barely shrinks the graph, so clusters span several chunks.
+CLUSTER_SIZE = 64  # blocks, 4 chunks
+ENTRANCE_SPACING = 32  # border length per entrance, 2 chunks
+
+Node = tuple[int, int]  # x and z of a lattice point
+Cluster = tuple[int, int]
+Alignment = tuple[int, int]  # x and z of the lattice modulo its spacing
+Link = tuple[float, list[Node]]  # cost and the nodes walked, without the first
+
+
+class HierarchicalPathfinder:
+    """
+    HPA* over a GridCosts. Nodes are the points reachable with the first (longest) option of each
+    step, so every lattice alignment gets its own entrance graph. Entrances are placed the first
+    time an alignment is routed on, the links inside a cluster the first time a route enters it.
+    """
+
+    costs: GridCosts
+    steps: Sequence[Sequence[ivec2]]
+    cluster_size: int
+    stats: SearchStats  # expansions spent answering routes
+    build_stats: SearchStats  # expansions spent linking clusters, paid once per cluster
+
+    def __init__(
+        self,
+        costs: GridCosts,
+        steps: Sequence[Sequence[ivec2]],
+        cluster_size: int = CLUSTER_SIZE,
+    ) -> None:
+        self.costs = costs
+        self.steps = steps
+        self.cluster_size = cluster_size
+        self.stats = SearchStats()
+        self.build_stats = SearchStats()
+
+        self.lattice_steps: list[list[ivec2]] = [[offsets[0]] for offsets in steps]
+        self.spacing: int = max(
+            max(abs(offsets[0].x), abs(offsets[0].y)) for offsets in steps
+        )
+
+        size_x, size_z = costs.height.shape
+        self.size = ivec2(size_x, size_z)
+        self.clusters = ivec2(ceil(size_x / cluster_size), ceil(size_z / cluster_size))
+
+        self.__height: list[list[int]] = np.asarray(costs.height).tolist()
+        self.__entrances: dict[tuple[Alignment, Cluster], list[Node]] = {}
+        self.__links: dict[Node, dict[Node, Link]] = {}
+        self.__aligned: set[Alignment] = set()
+        self.__linked_clusters: set[tuple[Alignment, Cluster]] = set()
+        self.__windows: dict[Cluster, GridCosts] = {}  # costs cut to each cluster
+
+    def cluster_of(self, x: int, z: int) -> Cluster:
+        return x // self.cluster_size, z // self.cluster_size
+
+    def cluster_bounds(self, cluster: Cluster) -> tuple[int, int, int, int]:
+        x0, z0 = cluster[0] * self.cluster_size, cluster[1] * self.cluster_size
+        return (
+            x0,
+            z0,
+            min(x0 + self.cluster_size, self.size.x),
+            min(z0 + self.cluster_size, self.size.y),
+        )
+
+    def find_path(self, start: ivec3, end: ivec3) -> list[ivec3] | None:
+        alignment: Alignment = (start.x % self.spacing, start.z % self.spacing)
+        if (end.x % self.spacing, end.z % self.spacing) != alignment:
+            return None  # the end isn't on the start's lattice
+
+        start_cluster = self.cluster_of(start.x, start.z)
+        end_cluster = self.cluster_of(end.x, end.z)
+
+        # close by, the abstract graph would only get in the way
+        if (
+            max(
+                abs(start_cluster[0] - end_cluster[0]),
+                abs(start_cluster[1] - end_cluster[1]),
+            )
+            <= 1
+        ):
+            path = a_star_grid(start, end, self.costs, self.steps, stats=self.stats)
+            return path if isinstance(path, list) else None
+
+        self.__add_entrances(alignment)
+
+        nodes = self.__find_abstract_path(start, end, alignment)
+        if nodes is None:
+            return None
+
+        return self.__lift(start.y, nodes)
+
+    # searches the abstract graph, returns every lattice node of the refined path
+    def __find_abstract_path(
+        self, start: ivec3, end: ivec3, alignment: Alignment
+    ) -> list[Node] | None:
+        start_node: Node = (start.x, start.z)
+        end_node: Node = (end.x, end.z)
+        end_cluster = self.cluster_of(*end_node)
+
+        # links to and from the start and end only live as long as the search
+        query_links: dict[Node, dict[Node, Link]] = {}
+
+        def get_links(node: Node) -> dict[Node, Link]:
+            if node in query_links:
+                return query_links[node]
+
+            cluster = self.cluster_of(*node)
+
+            if node == start_node:
+                links = {
+                    entrance: self.__search_cluster(
+                        start, self.__point(entrance), cluster, self.stats
+                    )
+                    for entrance in self.__entrances.get((alignment, cluster), [])
+                }
+            else:
+                self.__link_cluster(alignment, cluster)
+                links = self.__links.get(node, {})
+
+            if cluster == end_cluster:
+                links = dict(links)
+                links[end_node] = self.__search_cluster(
+                    start if node == start_node else self.__point(node),
+                    end,
+                    cluster,
+                    self.stats,
+                )
+
+            query_links[node] = links
+            return links
+
+        def heuristic(node: Node) -> float:
+            x, z = node
+            y = end.y if node == end_node else self.__height[x][z]
+            return self.costs.heuristic_weight * sqrt(
+                (x - end.x) ** 2 + (y - end.y) ** 2 + (z - end.z) ** 2
+            )
+
+        path_cost: dict[Node, float] = {start_node: 0.0}
+        parents: dict[Node, Node] = {}
+        closed: set[Node] = set()
+        heap: list[tuple[float, Node]] = [(heuristic(start_node), start_node)]
+        counter = 0
+
+        while heap:
+            _, node = heappop(heap)
+
+            if node in closed:
+                continue
+
+            if node == end_node:
+                self.stats.expanded += counter
+                self.stats.cost = path_cost[node]
+
+                nodes: list[Node] = []
+                while node in parents:
+                    parent = parents[node]
+                    nodes[:0] = query_links[parent][node][1]
+                    node = parent
+
+                return [start_node] + nodes
+
+            counter += 1
+            if counter > COUNTER_LIMIT:
+                break
+
+            closed.add(node)
+
+            for neighbour, (link_cost, _) in get_links(node).items():
+                if neighbour in closed or link_cost == inf:
+                    continue
+
+                new_cost = path_cost[node] + link_cost
+                if new_cost < path_cost.get(neighbour, inf):
+                    path_cost[neighbour] = new_cost
+                    parents[neighbour] = node
+                    heappush(heap, (new_cost + heuristic(neighbour), neighbour))
+
+        # no dice
+        self.stats.expanded += counter
+        return None
+
+    # gives the nodes their y, following the terrain like a_star_grid does
+    def __lift(self, y: int, nodes: list[Node]) -> list[ivec3]:
+        max_climb = self.costs.max_climb
+        path = [ivec3(nodes[0][0], y, nodes[0][1])]
+
+        for x, z in nodes[1:]:
+            y = min(max(self.__height[x][z], y - max_climb), y + max_climb)
+            path.append(ivec3(x, y, z))
+
+        return path
+
+    # places an entrance every ENTRANCE_SPACING along each border between two
+    # clusters, on the cheapest crossing of that stretch
+    def __add_entrances(self, alignment: Alignment) -> None:
+        if alignment in self.__aligned:
+            return
+        self.__aligned.add(alignment)
+
+        for i in range(self.clusters.x):
+            for j in range(self.clusters.y):
+                x0, z0, x1, z1 = self.cluster_bounds((i, j))
+                xs = self.__lattice(alignment[0], x0, x1)
+                zs = self.__lattice(alignment[1], z0, z1)
+
+                if not xs or not zs:
+                    continue
+
+                # border to the east, then to the south
+                east = xs[-1] + self.spacing
+                if east < self.size.x:
+                    for stretch in self.__stretches(zs):
+                        self.__add_entrance(
+                            alignment, [((xs[-1], z), (east, z)) for z in stretch]
+                        )
+
+                south = zs[-1] + self.spacing
+                if south < self.size.y:
+                    for stretch in self.__stretches(xs):
+                        self.__add_entrance(
+                            alignment, [((x, zs[-1]), (x, south)) for x in stretch]
+                        )
+
+    # lattice coordinates with the given remainder in [begin, end)
+    def __lattice(self, remainder: int, begin: int, end: int) -> range:
+        return range(begin + (remainder - begin) % self.spacing, end, self.spacing)
+
+    def __stretches(self, border: range) -> list[range]:
+        length = max(1, ENTRANCE_SPACING // self.spacing)
+        return [border[i : i + length] for i in range(0, len(border), length)]
+
+    def __add_entrance(
+        self, alignment: Alignment, crossings: list[tuple[Node, Node]]
+    ) -> None:
+        middle = (len(crossings) - 1) / 2
+
+        def score(crossing: int) -> tuple[float, float]:
+            (ax, az), (bx, bz) = crossings[crossing]
+            return (
+                self.costs.node_cost[ax, az]
+                + self.costs.node_cost[bx, bz]
+                + abs(self.__height[ax][az] - self.__height[bx][bz]),
+                abs(crossing - middle),  # prefer the middle of the stretch
+            )
+
+        a, b = crossings[min(range(len(crossings)), key=score)]
+        if self.costs.node_cost[a] == inf or self.costs.node_cost[b] == inf:
+            return
+
+        for node in (a, b):
+            entrances = self.__entrances.setdefault(
+                (alignment, self.cluster_of(*node)), []
+            )
+            if node not in entrances:
+                entrances.append(node)
+
+        self.__links.setdefault(a, {})[b] = (self.__step_cost(a, b), [b])
+        self.__links.setdefault(b, {})[a] = (self.__step_cost(b, a), [a])
+
+    # links every pair of entrances of a cluster
+    def __link_cluster(self, alignment: Alignment, cluster: Cluster) -> None:
+        if (alignment, cluster) in self.__linked_clusters:
+            return
+        self.__linked_clusters.add((alignment, cluster))
+
+        entrances = self.__entrances.get((alignment, cluster), [])
+
+        for index, a in enumerate(entrances):
+            for b in entrances[index + 1 :]:
+                cost, walked = self.__search_cluster(
+                    self.__point(a), self.__point(b), cluster, self.build_stats
+                )
+                self.__links.setdefault(a, {})[b] = (cost, walked)
+                # close enough the other way around
+                self.__links.setdefault(b, {})[a] = (cost, walked[-2::-1] + [a])
+
+    # best path between two points that stays inside a cluster
+    def __search_cluster(
+        self, start: ivec3, end: ivec3, cluster: Cluster, stats: SearchStats
+    ) -> Link:
+        x0, z0, x1, z1 = self.cluster_bounds(cluster)
+        window = self.__windows.get(cluster)
+        if window is None:
+            window = self.__windows[cluster] = replace(
+                self.costs,
+                height=self.costs.height[x0:x1, z0:z1],
+                node_cost=self.costs.node_cost[x0:x1, z0:z1],
+            )
+        offset = ivec3(x0, 0, z0)
+
+        search = SearchStats()
+        path = a_star_grid(
+            start - offset, end - offset, window, self.lattice_steps, stats=search
+        )
+        stats.expanded += search.expanded
+
+        if not isinstance(path, list):
+            return inf, []
+
+        return search.cost, [(point.x + x0, point.z + z0) for point in path[1:]]
+
+    # cost of stepping straight from a to b
+    def __step_cost(self, a: Node, b: Node) -> float:
+        y = self.__height[a[0]][a[1]]
+        ground = self.__height[b[0]][b[1]]
+        next_y = min(max(ground, y - self.costs.max_climb), y + self.costs.max_climb)
+        dy = next_y - y
+
+        return (
+            self.costs.node_cost[b]
+            + self.costs.step_cost
+            + self.costs.height_weight * abs(next_y - ground)
+            + self.costs.climb_weight * abs(dy)
+            + sqrt((b[0] - a[0]) ** 2 + (b[1] - a[1]) ** 2 + dy * dy)
+        )
+
+    def __point(self, node: Node) -> ivec3:
+        return ivec3(node[0], self.__height[node[0]][node[1]], node[1])
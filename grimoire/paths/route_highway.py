@@ -1,14 +1,30 @@
+import numpy as np
 from gdpc import Editor
-from gdpc.vector_tools import distance, ivec3
-
-from grimoire.districts.district import District
+from gdpc.vector_tools import ivec2, ivec3
 
 from ..core.maps import Map
-from ..core.structures.legacy_directions import all_8, vector
-from ..core.utils.bounds import is_in_bounds
-from ..paths.a_star import COUNTER_LIMIT_EXCEEDED, a_star
+from ..core.structures.legacy_directions import all_8, cardinal, get_ivec2
+from ..paths.a_star import COUNTER_LIMIT_EXCEEDED, GridCosts, a_star_grid
+from ..paths.flow_field import FlowField
+from ..paths.hierarchical_a_star import CLUSTER_SIZE, HierarchicalPathfinder
 
 HEURISTIC_WEIGHT = 3
+BASE_LENGTH_COST = 2  # added as length of path increases
+HEIGHT_COST = 5  # per block the highway floats above or digs below the terrain
+Y_DIFF_COST = 2  # per block the highway climbs or descends in one step
+WATER_COST = 30  # Making this big means water gets avoided when possible.
+URBAN_COST = 50
+NEAR_WALL_COST = 0  # was 10 when highways were kept away from city walls
+MAX_CLIMB = 2
+# with use_hierarchy, highways longer than this are routed over clusters first
+HIERARCHICAL_DISTANCE = 2 * CLUSTER_SIZE
+
+# prefer 4 out neighbours, but will accept 2 out for cardinal directions
+HIGHWAY_STEPS: list[list[ivec2]] = [
+    [get_ivec2(direction) * 4]
+    + ([get_ivec2(direction) * 2] if direction in cardinal else [])
+    for direction in all_8
+]
 
 
 def fill_out_highway(points: list[ivec3]) -> list[ivec3]:
@@ -65,7 +81,65 @@ def find_in_betweeners(point_a: ivec3, point_b: ivec3) -> list[ivec3]:
     return points
 
 
-def route_highway(start: ivec3, end: ivec3, map: Map, editor: Editor, is_debug=False):
+class HighwayCostField:
+    """
+    The static costs of routing highways over a Map, baked into arrays.
+    Build it once the districts are known and share it between every highway of the run.
+    Linking the clusters of the hierarchy costs more than a few flat searches and its
+    paths are dearer, see tests/path/test_hierarchical_benchmark.py, so it's only
+    worth using for many long highways over a large map.
+    """
+
+    map: Map
+    costs: GridCosts
+    use_hierarchy: bool
+    hierarchy: HierarchicalPathfinder | None  # only with use_hierarchy
+
+    def __init__(self, map: Map, use_hierarchy: bool = False) -> None:
+        self.map = map
+        self.use_hierarchy = use_hierarchy
+        self.refresh()
+
+    # recalculates the costs, for when the map's districts or near_wall change
+    def refresh(self) -> None:
+        urban = np.array(
+            [
+                [district is not None and district.is_urban for district in row]
+                for row in self.map.districts
+            ],
+            dtype=bool,
+        )
+
+        node_cost: np.ndarray = (
+            WATER_COST * np.asarray(self.map.water, dtype=np.float64)
+            + URBAN_COST * urban
+            + NEAR_WALL_COST * np.asarray(self.map.near_wall, dtype=np.float64)
+        )
+
+        self.costs = GridCosts(
+            height=self.map.height,
+            node_cost=node_cost,
+            step_cost=BASE_LENGTH_COST,
+            height_weight=HEIGHT_COST,
+            climb_weight=Y_DIFF_COST,
+            heuristic_weight=HEURISTIC_WEIGHT,
+            max_climb=MAX_CLIMB,
+        )
+        self.hierarchy = (
+            HierarchicalPathfinder(self.costs, HIGHWAY_STEPS)
+            if self.use_hierarchy
+            else None
+        )
+
+
+def route_highway(
+    start: ivec3,
+    end: ivec3,
+    map: Map,
+    editor: Editor,
+    is_debug=False,
+    cost_field: HighwayCostField | None = None,
+):
     end = ivec3(*end)  # copy end
 
     if end.x % 4 != start.x % 4:
@@ -76,101 +150,34 @@ def route_highway(start: ivec3, end: ivec3, map: Map, editor: Editor, is_debug=F
 
     end.y = map.height[end.x][end.z]
 
-    def get_cost(prev_cost: float, path: list[ivec3]) -> float:
-        if len(path) == 1:
-            return 2 * distance(path[-1], end)
-
-        last: ivec3 = path[-1]
+    if cost_field is None:
+        cost_field = HighwayCostField(map)
 
-        prev_heuristic: float = HEURISTIC_WEIGHT * distance(path[-2], end)
-
-        path_cost: float = prev_cost - prev_heuristic
-        base_length_cost = 2  # added as length of path increases
-
-        height_diff: int = abs(last.y - map.height[last.x][last.z])
-        height_cost: int = height_diff * 5
-
-        district_cost = 0
-        district_at_last: District | None = map.districts[last.x][last.z]
-        if district_at_last is not None and district_at_last.is_urban:
-            district_cost += 50
-
-        near_wall_cost = 0
-        # if map.near_wall and map.near_wall[last.x][last.z]:
-        #    near_wall_cost += 10
+    highway: list[ivec3] | None | str = None
 
-        if map.water[last.x][last.z]:
-            base_length_cost += 30  # WATER COST. Making this big means water gets avoided when possible.
+    distance = max(abs(end.x - start.x), abs(end.z - start.z))
 
-        y_diff_penalty: int = abs(path[-1].y - path[-2].y) * 2
+    if (
+        cost_field.hierarchy is not None
+        and not is_debug
+        and distance > HIERARCHICAL_DISTANCE
+    ):
+        highway = cost_field.hierarchy.find_path(start, end)
 
-        return (
-            path_cost
-            + height_cost
-            + base_length_cost
-            + y_diff_penalty
-            + distance(path[-2], last)
-            + HEURISTIC_WEIGHT * distance(last, end)
-            + district_cost
-            + near_wall_cost
+    if highway is None:
+        highway = a_star_grid(
+            start, end, cost_field.costs, HIGHWAY_STEPS, editor if is_debug else None
         )
 
-    # prefer 4 out neighbours, but will accept 2 out
-    def get_neighbours(point: ivec3) -> list[ivec3]:
-        neighbours: list[ivec3] = []
-
-        for direction in all_8:
-            direction_vector: ivec3 = vector(direction)
-
-            # First consider 4 out
-            neighbour: ivec3 = point + direction_vector * 4
-
-            if is_in_bounds(neighbour, map.world):
-                actual_neighbour_y = map.height[neighbour.x][neighbour.z]
-
-                if point.y < actual_neighbour_y - 2:
-                    neighbour.y = point.y + 2
-                elif point.y > actual_neighbour_y + 2:
-                    neighbour.y = point.y - 2
-                else:
-                    neighbour.y = actual_neighbour_y
-
-                if abs(point.y - neighbour.y) <= 2:
-                    neighbours.append(neighbour)
-                    continue
-
-            # Don't consider compounds for short jumps
-            if sum(direction_vector) >= 2:
-                continue
-
-            # Then consider 2 out
-            neighbour = point + direction_vector * 2
-
-            if is_in_bounds(neighbour, map.world):
-                neighbour.y = map.height[neighbour.x][neighbour.z]
-
-                if abs(point.y - neighbour.y) <= 2:
-                    neighbours.append(neighbour)
-                    continue
-
-        return neighbours
-
-    highway: list[ivec3] | None | str = None
-
-    if is_debug:
-        highway = a_star(start, end, get_neighbours, get_cost, editor)
-    else:
-        highway = a_star(start, end, get_neighbours, get_cost)
-
     if highway == COUNTER_LIMIT_EXCEEDED:
         print("Pathfinding took too long: Trying to route to the midpoint")
         midpoint: ivec3 = (start + end) / 2
 
-        part1: list[ivec3] | None | str = a_star(
-            start, midpoint, get_neighbours, get_cost
+        part1: list[ivec3] | None | str = a_star_grid(
+            start, midpoint, cost_field.costs, HIGHWAY_STEPS
         )
-        part2: list[ivec3] | None | str = a_star(
-            midpoint, end, get_neighbours, get_cost
+        part2: list[ivec3] | None | str = a_star_grid(
+            midpoint, end, cost_field.costs, HIGHWAY_STEPS
         )
 
         if (
@@ -181,10 +188,42 @@ def route_highway(start: ivec3, end: ivec3, map: Map, editor: Editor, is_debug=F
         ):
             return None
 
-        if type(part1) is not list[ivec3] or type(part2) is not list[ivec3]:
-            raise RuntimeError("Failed pathfinding here too!")
-
         part1.pop()
         return part1 + part2
 
     return highway
+
+
+# Routes highways from many starts into the same end with one search.
+# Each start is moved onto the end's lattice, paths run from start to end.
+def route_highways(
+    starts: list[ivec3],
+    end: ivec3,
+    map: Map,
+    cost_field: HighwayCostField | None = None,
+) -> list[list[ivec3] | None]:
+    if cost_field is None:
+        cost_field = HighwayCostField(map)
+
+    size_x, size_z = map.height.shape
+    end = ivec3(end.x, map.height[end.x][end.z], end.z)
+
+    aligned: list[ivec3] = []
+    for start in starts:
+        start = ivec3(*start)  # copy start
+
+        if start.x % 4 != end.x % 4:
+            start.x = (start.x - start.x % 4) + end.x % 4
+            if start.x >= size_x:
+                start.x -= 4
+
+        if start.z % 4 != end.z % 4:
+            start.z = (start.z - start.z % 4) + end.z % 4
+            if start.z >= size_z:
+                start.z -= 4
+
+        aligned.append(start)
+
+    field = FlowField(cost_field.costs, HIGHWAY_STEPS, [end], origins=aligned)
+
+    return [field.path_from(start) for start in aligned]
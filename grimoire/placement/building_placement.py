@@ -37,6 +37,7 @@ from ..palette import fix_block_name
 
 from ..core.maps import Map
 from ..palette import Palette
+from ..core.generator.profiler import profiled
 
 offsets = {
     z_minus: [ivec2(0, 0), ivec2(-1, 0)],
@@ -58,6 +59,7 @@ MAX_AVG_HEIGHT_DIFF = 4
 
 # Attempts to place a building at a point
 # returns True on success
+@profiled
 def place_building(
     editor: Editor,
     start_point: ivec2,
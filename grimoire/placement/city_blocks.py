@@ -13,6 +13,7 @@ from ..core.utils.vectors import point_3d, y_ivec3
 from ..core.maps import Map
 from ..core.maps import CITY_WALL, CITY_ROAD
 from ..placement.building_placement import place_building
+from ..core.generator.profiler import profiled
 
 
 EDGE_THICKNESS = 1
@@ -154,6 +155,7 @@ def merge_small_blocks(
     return blocks, block_map
 
 
+@profiled
 def place_buildings(
     editor: Editor,
     block: set[ivec2],
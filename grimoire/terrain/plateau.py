@@ -1,7 +1,7 @@
 from ..districts.district import District
 from gdpc import Editor, WorldSlice, Block
 from gdpc.vector_tools import ivec2, ivec3
-from ..terrain.set_height import set_height
+from ..terrain.set_height import set_heights
 
 DISTRICT_AVG_RATIO = (
     0.7  # the percent of the height that the districts average should influence
@@ -17,6 +17,15 @@ def plateau(
 ):
     print(f"Plateauing {district}")
 
+    size = world_slice.box.size
+    heights = plateau_heights(district, water_map, (size.x, size.z))
+    set_heights(heights, world_slice, editor)
+
+
+# the height each column of the district is plateaued to, blended towards its average
+def plateau_heights(
+    district: District, water_map: list[list[bool]], shape: tuple[int, int]
+) -> dict[tuple[int, int], int]:
     y_sum = 0.0
     count = 0.0
 
@@ -27,15 +36,16 @@ def plateau(
     y_avg = y_sum / count
     print(f"{district} has average height {y_avg}")
 
+    heights = {}
+
     for point in district.points:
-        if (
-            point.x > world_slice.box.size.x or point.z > world_slice.box.size.z
-        ):  # bounds check
+        if point.x > shape[0] or point.z > shape[1]:  # bounds check
             continue
 
         if water_map[point.x][point.z]:  # don't plateau water tiles
             continue
 
         y = round(DISTRICT_AVG_RATIO * y_avg + (1 - DISTRICT_AVG_RATIO) * point.y)
+        heights[point.x, point.z] = y
 
-        set_height(point.x, y, point.z, world_slice, editor)
+    return heights
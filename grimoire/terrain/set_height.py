@@ -2,18 +2,93 @@ from ..districts.district import District
 from gdpc import Editor, WorldSlice, Block
 from gdpc.vector_tools import ivec2, ivec3
 
+from ..core.utils.gdpc_compat import forget_cached
+
+FILL_MINIMUM = 2  # runs at least this tall are filled with a command
+
+# a vertical run of one block: x, z, the y it starts at, the y it ends before, the block
+Run = tuple[int, int, int, int, Block]
+
 
 def set_height(
     x: int, y: int, z: int, world_slice: WorldSlice, editor: Editor, replace_block=None
 ):
-    curr_y = world_slice.heightmaps["MOTION_BLOCKING_NO_LEAVES"][x][z]
-    block = replace_block or world_slice.getBlock((x, curr_y - 1, z))
+    set_heights({(x, z): y}, world_slice, editor, replace_block)
+
+
+# sets the ground of every column to its height, the new ground being the block
+# that was on top unless given a replace_block
+def set_heights(
+    heights: dict[tuple[int, int], int],
+    world_slice: WorldSlice,
+    editor: Editor,
+    replace_block: Block | None = None,
+):
+    place_runs(height_runs(heights, world_slice, replace_block), editor)
+
+
+# places each run, filling the tall ones with commands
+def place_runs(runs: list[Run], editor: Editor):
+    fills = 0
+
+    for x, z, y_begin, y_end, block in runs:
+        if y_end - y_begin < FILL_MINIMUM:
+            editor.placeBlock([(x, y, z) for y in range(y_begin, y_end)], block)
+            continue
+
+        fill_run(editor, x, z, y_begin, y_end, block)
+        fills += 1
+        # buffered fills are sent in one request, as many as the blocks would be
+        if fills % editor.bufferLimit == 0:
+            editor.flushBuffer()
+
+    # fills are sent after the blocks buffered with them, flushing them now keeps
+    # anything placed later from being filled over
+    if fills:
+        editor.flushBuffer()
+
+
+# the runs of blocks that change each column to its height
+def height_runs(
+    heights: dict[tuple[int, int], int],
+    world_slice: WorldSlice,
+    replace_block: Block | None = None,
+) -> list[Run]:
+    heightmap = world_slice.heightmaps["MOTION_BLOCKING_NO_LEAVES"]
+    runs: list[Run] = []
+
+    for (x, z), y in heights.items():
+        curr_y = int(heightmap[x][z])
+        block = replace_block or world_slice.getBlock((x, curr_y - 1, z))
+
+        if curr_y > y:
+            runs.append((x, z, y, curr_y, Block("air")))
+
+            # the surface is left alone when it's already the right block
+            below: Block = world_slice.getBlock((x, y - 1, z))
+            if (below.id, below.states) != (block.id, block.states) or block.data:
+                runs.append((x, z, y - 1, y, block))
+        elif curr_y < y:
+            runs.append((x, z, curr_y, y, block))
+
+    return runs
+
 
-    if curr_y > y:
-        for py in range(y, curr_y):
-            editor.placeBlock((x, py, z), Block("air"))
+# places block from y_begin up to y_end with a fill command, written into the
+# editor's overlay as if placed block by block
+def fill_run(editor: Editor, x: int, z: int, y_begin: int, y_end: int, block: Block):
+    begin = editor.transform * ivec3(x, y_begin, z)
+    end = editor.transform * ivec3(x, y_end - 1, z)
+    block = block.transformed(editor.transform.rotation, editor.transform.flip)
+    editor.runCommandGlobal(
+        f"fill {begin.x} {begin.y} {begin.z} {end.x} {end.y} {end.z} {block}",
+        syncWithBuffer=True,
+    )
 
-        editor.placeBlock((x, y - 1, z), block)
-    elif curr_y < y:
-        for py in range(curr_y, y):
-            editor.placeBlock((x, py, z), block)
+    overlay = getattr(editor, "overlay", None)
+    if overlay is not None:
+        overlay.fill_column(begin.x, begin.z, begin.y, end.y + 1, block)
+    # the cache would still hold what was there before the fill
+    forget_cached(
+        editor, (ivec3(begin.x, y, begin.z) for y in range(begin.y, end.y + 1))
+    )
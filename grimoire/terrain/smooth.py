@@ -1,7 +1,10 @@
+from typing import Iterable
+
+import numpy as np
 from ..districts.district import District
 from gdpc import Editor, WorldSlice
-from gdpc.vector_tools import ivec2, ivec3
-from ..terrain.set_height import set_height
+from gdpc.vector_tools import ivec2
+from ..terrain.set_height import set_heights
 from ..core.utils.bounds import is_in_bounds2d
 
 
@@ -13,26 +16,24 @@ def smooth(
     water_map: list[list[bool]],
 ):
     print(f"Smoothing {district}")
-    updated_heights = {}
-
-    for x, _, z in district.points:
-        key = x, z
-
-        # we don't want to flatten water tiles
-        if water_map[x][z]:
-            continue
 
-        updated_heights[key] = average_neighbour_height(x, z, world_slice)
+    # we don't want to flatten water tiles
+    columns = [(x, z) for x, _, z in district.points if not water_map[x][z]]
+    updated_heights = average_neighbour_heights(
+        columns, world_slice.heightmaps["MOTION_BLOCKING_NO_LEAVES"]
+    )
 
-    for key, y in updated_heights.items():
-        x, z = key
-        set_height(x, y, z, world_slice, editor)
+    set_heights(updated_heights, world_slice, editor)
 
 
 RANGE = 10
+FALLOFF = 0.8  # weight of a neighbour is FALLOFF**distance, distance being |dx| + |dz|
 NEIGHBOURS = [
     (x, z) for x in range(-RANGE, RANGE + 1) for z in range(-RANGE, RANGE + 1)
 ]
+# FALLOFF**(|dx| + |dz|) is FALLOFF**|dx| * FALLOFF**|dz|, so the window is
+# weighted by convolving with this along x and then along z
+KERNEL = FALLOFF ** np.abs(np.arange(-RANGE, RANGE + 1))
 
 
 def average_neighbour_height(x: int, z: int, world_slice: WorldSlice) -> int:
@@ -52,11 +53,48 @@ def average_neighbour_height(x: int, z: int, world_slice: WorldSlice) -> int:
     return round(height_sum / total_weight)
 
 
+# average_neighbour_height of every column at once, by convolving the heightmap
+# (MOTION_BLOCKING_NO_LEAVES, or heights planned from it) around them
+def average_neighbour_heights(
+    columns: Iterable[tuple[int, int]], heightmap: np.ndarray
+) -> dict[tuple[int, int], int]:
+    columns = list(columns)
+    if not columns:
+        return {}
+
+    xs, zs = np.array(columns).T
+
+    # only the columns' window is convolved, anything outside it is beyond RANGE of
+    # them or outside the world, where the weights are left out as they are above
+    x_begin, z_begin = max(xs.min() - RANGE, 0), max(zs.min() - RANGE, 0)
+    x_end = min(xs.max() + RANGE + 1, heightmap.shape[0])
+    z_end = min(zs.max() + RANGE + 1, heightmap.shape[1])
+    heights = heightmap[x_begin:x_end, z_begin:z_end].astype(np.float64)
+
+    height_sums = _convolve(_convolve(heights, 0), 1)
+    total_weights = np.outer(
+        _convolve(np.ones(heights.shape[0]), 0), _convolve(np.ones(heights.shape[1]), 0)
+    )
+
+    xs, zs = xs - x_begin, zs - z_begin
+    averages = np.round(height_sums[xs, zs] / total_weights[xs, zs]).astype(int)
+    return dict(zip(columns, averages.tolist()))
+
+
+# values weighted by KERNEL along axis, with nothing beyond the edges
+def _convolve(values: np.ndarray, axis: int) -> np.ndarray:
+    padding = [(0, 0)] * values.ndim
+    padding[axis] = (RANGE, RANGE)
+    padded = np.pad(values, padding)
+
+    size = values.shape[axis]
+    result = np.zeros(values.shape)
+    for offset, weight in enumerate(KERNEL):
+        result += weight * padded.take(range(offset, offset + size), axis=axis)
+
+    return result
+
+
 # updates the points set of a districts to be correct
 def update_district_points(district: District, world_slice: WorldSlice):
-    district.points.clear()
-
-    for x, z in district.points_2d:
-        y = world_slice.heightmaps["MOTION_BLOCKING_NO_LEAVES"][x][z]
-        point = ivec3(x, y, z)
-        district.points.add(point)
+    district.set_heights(world_slice.heightmaps["MOTION_BLOCKING_NO_LEAVES"])
@@ -2,9 +2,10 @@ import itertools
 from ..districts.district import District
 from gdpc import Editor, WorldSlice, Block
 from gdpc.vector_tools import ivec2, ivec3, Rect
-from ..terrain.set_height import set_height
-from ..terrain.smooth import average_neighbour_height, update_district_points
+from ..terrain.set_height import set_heights
+from ..terrain.smooth import average_neighbour_heights, update_district_points
 from ..core.utils.bounds import is_in_bounds2d
+from ..core.utils.overlay import refresh_world_slice
 
 DISTRICT_AVG_RATIO = (
     0.5  # the percent of the height that the districts average should influence
@@ -22,6 +23,24 @@ def smooth_edges(
 ):
     print("Smoothing edges")
 
+    size = world_slice.box.size
+    points = edge_columns(districts, water_map, (size.x, size.z))
+
+    heightmap = world_slice.heightmaps["MOTION_BLOCKING_NO_LEAVES"]
+    updated_heights = average_neighbour_heights(points, heightmap)
+
+    set_heights(updated_heights, world_slice, editor)
+
+    world_slice = refresh_world_slice(editor, build_rect)
+
+    for district in districts:
+        update_district_points(district, world_slice)
+
+
+# the columns around the edges of urban districts, which get smoothed
+def edge_columns(
+    districts: list[District], water_map: list[list[bool]], shape: tuple[int, int]
+) -> set[ivec2]:
     points = set()
 
     for district in districts:
@@ -35,12 +54,7 @@ def smooth_edges(
                 pt = ivec2(edge.x + dx, edge.z + dz)
 
                 # out of bounds
-                if (
-                    pt.x < 0
-                    or pt.y < 0
-                    or pt.x >= world_slice.box.size.x
-                    or pt.y >= world_slice.box.size.z
-                ):
+                if pt.x < 0 or pt.y < 0 or pt.x >= shape[0] or pt.y >= shape[1]:
                     continue
 
                 # don't smooth water tiles
@@ -50,20 +64,4 @@ def smooth_edges(
                 if pt not in points:
                     points.add(pt)
 
-    updated_heights = {}
-
-    for x, z in points:
-        key = x, z
-
-        updated_heights[key] = average_neighbour_height(x, z, world_slice)
-
-    for key, y in updated_heights.items():
-        x, z = key
-        set_height(x, y, z, world_slice, editor)
-
-    editor.flushBuffer()  # this is needed to reload the world slice properly
-    print("Reloading worldSlice")
-    world_slice = editor.loadWorldSlice(build_rect)
-
-    for district in districts:
-        update_district_points(district, world_slice)
+    return points
@@ -0,0 +1,58 @@
+import numpy as np
+from gdpc import Editor, WorldSlice
+from gdpc.vector_tools import Rect
+
+from ..core.utils.overlay import refresh_world_slice
+from ..districts.district import District
+from .plateau import plateau_heights
+from .set_height import set_heights
+from .smooth import average_neighbour_heights, update_district_points
+from .smooth_edges import edge_columns
+
+
+# the heights plateauing the urban districts and then smoothing their edges would
+# leave, worked out on a copy of the heightmap without touching the world
+def plan_terraform(
+    heightmap: np.ndarray, districts: list[District], water_map: list[list[bool]]
+) -> np.ndarray:
+    heights = np.array(heightmap)
+    shape = heights.shape
+
+    for district in districts:
+        if not district.is_urban:
+            continue
+
+        for (x, z), y in plateau_heights(district, water_map, shape).items():
+            heights[x, z] = y
+
+    edges = edge_columns(districts, water_map, shape)
+    for (x, z), y in average_neighbour_heights(edges, heights).items():
+        heights[x, z] = y
+
+    return heights
+
+
+# plateaus the urban districts and smooths their edges, as plateau and smooth_edges
+# would one after the other, writing only the final heights to the world
+def terraform(
+    build_rect: Rect,
+    districts: list[District],
+    world_slice: WorldSlice,
+    editor: Editor,
+    water_map: list[list[bool]],
+) -> WorldSlice:
+    print("Terraforming")
+
+    heightmap = world_slice.heightmaps["MOTION_BLOCKING_NO_LEAVES"]
+    planned = plan_terraform(heightmap, districts, water_map)
+
+    xs, zs = np.nonzero(planned != heightmap)
+    heights = dict(zip(zip(xs.tolist(), zs.tolist()), planned[xs, zs].tolist()))
+    set_heights(heights, world_slice, editor)
+
+    world_slice = refresh_world_slice(editor, build_rect)
+
+    for district in districts:
+        update_district_points(district, world_slice)
+
+    return world_slice
@@ -1,6 +1,12 @@
-from gdpc import Editor, Block
-from gdpc.vector_tools import ivec3
-import time
+from typing import Iterable
+
+import numpy as np
+from gdpc import Block, Editor, WorldSlice
+from gdpc.lookup import AIRS
+from gdpc.vector_tools import Rect
+
+from ..core.utils.sections import WorldSections, get_world_sections
+from .set_height import Run, place_runs
 
 TREE_LOGS = (
     "minecraft:acacia_log",
@@ -45,55 +51,60 @@ LEAF_BLOCKS = (
 TREE_AND_LEAF_BLOCKS = TREE_BLOCKS + LEAF_BLOCKS
 
 
-def log_stems(editor, build_rect, world_slice):
-    for x in range(build_rect.size.x):
-        for z in range(build_rect.size.y):
-            y1 = world_slice.heightmaps["MOTION_BLOCKING_NO_LEAVES"][x][z] - 1
-            check_pos = ivec3(x, y1, z)
-            block_name = world_slice.getBlock(check_pos).id
-
-            if block_name not in TREE_BLOCKS:
-                continue
-            editor.placeBlock(check_pos, Block("minecraft:air"))
-            for y in range(40):
-                check_pos = ivec3(x, y1, z) - ivec3(0, y, 0)
-                block_name = world_slice.getBlock(check_pos).id
-
-                if block_name in TREE_BLOCKS:
-                    # print(block_name)
-                    editor.placeBlock(check_pos, Block("minecraft:air"))
-                elif block_name == "minecraft:dirt":
-                    editor.placeBlock(check_pos, Block("minecraft:grass_block"))
-                    continue
-
-                # only continue checking down if its still air and hasn't been caught by the above
-                elif block_name != "minecraft:air":
-                    continue
-
-
-def log_trees(editor, build_rect, world_slice):
-    for x in range(build_rect.size.x):
-        for z in range(build_rect.size.y):
-            y1 = world_slice.heightmaps["MOTION_BLOCKING"][x][z] - 1
-            check_pos = ivec3(x, y1, z)
-            block_name = world_slice.getBlock(check_pos).id
-
-            if block_name not in TREE_AND_LEAF_BLOCKS:
-                continue
-            editor.placeBlock(check_pos, Block("minecraft:air"))
-            for y in range(40):
-                check_pos = ivec3(x, y1, z) - ivec3(0, y, 0)
-                block_name = world_slice.getBlock(check_pos).id
-
-                if block_name in TREE_AND_LEAF_BLOCKS:
-                    # print(block_name)
-                    editor.placeBlock(check_pos, Block("minecraft:air"))
-                elif block_name == "minecraft:dirt":
-                    editor.placeBlock(check_pos, Block("minecraft:grass_block"))
-                    continue
-
-                elif block_name != "minecraft:air":
-                    continue
+def log_stems(editor: Editor, build_rect: Rect, world_slice: WorldSlice):
+    clear_columns(editor, world_slice, "MOTION_BLOCKING_NO_LEAVES", TREE_BLOCKS)
+
+
+def log_trees(editor: Editor, build_rect: Rect, world_slice: WorldSlice):
+    clear_columns(editor, world_slice, "MOTION_BLOCKING", TREE_AND_LEAF_BLOCKS)
+
+
+# clears every column from below the heightmap down to its ground, the highest block
+# that's neither air nor one of names, if there's any of names in the way. Dirt left
+# on top is turned to grass. The blocks come from the section palettes a chunk at a
+# time and the clearing is sent as one run per column, through the editor's overlay
+# when it has one so the world slice and its heightmaps don't need reloading
+def clear_columns(
+    editor: Editor, world_slice: WorldSlice, heightmap_name: str, names: Iterable[str]
+):
+    sections: WorldSections = get_world_sections(world_slice)
+    heightmap: np.ndarray = world_slice.heightmaps[heightmap_name]
+    is_tree: np.ndarray = sections.block_lookup(names)
+    is_clearable: np.ndarray = is_tree | sections.block_lookup(AIRS)
+    is_dirt: np.ndarray = sections.block_lookup(("minecraft:dirt",))
+
+    runs: list[Run] = []
+
+    for chunk_x, chunk_z, xs, zs, local_xs, local_zs in sections.chunks():
+        heights: np.ndarray = heightmap[xs, zs]
+
+        if heights.size == 0:
+            continue
+
+        band, y_begin, ground = sections.ground_band(
+            chunk_x, chunk_z, local_xs, local_zs, heights, ~is_clearable
+        )
+
+        y_index = np.arange(band.shape[1])[None, :, None]
+        in_trees = (y_index >= (ground - y_begin)[:, None, :]) & (
+            y_index < (heights - y_begin)[:, None, :]
+        )
+        has_tree = (is_tree[band] & in_trees).any(axis=1)
+
+        highest_ground = np.maximum(ground - y_begin - 1, 0)
+        on_dirt = (ground > y_begin) & is_dirt[
+            np.take_along_axis(band, highest_ground[:, None, :], axis=1)[:, 0, :]
+        ]
+
+        for x, z in zip(*np.nonzero(has_tree)):
+            column_x, column_z = xs.start + int(x), zs.start + int(z)
+            y = int(ground[x, z])
+
+            runs.append((column_x, column_z, y, int(heights[x, z]), Block("air")))
+            if on_dirt[x, z]:
+                runs.append((column_x, column_z, y - 1, y, Block("grass_block")))
+
+    place_runs(runs, editor)
 
 
 # requires player to fly around to allow minecraft to clear all the foliage, and then set gamerule randomtickspeed to something normal. Still much quicker to clear trees
@@ -0,0 +1,50 @@
+import numpy as np
+from gdpc import Block
+from gdpc.vector_tools import ivec3
+
+WOOD = "wood"  # stand-in for the wood the generators are given, swapped when stamped
+LEAF = "leaf"  # stand-in for the leaves
+
+
+class TreeTemplate:
+    """
+    A tree's blocks as offsets from where it's planted, recorded once by running its
+    generator and stamped wherever a tree of its shape is planted.
+    Blocks are kept in the order they were placed, later ones overwriting earlier ones,
+    and those placed with a chance are rolled again for every stamp.
+    """
+
+    offsets: np.ndarray  # (n, 3) offsets from the planted point
+    is_leaf: np.ndarray  # whether each block is a leaf rather than wood
+    chances: np.ndarray  # percent chance each block is placed
+
+    def __init__(self) -> None:
+        self.__blocks: list[tuple[int, int, int, bool, int]] = []
+        self.offsets = np.zeros((0, 3), dtype=np.int32)
+        self.is_leaf = np.zeros(0, dtype=bool)
+        self.chances = np.zeros(0, dtype=np.int8)
+
+    # records a block placed by a generator planting at the origin
+    def add(self, x: int, y: int, z: int, block: Block, chance: int = 100) -> None:
+        self.__blocks.append((x, y, z, block.id == LEAF, chance))
+
+    # packs the recorded blocks into arrays, once the generator is done
+    def finish(self) -> "TreeTemplate":
+        if self.__blocks:
+            xs, ys, zs, is_leaf, chances = zip(*self.__blocks)
+            self.offsets = np.array([xs, ys, zs], dtype=np.int32).T
+            self.is_leaf = np.array(is_leaf, dtype=bool)
+            self.chances = np.array(chances, dtype=np.int8)
+        self.__blocks = []
+        return self
+
+    # the blocks of the tree planted at point, each position with the name of its block
+    def stamp(
+        self, point: ivec3, wood: str, leaf: str, seed: int
+    ) -> list[tuple[tuple[int, int, int], str]]:
+        rolls = np.random.default_rng(seed).integers(1, 101, len(self.chances))
+        kept = rolls <= self.chances
+
+        positions = (self.offsets[kept] + (point.x, point.y, point.z)).tolist()
+        names = np.where(self.is_leaf[kept], leaf, wood).tolist()
+        return list(zip(map(tuple, positions), names))
@@ -3,10 +3,11 @@ import sys
 
 sys.path[0] = sys.path[0].removesuffix("tests\\districts")
 
-from gdpc import Block, Editor
+from gdpc import Block
 from gdpc.lookup import GRANULARS
 from gdpc.vector_tools import ivec2
 
+from grimoire.core.utils.backpressure import ThrottledEditor
 from grimoire.core.assets.load_assets import load_assets
 from grimoire.core.maps import Map, get_build_map, get_water_map
 from grimoire.core.noise.random import choose_weighted
@@ -18,7 +19,7 @@ from grimoire.terrain.forest import Forest
 
 SEED = 2
 
-editor = Editor(buffering=True, caching=True)
+editor = ThrottledEditor(buffering=True, caching=True)
 
 area = editor.getBuildArea()
 print(area)
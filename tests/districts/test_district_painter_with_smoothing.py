@@ -3,9 +3,9 @@ import sys
 
 sys.path[0] = sys.path[0].removesuffix("tests\\districts")
 
-from gdpc import Editor
 from gdpc.lookup import GRANULARS
 from gdpc.vector_tools import ivec2
+from grimoire.core.utils.backpressure import ThrottledEditor
 from grimoire.core.maps import get_build_map, get_water_map
 from grimoire.core.noise.rng import RNG
 from grimoire.districts.district_painter import plant_forest, replace_ground_smooth
@@ -15,7 +15,7 @@ from grimoire.terrain.smooth_edges import smooth_edges
 
 SEED = 2
 
-editor = Editor(buffering=True, caching=True)
+editor = ThrottledEditor(buffering=True, caching=True)
 
 area = editor.getBuildArea()
 print(area)
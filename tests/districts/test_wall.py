@@ -4,8 +4,9 @@ import sys
 
 sys.path[0] = sys.path[0].removesuffix("tests\\districts")
 
-from gdpc import Editor, Block
+from gdpc import Block
 from gdpc.vector_tools import ivec2
+from grimoire.core.utils.backpressure import ThrottledEditor
 from grimoire.core.maps import get_water_map
 from grimoire.districts.generate_districts import generate_districts
 from grimoire.core.utils.geometry import get_outer_points
@@ -16,7 +17,7 @@ from grimoire.core.assets.load_assets import load_assets
 
 SEED = 7
 
-editor = Editor(buffering=True, caching=True)
+editor = ThrottledEditor(buffering=True, caching=True)
 # editor.doBlockUpdates(value = False)
 load_assets("assets")
 
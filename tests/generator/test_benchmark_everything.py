@@ -0,0 +1,101 @@
+# Allows code to be run in root directory
+import sys
+
+sys.path[0] = sys.path[0].removesuffix("\\tests\\generator")
+
+# Actual file
+import json
+import runpy
+import subprocess
+from pathlib import Path
+
+from grimoire.core.generator.benchmarking import Benchmark, find_regressions
+from grimoire.core.generator.profiler import Profiler
+from grimoire.core.utils.instrumented import EditorStats
+from grimoire.core.utils.offline import (
+    DEFAULT_PORT,
+    OfflineWorld,
+    serve_world,
+)
+from grimoire.core.utils.snapshots import save_snapshot
+from tests.synthetic_worlds import SEED, STYLE, synthetic_world
+
+# Runs test_everything against offline synthetic worlds of several sizes and writes
+# how long each of its stages took to benchmarks/<commit>.json, with a speedscope
+# profile of every run beside it (open them at https://www.speedscope.app).
+# Give it an earlier results file to flag the stages that got slower:
+#   python tests/generator/test_benchmark_everything.py benchmarks/<commit>.json
+
+SIZES = [128, 256, 512]  # test_everything shrinks anything over 1000 to 350
+PIPELINE = Path("tests/placement/test_everything.py")
+RESULTS_DIRECTORY = Path("benchmarks")
+
+
+def current_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+# the editor's reads, writes and cache hit rate over a stage
+def editor_summary(editor: dict | None) -> str:
+    if editor is None:
+        return ""
+
+    hit_rate = editor["cache_hit_rate"]
+    return (
+        f" {editor['reads']:8} reads {editor['writes']:8} writes "
+        + ("    -" if hit_rate is None else f"{hit_rate:5.0%}")
+        + " cached"
+    )
+
+
+commit = current_commit()
+RESULTS_DIRECTORY.mkdir(exist_ok=True)
+results: dict[str, list[dict]] = {}
+Profiler.enabled = True
+Profiler.record_events = True  # kept for the speedscope profiles
+
+for size in SIZES:
+    world = OfflineWorld(synthetic_world(size))
+    # test_everything loads the latest snapshot of its area, make it this world
+    save_snapshot(world.world_slice, "initial")
+
+    Benchmark.count_with(lambda: (len(world.placed), world.requests.total()))
+    with serve_world(world, DEFAULT_PORT):
+        runpy.run_path(str(PIPELINE), run_name="__main__")
+    Benchmark.count_with(None)
+
+    run = f"{STYLE} {size}x{size}"
+    results[run] = Benchmark.take_stages()
+    Profiler.export_speedscope(
+        RESULTS_DIRECTORY / f"{commit}-{STYLE}-{size}.speedscope.json"
+    )
+    Profiler.reset()
+    EditorStats.reset()
+
+    print(f"{run}:")
+    for stage in results[run]:
+        print(
+            f"  {stage['name']:16} {stage['wall_time']:7.2f}s wall "
+            f"{stage['cpu_time']:7.2f}s cpu {stage['blocks_placed']:8} blocks "
+            f"{stage['http_requests']:6} requests" + editor_summary(stage["editor"])
+        )
+
+path = RESULTS_DIRECTORY / f"{commit}.json"
+path.write_text(json.dumps({"commit": commit, "seed": SEED, "runs": results}, indent=2))
+print(f"Results written to {path}")
+
+if len(sys.argv) > 1:
+    baseline = json.loads(Path(sys.argv[1]).read_text())
+    regressions = find_regressions(baseline["runs"], results)
+
+    print(f"{len(regressions)} regressions against {baseline['commit']}")
+    for regression in regressions:
+        print(f"  {regression}")
@@ -0,0 +1,38 @@
+# Allows code to be run in root directory
+import sys
+
+sys.path[0] = sys.path[0].removesuffix("\\tests\\maps")
+
+# Actual file
+import time
+import tracemalloc
+
+from grimoire.core.generator.benchmarking import peak_rss_mb
+from grimoire.core.maps import Map
+from tests.synthetic_worlds import synthetic_world
+
+# How long building a Map takes and how much memory it uses as the world grows
+
+SIZES = [256, 512, 1024]
+
+
+for size in SIZES:
+    world_slice = synthetic_world(size)
+
+    tracemalloc.start()
+    start_time = time.perf_counter()
+
+    world_map = Map(world_slice)
+
+    time_elapsed = time.perf_counter() - start_time
+    _, traced_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    rss = peak_rss_mb()
+    print(
+        f"{size}x{size}: Map built in {time_elapsed:.2f}s, "
+        f"peak allocation {traced_peak / 2**20:.1f} MB, "
+        f"peak RSS {'n/a' if rss is None else f'{rss:.0f} MB'}"
+    )
+
+    del world_map, world_slice
@@ -0,0 +1,115 @@
+# Allows code to be run in root directory
+import sys
+
+sys.path[0] = sys.path[0].removesuffix("\\tests\\maps")
+
+# Actual file
+import time
+
+from gdpc.vector_tools import ivec3
+
+from grimoire.core.assets.load_assets import load_assets
+from grimoire.core.maps import Map
+from grimoire.core.noise.rng import RNG
+from grimoire.core.utils.offline import OfflineWorld
+from grimoire.districts.district import DistrictType
+from grimoire.districts.district_analyze import (
+    analyze_districts,
+    district_classification,
+    super_district_classification,
+)
+from grimoire.districts.generate_districts import generate_districts
+from grimoire.palette import Palette
+from grimoire.paths.route_highway import HighwayCostField, route_highways
+from grimoire.placement.city_blocks import add_city_blocks
+from tests.synthetic_worlds import SEED, STYLE, offline_editor, synthetic_world
+
+# How long the map, districts, highways and city blocks take as the world grows,
+# and how many blocks they place. The districts are classified as in test_everything,
+# without urban districts there would be no city blocks to time
+
+SIZES = [128, 256, 512, 1024, 2048]
+
+
+def timed(timings: dict[str, float], stage: str, function, *args, **kwargs):
+    start_time = time.perf_counter()
+    result = function(*args, **kwargs)
+    timings[stage] = time.perf_counter() - start_time
+    return result
+
+
+def route_all_highways(districts, map: Map) -> None:
+    cost_field = HighwayCostField(map)
+
+    for district in districts:
+        others = [other for other in district.adjacency if other.id > district.id]
+        if not others:
+            continue
+
+        end = ivec3(district.average().x, 0, district.average().z)
+        starts = [ivec3(other.average().x, 0, other.average().z) for other in others]
+        route_highways(starts, end, map, cost_field=cost_field)
+
+
+# nothing else turns the districts classified urban into is_urban ones, which are
+# the only ones add_city_blocks builds on
+def classify(districts, super_districts, main_map: Map) -> None:
+    analyze_districts(super_districts, main_map)
+    district_classification(districts)
+    super_district_classification(super_districts)
+
+    for district in districts:
+        district.is_urban = district.type == DistrictType.URBAN
+
+
+# three palettes of the city blocks' style for every district, as in test_everything
+def give_palettes(districts, style: str = "japanese") -> None:
+    eligible_palettes = [palette for palette in Palette.all() if style in palette.tags]
+    rng = RNG(SEED, "palettes")
+
+    for district in districts:
+        palettes = eligible_palettes.copy()
+
+        for _ in range(min(3, len(eligible_palettes))):
+            district.palettes.append(rng.pop(palettes))
+
+
+load_assets("grimoire/asset_data")  # the buildings city blocks are filled with
+
+for size in SIZES:
+    timings: dict[str, float] = {}
+    world = OfflineWorld(timed(timings, "world", synthetic_world, size))
+    world_slice = world.world_slice
+    build_rect = world_slice.rect
+
+    with offline_editor(world) as editor:
+        main_map = timed(timings, "map", Map, world_slice)
+        districts, district_map, super_districts, _ = timed(
+            timings,
+            "districts",
+            generate_districts,
+            SEED,
+            build_rect,
+            world_slice,
+            main_map,
+        )
+        main_map.districts = district_map
+
+        timed(timings, "highways", route_all_highways, super_districts, main_map)
+        timed(timings, "classification", classify, districts, super_districts, main_map)
+        give_palettes(districts)
+        timed(
+            timings, "city blocks", add_city_blocks, editor, districts, main_map, SEED
+        )
+        timed(timings, "flush", editor.flushBuffer)
+
+    if not world.placed:
+        print(
+            f"{STYLE} {size}x{size}: no city blocks were placed, the stage did nothing"
+        )
+
+    print(
+        f"{STYLE} {size}x{size}: "
+        + ", ".join(f"{stage} {seconds:.2f}s" for stage, seconds in timings.items())
+        + f", {len(world.placed)} blocks placed"
+    )
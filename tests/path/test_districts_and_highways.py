@@ -7,7 +7,12 @@ sys.path[0] = sys.path[0].removesuffix("\\tests\\path")
 from gdpc import Editor
 from gdpc.vector_tools import ivec2, ivec3
 from grimoire.districts.generate_districts import generate_districts
-from grimoire.paths.route_highway import route_highway, fill_out_highway
+from grimoire.paths.route_highway import (
+    HighwayCostField,
+    fill_out_highway,
+    route_highway,
+    route_highways,
+)
 from grimoire.paths.build_highway import build_highway
 from grimoire.terrain.plateau import plateau
 from grimoire.terrain.smooth_edges import smooth_edges
@@ -55,30 +60,45 @@ world_slice = editor.loadWorldSlice(build_rect)
 
 # draw_districts(districts, build_rect, district_map, water_map, world_slice, editor)
 
+cost_field = HighwayCostField(map)  # shared by every highway below
+
+# every district routes all of its highways in one search, grown out from its centre.
+# Set DEBUG to route them one pair at a time instead, drawing the columns searched.
+DEBUG = False
+
 for district in districts:
-    for other in district.adjacency:
-        if other.id < district.id:
-            continue
+    others = [other for other in district.adjacency if other.id > district.id]
+    if not others:
+        continue
 
-        point_a = ivec3(
-            district.average().x,
-            world_slice.heightmaps["MOTION_BLOCKING_NO_LEAVES"][district.average().x][
-                district.average().z
-            ],
-            district.average().z,
-        )
-
-        point_b = ivec3(
-            (other.average().x - other.average().x % 4) + (district.average().x % 4),
-            0,
-            (other.average().z - other.average().z % 4) + (district.average().z % 4),
-        )
-        point_b.y = world_slice.heightmaps["MOTION_BLOCKING_NO_LEAVES"][point_b.x][
-            point_b.z
+    centre = ivec3(
+        district.average().x,
+        world_slice.heightmaps["MOTION_BLOCKING_NO_LEAVES"][district.average().x][
+            district.average().z
+        ],
+        district.average().z,
+    )
+    starts = [ivec3(other.average().x, 0, other.average().z) for other in others]
+
+    if DEBUG:
+        highways = [
+            route_highway(
+                centre, start, map, editor, is_debug=True, cost_field=cost_field
+            )
+            for start in starts
         ]
+    else:
+        # paths run from each neighbour into the centre, turned around to leave from it
+        highways = [
+            None if highway is None else highway[::-1]
+            for highway in route_highways(starts, centre, map, cost_field=cost_field)
+        ]
+
+    for highway in highways:
+        if highway is None:
+            continue
 
-        highway = route_highway(point_a, point_b, map, editor, is_debug=True)
         highway = fill_out_highway(highway)
         build_highway(highway, editor, world_slice, map)
 
-        world_slice = editor.loadWorldSlice(build_rect)
+    world_slice = editor.loadWorldSlice(build_rect)
@@ -0,0 +1,112 @@
+# Allows code to be run in root directory
+import sys
+
+sys.path[0] = sys.path[0].removesuffix("\\tests\\path")
+
+# Actual file
+import time
+
+import numpy as np
+from gdpc.vector_tools import ivec3
+
+from grimoire.paths.a_star import GridCosts, SearchStats, a_star_grid
+from grimoire.paths.hierarchical_a_star import HierarchicalPathfinder
+from grimoire.paths.route_highway import (
+    BASE_LENGTH_COST,
+    HEIGHT_COST,
+    HEURISTIC_WEIGHT,
+    HIGHWAY_STEPS,
+    MAX_CLIMB,
+    WATER_COST,
+    Y_DIFF_COST,
+)
+
+# Compares the nodes expanded, time taken and path costs of flat and hierarchical
+# highway routing between random points of rolling hills with lakes
+
+SEED = 36322
+SIZES = [256, 512, 1024]
+ROUTES = 5
+SMOOTHING = 5  # box blur passes over the random heights
+
+
+# rolling hills with lakes in the valleys
+def synthetic_costs(size: int, rng: np.random.Generator) -> GridCosts:
+    height = rng.normal(0, 40, (size // 8 + 2, size // 8 + 2))
+    height = height.repeat(8, 0).repeat(8, 1)[:size, :size]
+
+    for _ in range(SMOOTHING):
+        height = (
+            height
+            + np.roll(height, 3, 0)
+            + np.roll(height, -3, 0)
+            + np.roll(height, 3, 1)
+            + np.roll(height, -3, 1)
+        ) / 5
+
+    height = (height + 80).astype(np.int64)
+    water = height < np.percentile(height, 15)
+
+    return GridCosts(
+        height=height,
+        node_cost=WATER_COST * water.astype(np.float64),
+        step_cost=BASE_LENGTH_COST,
+        height_weight=HEIGHT_COST,
+        climb_weight=Y_DIFF_COST,
+        heuristic_weight=HEURISTIC_WEIGHT,
+        max_climb=MAX_CLIMB,
+    )
+
+
+def random_point(costs: GridCosts, rng: np.random.Generator) -> ivec3:
+    size = costs.height.shape[0]
+    x, z = (int(value) * 4 for value in rng.integers(0, size // 4, 2))
+    return ivec3(x, int(costs.height[x, z]), z)
+
+
+rng = np.random.default_rng(SEED)
+
+for size in SIZES:
+    costs = synthetic_costs(size, rng)
+    routes = [
+        (random_point(costs, rng), random_point(costs, rng)) for _ in range(ROUTES)
+    ]
+
+    flat_stats = SearchStats()
+    flat_costs = []
+    begin = time.perf_counter()
+    for start, end in routes:
+        route_stats = SearchStats()
+        if isinstance(
+            a_star_grid(start, end, costs, HIGHWAY_STEPS, stats=route_stats), list
+        ):
+            flat_stats.expanded += route_stats.expanded
+            flat_costs.append(route_stats.cost)
+        else:
+            flat_costs.append(None)
+    flat_time = time.perf_counter() - begin
+
+    hierarchy = HierarchicalPathfinder(costs, HIGHWAY_STEPS)
+    cost_ratios = []
+
+    # the first pass links the clusters it passes through, the second reuses them
+    times = []
+    for _ in range(2):
+        hierarchy.stats = SearchStats()
+        begin = time.perf_counter()
+        for (start, end), flat_cost in zip(routes, flat_costs):
+            path = hierarchy.find_path(start, end)
+            if path is not None and flat_cost is not None:
+                cost_ratios.append(hierarchy.stats.cost / flat_cost)
+        times.append(time.perf_counter() - begin)
+
+    print(f"{size}x{size}, {ROUTES} routes:")
+    print(f"  flat:         {flat_stats.expanded:>9} expanded, {flat_time:.2f}s")
+    print(
+        f"  hierarchical: {hierarchy.stats.expanded:>9} expanded, {times[1]:.2f}s"
+        f" ({times[0]:.2f}s and {hierarchy.build_stats.expanded} expanded linking clusters)"
+    )
+    if cost_ratios:
+        print(
+            f"  path cost {np.mean(cost_ratios):.3f}x flat on average, {max(cost_ratios):.3f}x at worst"
+        )
@@ -6,10 +6,11 @@ from grimoire.districts.gate import Gate
 sys.path[0] = sys.path[0].removesuffix("tests\\placement")
 
 # Actual file
-from gdpc import Block, Editor
+from gdpc import Block
 from gdpc.geometry import line3D
 from gdpc.vector_tools import ivec2
 
+from grimoire.core.utils.backpressure import ThrottledEditor
 from grimoire.core.assets.load_assets import load_assets
 from grimoire.core.maps import BUILDING, GATE, Map
 from grimoire.core.noise.rng import RNG
@@ -21,7 +22,11 @@ from grimoire.districts.generate_districts import generate_districts
 from grimoire.districts.wall import build_wall_standard_with_inner, order_wall_points
 from grimoire.palette import Palette
 from grimoire.paths.build_highway import build_highway
-from grimoire.paths.route_highway import fill_out_highway, route_highway
+from grimoire.paths.route_highway import (
+    HighwayCostField,
+    fill_out_highway,
+    route_highway,
+)
 from grimoire.placement.city_blocks import add_city_blocks
 from grimoire.terrain.plateau import plateau
 from grimoire.terrain.smooth_edges import smooth_edges
@@ -29,7 +34,7 @@ from grimoire.terrain.smooth_edges import smooth_edges
 SEED = 77273
 DO_TERRAFORMING = False
 
-editor = Editor(buffering=True, caching=True)
+editor = ThrottledEditor(buffering=True, caching=True)
 load_assets("assets")
 
 area = editor.getBuildArea()
@@ -164,6 +169,7 @@ for wall_points in wall_points_list:
 # gates = build_wall_standard(wall_points, wall_dict, inner_points, editor, map.world, map.water, palette)
 
 world_map._calculate_near_wall(districts)
+cost_field = HighwayCostField(world_map)  # shared by every highway below
 
 for gate in gates:
     size = ivec2(12, 12)
@@ -190,7 +196,9 @@ for gate in gates:
         for point in line3D(d_mid + y_ivec3(30), route_start + y_ivec3(30)):
             editor.placeBlock(point, Block("red_wool"))
 
-        route = route_highway(route_start, d_mid, world_map, editor, is_debug=False)
+        route = route_highway(
+            route_start, d_mid, world_map, editor, is_debug=False, cost_field=cost_field
+        )
 
         if route is None:
             continue
@@ -200,7 +208,12 @@ for gate in gates:
 
         # final connection
         route = route_highway(
-            gate.location, route_start, world_map, editor, is_debug=False
+            gate.location,
+            route_start,
+            world_map,
+            editor,
+            is_debug=False,
+            cost_field=cost_field,
         )
         route = fill_out_highway(route)
         build_highway(route, editor, world_map.world, world_map)
@@ -1,17 +1,20 @@
 # Allows code to be run in root directory
 import sys
-import time
 
 sys.path[0] = sys.path[0].removesuffix("\\tests\\placement")
 
 # Actual file
-from gdpc import Box, Editor
+from gdpc import Box
 from gdpc.lookup import GRANULARS
 from glm import ivec2
 
 from grimoire.core.assets.load_assets import load_assets
+from grimoire.core.generator.benchmarking import Benchmark
 from grimoire.core.maps import Map, get_build_map
 from grimoire.core.noise.rng import RNG
+from grimoire.core.utils.instrumented import EditorStats, InstrumentedEditor
+from grimoire.core.utils.overlay import WorldOverlay
+from grimoire.core.utils.snapshots import load_world_slice
 from grimoire.districts.district import District, DistrictType, SuperDistrict
 from grimoire.core.utils.sets.find_outer_points import find_outer_and_inner_points
 from grimoire.districts.district_painter import (
@@ -21,7 +24,7 @@ from grimoire.districts.district_painter import (
 )
 from grimoire.districts.generate_districts import generate_districts
 from grimoire.districts.district_analyze import (
-    district_analyze,
+    analyze_districts,
     district_classification,
     super_district_classification,
 )
@@ -36,15 +39,15 @@ from grimoire.industries.industry import get_district_biomes
 from grimoire.palette import Palette
 from grimoire.placement.city_blocks import add_city_blocks
 from grimoire.terrain.forest import Forest
-from grimoire.terrain.plateau import plateau
-from grimoire.terrain.smooth_edges import smooth_edges
+from grimoire.terrain.terraform import terraform
 from grimoire.terrain.tree_cutter import log_trees
 
 SEED = 0x4473
 DO_TERRAFORMING = True  # Set this to true for the final iteration
 LOG_TRESS = True
+REFRESH_SNAPSHOT = False  # Set this to true to download the world again
 
-editor = Editor(buffering=True, caching=True)
+editor = InstrumentedEditor(buffering=True, caching=True)
 load_assets("grimoire/asset_data")
 
 area = editor.getBuildArea()
@@ -59,26 +62,31 @@ area = editor.getBuildArea()
 
 editor.transform = (area.begin.x, 0, area.begin.z)
 
+Benchmark.start_stage("load world")
 print("Loading world slice...")
 build_rect = area.toRect()
-world_slice = editor.loadWorldSlice(build_rect)
+# the untouched world is kept on disk, so later runs over the same area skip the download
+world_slice = load_world_slice(editor, build_rect, refresh=REFRESH_SNAPSHOT)
 print("World slice loaded!")
 
+# what the editor places is written into the world slice too, so it never needs reloading
+editor.overlay = WorldOverlay(world_slice)
+world_slice = editor.overlay.world_slice
+
+Benchmark.start_stage("log trees")
 if LOG_TRESS:  # TO DO, only log urban
     log_trees(editor, build_rect, world_slice)
 
-editor.flushBuffer()  # this is needed to reload the world slice properly
-print("Reloading world slice...")
-build_rect = area.toRect()
-world_slice = editor.loadWorldSlice(build_rect)
-print("World slice reloaded!")
-
+Benchmark.start_stage("map")
 main_map = Map(world_slice)
+
+Benchmark.start_stage("districts")
 districts, district_map, super_districts, super_district_map = generate_districts(
     SEED, build_rect, world_slice, main_map
 )
 main_map.districts = district_map
 
+Benchmark.start_stage("styles")
 styles = [
     "japanese",  # I think this is the strongest one, so probably used in most environments
     "viking",  # Pretty weak I think so we could avoid, but we can story it
@@ -133,40 +141,21 @@ for district in districts:
     for _ in range(min(3, len(eligible_palettes))):
         district.palettes.append(rng.pop(palettes))
 
+Benchmark.start_stage("terraforming")
 # plateau stuff
 if DO_TERRAFORMING:  # think about terraforming deal with districts/superdistricts
-    print("starting plateauing")
-    for district in districts:
-        if not district.is_urban:
-            continue
-
-        plateau(district, district_map, world_slice, editor, main_map.water)
-
-    editor.flushBuffer()  # this is needed to reload the world slice properly
-    print("Reloading worldSlice")
-    world_slice = editor.loadWorldSlice(build_rect)
-    main_map.world = world_slice
-
-    smooth_edges(
-        build_rect, districts, district_map, world_slice, editor, main_map.water
-    )
-
-    editor.flushBuffer()  # this is needed to reload the world slice properly
-    print("Reloading worldSlice")
-    world_slice = editor.loadWorldSlice(build_rect)
+    world_slice = terraform(build_rect, districts, world_slice, editor, main_map.water)
     main_map.world = world_slice
     main_map.correct_district_heights(districts)
 # done
 
-print("sleepy time to reduce http traffic")
-time.sleep(10)  # to try to reduce http traffic, we'll do a little sleepy time
-
-for district in super_districts:
-    district_analyze(district, main_map)
+Benchmark.start_stage("classification")
+analyze_districts(super_districts, main_map)
 
 district_classification(districts)
 super_district_classification(super_districts)
 
+Benchmark.start_stage("wall points")
 inner_points = []
 
 
@@ -185,6 +174,7 @@ wall_points_list = order_wall_points(wall_points, wall_dict)
 rng = RNG(SEED)
 palette = rng.choose(eligible_palettes)
 
+Benchmark.start_stage("urban ground")
 build_map = get_build_map(world_slice, 20)
 
 # FIXME: Not guaranteed to find the "urban_road" PaintPalette!
@@ -212,12 +202,14 @@ replace_ground_smooth(
 #     y = world_slice.heightmaps['MOTION_BLOCKING_NO_LEAVES'][x][z] + 10
 #     editor.placeBlock((x, y, z), Block('sea_lantern'))
 
+Benchmark.start_stage("city blocks")
 add_city_blocks(editor, districts, main_map, SEED, style=style, is_debug=False)
 
 # WALL
 
 # uncomment one of these to story one of the three wall types
 
+Benchmark.start_stage("wall")
 for wall_points in wall_points_list:
     build_wall_standard_with_inner(
         wall_points,
@@ -232,6 +224,7 @@ for wall_points in wall_points_list:
 # build_wall_palisade(wall_points, editor, map.world, map.water, rng, palette)
 # build_wall_standard(wall_points, wall_dict, inner_points, editor, map.world, map.water, palette)
 
+Benchmark.start_stage("rural districts")
 ignore_blocks = GRANULARS | {
     "minecraft:stone",
     "minecraft:copper_ore",
@@ -303,4 +296,8 @@ for super_district in super_districts:
         else:
             continue
 
-        time.sleep(5)  # to try to reduce http traffic, we'll do a little sleepy time
+Benchmark.start_stage("flush")
+editor.flushBuffer()
+Benchmark.end_stage()
+
+EditorStats.print_results()
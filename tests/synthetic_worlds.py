@@ -0,0 +1,35 @@
+from contextlib import contextmanager
+from typing import Iterator
+
+from gdpc import Editor, WorldSlice
+from gdpc.vector_tools import Rect
+
+from grimoire.core.utils.offline import OfflineWorld, serve_world
+from grimoire.core.utils.overlay import OverlayEditor, WorldOverlay
+from grimoire.core.utils.synthetic import synthetic_world_slice
+
+# The setup shared by the scripts that run against synthetic worlds served offline
+# instead of a Minecraft server, so they all build the same worlds from the same seed
+
+SEED = 0x4473
+STYLE = "hilly"  # flat, hilly, river, forested or mountainous
+
+
+# a size by size synthetic world with its corner at the origin
+def synthetic_world(size: int, style: str = STYLE, seed: int = SEED) -> WorldSlice:
+    return synthetic_world_slice(Rect((0, 0), (size, size)), style, seed)
+
+
+# serves world for as long as the block runs, with a buffering and caching editor
+# connected to it. With overlay the editor writes through an overlay of the world,
+# its world slice then being the one kept up to date
+@contextmanager
+def offline_editor(world: OfflineWorld, overlay: bool = False) -> Iterator[Editor]:
+    with serve_world(world) as server:
+        if overlay:
+            editor = OverlayEditor(host=server.host, buffering=True, caching=True)
+            editor.overlay = WorldOverlay(world.world_slice)
+        else:
+            editor = Editor(host=server.host, buffering=True, caching=True)
+
+        yield editor
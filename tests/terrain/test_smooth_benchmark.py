@@ -0,0 +1,41 @@
+# Allows code to be run in root directory
+import sys
+
+sys.path[0] = sys.path[0].removesuffix("\\tests\\terrain")
+
+# Actual file
+import time
+
+from grimoire.terrain.smooth import average_neighbour_height, average_neighbour_heights
+from tests.synthetic_worlds import synthetic_world
+
+# How many columns a second smoothing gets through, all at once and one column at a
+# time, and whether the two agree, over steep worlds where the neighbours differ most
+
+STYLE = "mountainous"
+SIZES = [64, 128, 256, 512, 1024]
+PER_COLUMN_LIMIT = 20000  # columns smoothed one at a time, it gets slow
+
+
+for size in SIZES:
+    world_slice = synthetic_world(size, STYLE)
+    columns = [(x, z) for x in range(size) for z in range(size)]
+
+    start_time = time.perf_counter()
+    heights = average_neighbour_heights(
+        columns, world_slice.heightmaps["MOTION_BLOCKING_NO_LEAVES"]
+    )
+    together = len(columns) / (time.perf_counter() - start_time)
+
+    sample = columns[:: max(len(columns) // PER_COLUMN_LIMIT, 1)]
+    start_time = time.perf_counter()
+    differences = sum(
+        average_neighbour_height(x, z, world_slice) != heights[x, z] for x, z in sample
+    )
+    one_by_one = len(sample) / (time.perf_counter() - start_time)
+
+    print(
+        f"{STYLE} {size}x{size}: {together:,.0f} columns/s together, "
+        f"{one_by_one:,.0f} columns/s one by one, "
+        f"{differences} of {len(sample)} sampled columns differ"
+    )
@@ -0,0 +1,56 @@
+# Allows code to be run in root directory
+import sys
+
+sys.path[0] = sys.path[0].removesuffix("\\tests\\terrain")
+
+# Actual file
+from grimoire.core.maps import Map
+from grimoire.core.utils.offline import OfflineWorld
+from grimoire.districts.generate_districts import generate_districts
+from grimoire.terrain.plateau import plateau
+from grimoire.terrain.smooth_edges import smooth_edges
+from grimoire.terrain.terraform import plan_terraform, terraform
+from tests.synthetic_worlds import SEED, offline_editor, synthetic_world
+
+# Checks the planned terraforming leaves the heights plateau then smooth_edges
+# would, with every other district urban, and how many requests each way takes
+
+SIZE = 256
+
+
+def run(planned: bool):
+    world = OfflineWorld(synthetic_world(SIZE))
+    build_rect = world.world_slice.rect
+
+    with offline_editor(world, overlay=True) as editor:
+        world_slice = editor.overlay.world_slice
+
+        main_map = Map(world_slice)
+        districts, district_map, _, _ = generate_districts(
+            SEED, build_rect, world_slice, main_map
+        )
+        for district in districts[::2]:
+            district.is_urban = True
+
+        heightmap = world_slice.heightmaps["MOTION_BLOCKING_NO_LEAVES"]
+        plan = plan_terraform(heightmap, districts, main_map.water)
+
+        if planned:
+            terraform(build_rect, districts, world_slice, editor, main_map.water)
+        else:
+            for district in districts[::2]:
+                plateau(district, district_map, world_slice, editor, main_map.water)
+            smooth_edges(
+                build_rect, districts, district_map, world_slice, editor, main_map.water
+            )
+        editor.flushBuffer()
+
+    return plan, heightmap.copy(), world.requests.total()
+
+
+plan, step_by_step, step_by_step_requests = run(planned=False)
+_, planned, planned_requests = run(planned=True)
+
+print(f"{(plan != step_by_step).sum()} columns planned differently to step by step")
+print(f"{(plan != planned).sum()} columns terraformed differently to planned")
+print(f"{step_by_step_requests} requests step by step, {planned_requests} planned")
@@ -0,0 +1,48 @@
+# Allows code to be run in root directory
+import sys
+
+sys.path[0] = sys.path[0].removesuffix("\\tests\\terrain")
+
+# Actual file
+import json
+import time
+
+from gdpc.vector_tools import ivec3
+
+from grimoire.core.noise.random import choose_weighted
+from grimoire.core.noise.rng import RNG
+from grimoire.terrain.tree import tree_blocks
+from tests.synthetic_worlds import SEED
+
+# Stamps the same forest twice from one seed, checking it comes out the same both
+# times and differently from another seed, and how many trees a second it gets through
+
+FOREST = "grimoire/asset_data/forests/mixed_forest.json"
+TREES = 2000
+SPACING = 8  # blocks between trees, they're planted on a grid
+
+
+def stamp_forest(seed: int) -> dict[tuple[int, int, int], str]:
+    with open(FOREST) as file:
+        forest = json.load(file)
+
+    rng = RNG(seed)
+    blocks: dict[tuple[int, int, int], str] = {}
+
+    for tree in range(TREES):
+        point = ivec3(tree % 50 * SPACING, 64, tree // 50 * SPACING)
+        tree_type = choose_weighted(rng.value(), forest["tree_dict"])
+        blocks.update(
+            tree_blocks(tree_type, point, forest["tree_palette"][tree_type], rng)
+        )
+
+    return blocks
+
+
+start_time = time.perf_counter()
+first = stamp_forest(SEED)
+trees_per_second = TREES / (time.perf_counter() - start_time)
+
+print(f"{TREES} trees, {len(first)} blocks, {trees_per_second:,.0f} trees/s")
+print(f"same forest from the same seed: {first == stamp_forest(SEED)}")
+print(f"different forest from another seed: {first != stamp_forest(SEED + 1)}")